@@ -4,90 +4,115 @@ FastAPI Dependencies
 Provides dependency injection for services and utilities.
 """
 
-from functools import lru_cache
-from fastapi import Depends, HTTPException
-from typing import Optional
+from typing import TYPE_CHECKING
 
-from app.services.agent_service import SchedulingAgent
-from app.services.google_service import GoogleService
+from fastapi import FastAPI, HTTPException, Request
+
+from app.config import config as _SETTINGS
+from app.services import create_google_service, create_scheduling_agent
 from app.core.logging import get_logger
-from app.core.exceptions import AgentException, GoogleServiceException
+
+if TYPE_CHECKING:
+    from app.services.agent_service import SchedulingAgent
+    from app.services.google_service import GoogleService
 
 logger = get_logger(__name__)
 
-# Global service instances
-_agent_service: Optional[SchedulingAgent] = None
-_google_service: Optional[GoogleService] = None
+
+def init_services(app: FastAPI) -> None:
+    """
+    Create the shared service instances and store them on app.state
+    
+    Called once from the application lifespan. Initialization errors are
+    recorded instead of raised so the API still starts and the failing
+    dependency can report the error per request.
+    
+    Args:
+        app: FastAPI application instance
+    """
+    app.state.google_service = None
+    app.state.google_service_error = None
+    app.state.agent_service = None
+    app.state.agent_service_error = None
+    
+    try:
+        logger.info("Initializing Google Service...")
+        app.state.google_service = create_google_service()
+        logger.info("Google Service initialized successfully")
+    except Exception as e:
+        logger.error(f"Failed to initialize Google Service: {str(e)}")
+        app.state.google_service_error = str(e)
+    
+    try:
+        logger.info("Initializing SchedulAI Agent...")
+        app.state.agent_service = create_scheduling_agent()
+        logger.info("SchedulAI Agent initialized successfully")
+    except Exception as e:
+        logger.error(f"Failed to initialize SchedulAI Agent: {str(e)}")
+        app.state.agent_service_error = str(e)
 
 
-def get_agent_service() -> SchedulingAgent:
+async def get_agent_service(request: Request) -> "SchedulingAgent":
     """
-    Dependency to get or create the scheduling agent service
+    Dependency to get the scheduling agent service
     
     Returns:
         SchedulingAgent instance
         
     Raises:
-        HTTPException: If agent initialization fails
+        HTTPException: If agent initialization failed at startup
     """
-    global _agent_service
+    agent_service = getattr(request.app.state, "agent_service", None)
+    if agent_service is None:
+        error = getattr(request.app.state, "agent_service_error", None) or "service not initialized"
+        raise HTTPException(
+            status_code=500,
+            detail=f"Agent initialization failed: {error}"
+        )
     
-    if _agent_service is None:
-        try:
-            logger.info("Initializing SchedulAI Agent...")
-            _agent_service = SchedulingAgent()
-            logger.info("SchedulAI Agent initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize SchedulAI Agent: {str(e)}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Agent initialization failed: {str(e)}"
-            )
-    
-    return _agent_service
+    return agent_service
 
 
-def get_google_service() -> GoogleService:
+async def get_google_service(request: Request) -> "GoogleService":
     """
-    Dependency to get or create the Google service
+    Dependency to get the Google service
     
     Returns:
         GoogleService instance
         
     Raises:
-        HTTPException: If Google service initialization fails
+        HTTPException: If Google service initialization failed at startup
     """
-    global _google_service
-    
-    if _google_service is None:
-        try:
-            logger.info("Initializing Google Service...")
-            _google_service = GoogleService()
-            logger.info("Google Service initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize Google Service: {str(e)}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Google service initialization failed: {str(e)}"
-            )
+    google_service = getattr(request.app.state, "google_service", None)
+    if google_service is None:
+        error = getattr(request.app.state, "google_service_error", None) or "service not initialized"
+        raise HTTPException(
+            status_code=500,
+            detail=f"Google service initialization failed: {error}"
+        )
     
-    return _google_service
+    return google_service
 
 
-@lru_cache()
-def get_settings():
+async def get_settings():
     """
     Dependency to get application settings
     
     Returns:
         Configuration settings
     """
-    from app.config import config
-    return config
+    return _SETTINGS
 
 
-def reset_services():
-    """Reset service instances (useful for testing)"""
-    global _agent_service, _google_service
-    _agent_service = None
-    _google_service = None 
\ No newline at end of file
+def reset_services(app: FastAPI) -> None:
+    """Reset service instances, stopping their worker threads (useful for testing)"""
+    for name in ("agent_service", "google_service"):
+        service = getattr(app.state, name, None)
+        if service is not None:
+            service.close()
+    
+    app.state.agent_service = None
+    app.state.google_service = None
+    # Drop the shared instances so the next init_services builds fresh ones
+    create_scheduling_agent.cache_clear()
+    create_google_service.cache_clear()
@@ -4,16 +4,30 @@ FastAPI Middleware Configuration
 Contains middleware setup for the application.
 """
 
+import logging
 import time
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from app.config import config
 from app.core.logging import get_logger
 from app.core.exceptions import ScheduleAIException
 
 logger = get_logger(__name__)
 
+# Methods whose request body is worth logging in debug mode
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Explicit CORS allowlists (the API only exposes these methods)
+_CORS_METHODS = ["GET", "POST", "DELETE"]
+_CORS_HEADERS = ["Authorization", "Content-Type", "If-None-Match"]
+_CORS_EXPOSE_HEADERS = ["ETag"]
+_CORS_MAX_AGE = 86400  # Let browsers cache preflight responses for a day
+
+# Requests slower than this (seconds) or failing with 4xx/5xx are logged at INFO; the rest at DEBUG
+_SLOW_REQUEST_SECONDS = 1.0
+
 
 def setup_middleware(app: FastAPI) -> None:
     """
@@ -26,35 +40,41 @@ def setup_middleware(app: FastAPI) -> None:
     # CORS middleware
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],  # In production, specify allowed origins
+        allow_origins=config.ALLOWED_ORIGINS,  # already stripped by config
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=_CORS_METHODS,
+        allow_headers=_CORS_HEADERS,
+        expose_headers=_CORS_EXPOSE_HEADERS,
+        max_age=_CORS_MAX_AGE,
     )
     
     # Request logging middleware
+    # Resolved once at startup so the per-request path only reads a local bool
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
-        start_time = time.time()
-        
-        logger.info(f"{request.method} {request.url.path} - Started")
+        start_time = time.perf_counter()
         
         # Log request details for debugging
-        if logger.isEnabledFor(10):  # DEBUG level
-            logger.debug(f"Request headers: {dict(request.headers)}")
-            if request.method in ["POST", "PUT", "PATCH"]:
+        if debug_enabled:
+            logger.debug("%s %s - Started", request.method, request.url.path)
+            logger.debug("Request headers: %r", request.headers)
+            if request.method in _BODY_METHODS:
                 body = await request.body()
                 if body:
-                    logger.debug(f"Request body: {body.decode()}")
+                    logger.debug("Request body: %r", body)
         
         response = await call_next(request)
         
-        process_time = time.time() - start_time
-        logger.info(
-            f"{request.method} {request.url.path} - "
-            f"Status: {response.status_code} - "
-            f"Time: {process_time:.3f}s"
-        )
+        process_time = time.perf_counter() - start_time
+        notable = process_time >= _SLOW_REQUEST_SECONDS or response.status_code >= 400
+        if notable or debug_enabled:
+            logger.log(
+                logging.INFO if notable else logging.DEBUG,
+                "%s %s - Status: %d - Time: %.3fs",
+                request.method, request.url.path, response.status_code, process_time
+            )
         
         return response
     
@@ -10,17 +10,168 @@ Enhanced calendar endpoints with multi-user authentication support:
 Supports both legacy single-user and new multi-user authentication.
 """
 
-from datetime import datetime, timedelta
-from typing import Optional, List
+import asyncio
+import hashlib
+import os
+import pickle
+import re
+import threading
+from datetime import datetime, time, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from google.auth.transport.requests import Request as AuthRequest
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import build, Resource
 
 from app.api.dependencies import get_agent_service, get_google_service
+from app.config import config
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Parsed credentials and oauth2 client for /current-user, keyed on token file mtime.
+# Loaded and refreshed in worker threads, hence the lock.
+_cred_cache: Optional[Tuple[float, Credentials, Resource]] = None
+_cred_cache_lock = threading.Lock()
+
+# Resolved Google user info, keyed on (token file, mtime)
+_user_info_cache: TTLCache = TTLCache(maxsize=16, ttl=300)
+
+# End of day used for /upcoming's inclusive upper bound
+_EOD_TIME = time(23, 59, 59)
+
+# Clients may reuse a cached list/calendar response for this long before revalidating via ETag
+_CACHE_CONTROL = "private, max-age=30"
+
+# Tokens of a comma/whitespace-separated email list
+_EMAIL_LIST_RE = re.compile(r"[^\s,]+")
+
+# Google Calendar error substrings -> (HTTP status, detail template), checked in order
+_CALENDAR_ERROR_TABLE = (
+    (
+        ('forbidden', 'access denied', '403'),
+        status.HTTP_403_FORBIDDEN,
+        "Access denied to calendar for user '{user}'. The user may not be authenticated or you may not have permission to access their calendar."
+    ),
+    (
+        ('not found', '404'),
+        status.HTTP_404_NOT_FOUND,
+        "Calendar not found for user '{user}'. The user may not exist or their calendar may not be accessible."
+    ),
+    (
+        ('unauthorized', '401'),
+        status.HTTP_401_UNAUTHORIZED,
+        "Unauthorized access to calendar for user '{user}'. Authentication may have expired."
+    ),
+)
+
+
+def _is_json_token(token_file: str) -> bool:
+    """Whether a token file uses the JSON authorized-user format instead of pickle"""
+    return token_file.endswith('.json')
+
+
+def _load_oauth2_service(token_file: str) -> Tuple[float, Credentials, Resource]:
+    """
+    Get cached credentials and oauth2 service, reloading only when the token file changes
+    
+    Raises:
+        FileNotFoundError: If the token file does not exist
+    """
+    global _cred_cache
+    
+    with _cred_cache_lock:
+        mtime = os.stat(token_file).st_mtime
+        if _cred_cache is None or _cred_cache[0] != mtime:
+            with open(token_file, 'rb') as token:
+                data = token.read()
+            if _is_json_token(token_file):
+                credentials = Credentials.from_authorized_user_info(orjson.loads(data))
+            else:
+                credentials = pickle.loads(data)
+            service = build('oauth2', 'v2', credentials=credentials)
+            _cred_cache = (mtime, credentials, service)
+        
+        return _cred_cache
+
+
+def _refresh_token_file(token_file: str, credentials: Credentials) -> float:
+    """
+    Refresh expired credentials and atomically rewrite the token file
+    
+    Returns:
+        The token file's new mtime
+    """
+    global _cred_cache
+    
+    credentials.refresh(AuthRequest())
+    
+    if _is_json_token(token_file):
+        data = credentials.to_json().encode()
+    else:
+        data = pickle.dumps(credentials)
+    
+    tmp_file = f"{token_file}.tmp"
+    with open(tmp_file, 'wb') as token:
+        token.write(data)
+    os.replace(tmp_file, token_file)
+    
+    # The in-memory credentials are already current, so don't reload them on the next request
+    mtime = os.stat(token_file).st_mtime
+    with _cred_cache_lock:
+        if _cred_cache is not None and _cred_cache[1] is credentials:
+            _cred_cache = (mtime, credentials, _cred_cache[2])
+    
+    return mtime
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header already names this ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as required for If-None-Match
+    return etag.removeprefix("W/") in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def _not_modified(etag: str) -> Response:
+    """Build a 304 response carrying the cache validators"""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    )
+
+
+def _format_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a Google Calendar event into the /upcoming meeting shape"""
+    start = event['start']
+    end = event['end']
+    return {
+        "summary": event.get('summary', 'No Title'),
+        "start_time": start.get('dateTime', start.get('date')),
+        "end_time": end.get('dateTime', end.get('date')),
+        "attendees": len(event.get('attendees', [])),
+        "location": event.get('location', ''),
+        "description": event.get('description', '')
+    }
+
+
+async def _stream_upcoming(meetings: List[Dict[str, Any]], summary: Dict[str, Any]) -> AsyncIterator[bytes]:
+    """Encode the /upcoming payload as a chunked JSON object, one meeting at a time"""
+    yield b'{"meetings":['
+    for i, meeting in enumerate(meetings):
+        chunk = orjson.dumps(meeting)
+        yield b',' + chunk if i else chunk
+    # Splice the summary object's fields in after the meetings array
+    yield b'],' + orjson.dumps(summary)[1:]
+
 
 @router.get("/current-user")
 async def get_current_user():
@@ -31,25 +182,26 @@ async def get_current_user():
     For legacy system, returns the single authenticated user.
     """
     try:
-        from googleapiclient.discovery import build
-        from google.oauth2.credentials import Credentials
-        import pickle
-        import os
-        
-        # Load credentials from token file
-        token_file = "token.pickle"
-        if not os.path.exists(token_file):
+        # Load credentials from token file (cached until the file changes)
+        token_file = config.GOOGLE_TOKEN_FILE
+        try:
+            mtime, credentials, service = await asyncio.to_thread(_load_oauth2_service, token_file)
+        except FileNotFoundError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="No credentials found. Please run authentication first."
             )
         
-        with open(token_file, 'rb') as token:
-            credentials = pickle.load(token)
+        # Refresh once and persist, rather than on every request after expiry
+        if credentials.expired and credentials.refresh_token:
+            mtime = await asyncio.to_thread(_refresh_token_file, token_file, credentials)
         
-        # Get user info from Google
-        service = build('oauth2', 'v2', credentials=credentials)
-        user_info = service.userinfo().get().execute()
+        # Get user info from Google (memoized briefly, fetched off the event loop)
+        cache_key = (token_file, mtime)
+        user_info = _user_info_cache.get(cache_key)
+        if user_info is None:
+            user_info = await asyncio.to_thread(service.userinfo().get().execute)
+            _user_info_cache[cache_key] = user_info
         
         email = user_info.get('email', '')
         name = user_info.get('name', '')
@@ -77,22 +229,32 @@ async def get_current_user():
 
 
 @router.get("/authenticated-users")
-async def get_authenticated_users(google_service = Depends(get_google_service)):
+async def get_authenticated_users(request: Request, google_service = Depends(get_google_service)):
     """
     Get list of all authenticated users
     
     Returns all users who have valid Google API credentials.
+    Supports conditional requests via ETag / If-None-Match.
     """
     try:
         authenticated_users = google_service.get_authenticated_users()
         current_user = google_service.get_authenticated_email()
         
-        return {
+        body = orjson.dumps({
             "authenticated_users": authenticated_users,
             "current_user": current_user,
             "total_count": len(authenticated_users),
             "note": "All these users' calendars can be accessed"
-        }
+        })
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        if _etag_matches(request, etag):
+            return _not_modified(etag)
+        
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+        )
         
     except Exception as e:
         logger.error(f"Error getting authenticated users: {str(e)}")
@@ -186,8 +348,9 @@ async def remove_authenticated_user(email: str, google_service = Depends(get_goo
 
 @router.get("/upcoming")
 async def get_upcoming_meetings(
+    request: Request,
     user_email: Optional[str] = None,  # Optional: specify which authenticated user's calendar to access
-    days_ahead: int = 7,
+    days_ahead: int = Query(7, ge=1, le=30),
     agent = Depends(get_agent_service)
 ):
     """
@@ -200,15 +363,13 @@ async def get_upcoming_meetings(
     **Access Control:**
     - If user_email is provided, that user must be authenticated
     - If user_email is not provided, uses the first available authenticated user
+    
+    **Caching:**
+    - Responses carry a weak ETag derived from Google's event-list ETag; send it back
+      in If-None-Match to get 304 Not Modified while the calendar is unchanged
     """
     
     try:
-        if days_ahead < 1 or days_ahead > 30:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="days_ahead must be between 1 and 30"
-            )
-        
         # BYPASS AUTH: Direct token loading from Keys directory
         # Comment out authentication checks for direct token access
         """
@@ -240,10 +401,12 @@ async def get_upcoming_meetings(
         logger.info(f"Fetching upcoming meetings for user (direct token): {target_user}")
         
         start_date = datetime.now()
-        end_date = start_date.replace(hour=23, minute=59, second=59) + timedelta(days=days_ahead)
+        end_date = datetime.combine(start_date.date(), _EOD_TIME) + timedelta(days=days_ahead)
         
         # BYPASS AUTH: Get calendar service directly using token
-        calendar_service = agent.google_service.get_direct_calendar_service(target_user)
+        calendar_service = await asyncio.to_thread(
+            agent.google_service.get_direct_calendar_service, target_user
+        )
         if not calendar_service:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -254,67 +417,57 @@ async def get_upcoming_meetings(
         try:
             # events = agent.google_service.get_calendar_events(start_date, end_date, target_user)
             # DIRECT API CALL: Bypass agent service and call Google API directly
-            events_result = calendar_service.events().list(
+            events_request = calendar_service.events().list(
                 calendarId='primary',
                 timeMin=start_date.isoformat() + 'Z',
                 timeMax=end_date.isoformat() + 'Z',
                 singleEvents=True,
                 orderBy='startTime'
-            ).execute()
+            )
+            events_result = await asyncio.to_thread(events_request.execute)
             
             events = events_result.get('items', [])
             
-            # Convert to our format
-            formatted_events = []
-            for event in events:
-                start_time = event['start'].get('dateTime', event['start'].get('date'))
-                end_time = event['end'].get('dateTime', event['end'].get('date'))
-                
-                formatted_events.append({
-                    "summary": event.get('summary', 'No Title'),
-                    "start_time": start_time,
-                    "end_time": end_time,
-                    "attendees": len(event.get('attendees', [])),
-                    "location": event.get('location', ''),
-                    "description": event.get('description', '')
-                })
-                
-            logger.info(f"BYPASS AUTH: Retrieved {len(formatted_events)} events for {target_user}")
+            logger.info(f"BYPASS AUTH: Retrieved {len(events)} events for {target_user}")
+            
+            # Google's list ETag changes whenever the events in the window change. The
+            # response is only semantically equal (date_range moves with the clock), hence weak.
+            google_etag = events_result.get('etag')
+            etag = None
+            if google_etag:
+                validator = f"{target_user}|{days_ahead}|{google_etag}".encode()
+                etag = f'W/"{hashlib.blake2b(validator, digest_size=8).hexdigest()}"'
+                if _etag_matches(request, etag):
+                    return _not_modified(etag)
             
         except Exception as e:
-            # Check if it's a Google API error indicating access denied
+            # Map Google API errors to a matching HTTP status (first match wins)
             error_str = str(e).lower()
-            if 'forbidden' in error_str or 'access denied' in error_str or '403' in str(e):
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Access denied to calendar for user '{target_user}'. The user may not be authenticated or you may not have permission to access their calendar."
-                )
-            elif 'not found' in error_str or '404' in str(e):
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Calendar not found for user '{target_user}'. The user may not exist or their calendar may not be accessible."
-                )
-            elif 'unauthorized' in error_str or '401' in str(e):
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail=f"Unauthorized access to calendar for user '{target_user}'. Authentication may have expired."
-                )
-            else:
-                # Generic error
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to fetch calendar for user '{target_user}': {str(e)}"
-                )
+            for tokens, status_code, message in _CALENDAR_ERROR_TABLE:
+                if any(token in error_str for token in tokens):
+                    raise HTTPException(
+                        status_code=status_code,
+                        detail=message.format(user=target_user)
+                    )
+            
+            # Generic error
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to fetch calendar for user '{target_user}': {str(e)}"
+            )
         
-        # Return the formatted events (no need for additional processing)
-        return {
-            "meetings": formatted_events,
-            "total_count": len(formatted_events),
+        # Format up front so a malformed event still reaches the error handler below;
+        # once streaming starts the 200 status has already been sent
+        meetings = [_format_event(event) for event in events]
+        
+        # Stream the encoded meetings; everything after "meetings" is encoded once at the end
+        summary = {
+            "total_count": len(events),
             "queried_user": target_user,
             "bypass_auth": True,  # Direct token access
             "date_range": {
-                "start": start_date.isoformat(),
-                "end": end_date.isoformat(),
+                "start": start_date,
+                "end": end_date,
                 "days": days_ahead
             },
             "access_control": {
@@ -323,6 +476,11 @@ async def get_upcoming_meetings(
                 "direct_token_access": True
             }
         }
+        return StreamingResponse(
+            _stream_upcoming(meetings, summary),
+            media_type="application/json",
+            headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL} if etag else None
+        )
         
     except Exception as e:
         if isinstance(e, HTTPException):
@@ -336,9 +494,9 @@ async def get_upcoming_meetings(
 
 @router.get("/availability")
 async def get_calendar_availability(
-    participant_emails: str,  # Comma-separated emails
-    days_ahead: int = 7,
-    duration_minutes: int = 30,
+    participant_emails: str = Query(..., pattern=r"[^\s,]"),  # Comma-separated emails
+    days_ahead: int = Query(7, ge=1, le=30),
+    duration_minutes: int = Query(30, ge=15, le=480),
     agent = Depends(get_agent_service)
 ):
     """
@@ -356,31 +514,14 @@ async def get_calendar_availability(
     """
     
     try:
-        if days_ahead < 1 or days_ahead > 30:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="days_ahead must be between 1 and 30"
-            )
-        
-        if duration_minutes < 15 or duration_minutes > 480:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="duration_minutes must be between 15 and 480"
-            )
-        
-        # Parse participant emails
-        emails = [email.strip() for email in participant_emails.split(",") if email.strip()]
-        if not emails:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="At least one participant email is required"
-            )
+        # Parse participant emails (deduplicated, order preserved)
+        emails = list(dict.fromkeys(_EMAIL_LIST_RE.findall(participant_emails)))
         
         logger.info(f"Checking availability for {len(emails)} participants: {emails}")
         
         # Get access control information
         authenticated_users = agent.google_service.get_authenticated_users()
-        access_report = agent.google_service.auth_manager.validate_access(emails)
+        access_report = await asyncio.to_thread(agent.google_service.validate_access, emails)
         
         logger.info(f"Access control - Accessible: {access_report['accessible_users']}, Denied: {access_report['denied_users']}")
         
@@ -389,7 +530,8 @@ async def get_calendar_availability(
         end_date = start_date + timedelta(days=days_ahead)
         
         # Get availability data directly from Google Calendar with multi-user support
-        availability_result = agent._get_calendar_availability(
+        availability_result = await asyncio.to_thread(
+            agent._get_calendar_availability,
             emails, 
             start_date.isoformat(), 
             end_date.isoformat(), 
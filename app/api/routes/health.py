@@ -4,7 +4,7 @@ Health check routes
 Contains endpoints for monitoring application health and status.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from datetime import datetime
 
 from app.api.dependencies import get_agent_service, get_google_service, get_settings
@@ -69,7 +69,7 @@ async def health_check(
         if not all_healthy:
             logger.warning(f"Some services are unhealthy: Google={google_status}, vLLM={vllm_status}")
         
-        return HealthResponse(
+        health = HealthResponse(
             status=health_status,
             services={
                 "google_calendar": google_status.get('calendar', False),
@@ -87,9 +87,12 @@ async def health_check(
         
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
-        return HealthResponse(
+        health = HealthResponse(
             status="unhealthy",
             services={},
             error=str(e),
             timestamp=datetime.now().isoformat()
-        ) 
\ No newline at end of file
+        )
+    
+    # Serialize straight to JSON bytes instead of FastAPI's re-validate + encode pass
+    return Response(health.model_dump_json(), media_type="application/json") 
\ No newline at end of file
@@ -5,44 +5,108 @@ Contains endpoints for scheduling, managing, and confirming meetings.
 Supports both new JSON schema format and legacy format for backward compatibility.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status
-from typing import Dict, Any, Union
+from fastapi import APIRouter, HTTPException, Depends, Query, Response, status
+from fastapi.responses import ORJSONResponse
+from typing import Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
+import asyncio
 import re
 
+import orjson
+from cachetools import TTLCache
+
 from app.api.dependencies import get_agent_service
+from app.config import config
 from app.models import (
     ScheduleMeetingRequest, LegacyScheduleMeetingRequest, ProcessedMeetingInput, 
     MeetingOutputEvent, AttendeeModel, CalendarEventModel, AttendeeCalendarModel,
-    MeetingRequest, MeetingPriority, Participant, UserPreferences
+    MeetingRequest, MeetingPriority, Participant
+)
+from app.models.api import (
+    ATTENDEE_LIST_ADAPTER, PROPOSAL_RESPONSE_LIST_ADAPTER, MeetingProposalResponse, ProposalStatusResponse
 )
-from app.models.api import MeetingProposalResponse, ProposalStatusResponse
 from app.core.logging import get_logger
+from app.utils import parse_request_datetime
 from app.core.exceptions import AgentException
 
 logger = get_logger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Email-content patterns, compiled once
+_DURATION_RE = re.compile(r'(\d+)\s*min', re.IGNORECASE)
+# Duration and weekday in one alternation so the email body is scanned once
+_DURATION_OR_WEEKDAY_RE = re.compile(
+    r'(?P<dur>\d+)\s*min|(?P<day>monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
+    re.IGNORECASE
+)
+
+# Output timestamp format (all output times are IST)
+_IST_FORMAT = "%Y-%m-%dT%H:%M:%S+05:30"
+
+# Weekday name -> datetime.weekday() index
+_WEEKDAY_INDEX = {
+    day: i for i, day in enumerate(
+        ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+    )
+}
+
+# Serialized /agent-tools payload, keyed on the agent's tools list so a
+# re-initialized agent (or reassigned tools) rebuilds it
+_tools_cache: Optional[Tuple[List[Dict[str, Any]], bytes]] = None
+
+# Read-only fallback for omitted optional dicts; never mutate
+_EMPTY: Dict[str, Any] = {}
+
+# Serialization exclude for /proposal?include_formatted=false
+_SLOT_FORMATTED_EXCLUDE = {"suggested_slots": {"__all__": {"formatted"}}}
+
+# Serialized /proposal bodies keyed on (proposal_id, include_formatted). Each
+# entry records the creation time and status it was built from, so a status
+# change (e.g. confirmation) or a replaced proposal rebuilds it. Entries hold no
+# proposal references and expire together with the agent's proposals.
+_PROPOSAL_RESPONSE_CACHE_SIZE = 1024
+_proposal_response_cache: TTLCache = TTLCache(
+    maxsize=_PROPOSAL_RESPONSE_CACHE_SIZE, ttl=config.PROPOSAL_TTL_SECONDS
+)
+
+# Constant part of the output metadata; shared across responses, never mutate
+_WORKFLOW_STAGES = {
+    "input_received": True,
+    "input_processed": True,
+    "calendar_checked": True,
+    "vllm_analysis_completed": True,
+    "slots_generated": True,
+    "optimal_slot_selected": True,
+    "output_created": True
+}
 
 
 def convert_new_to_legacy_format(request: ScheduleMeetingRequest) -> LegacyScheduleMeetingRequest:
     """Convert new JSON schema format to legacy format for processing"""
     
     # Extract duration from EmailContent using regex
-    duration_match = re.search(r'(\d+)\s*min', request.EmailContent, re.IGNORECASE)
+    duration_match = _DURATION_RE.search(request.EmailContent)
     duration_minutes = int(duration_match.group(1)) if duration_match else 30
     
     # Convert attendees to participants format
-    participants = []
-    for attendee in request.Attendees:
-        # Handle both dict and object formats
-        email = attendee.get('email') if isinstance(attendee, dict) else getattr(attendee, 'email', None)
-        if email and email != request.From:  # Don't include organizer in participants
-            participants.append({"email": email, "name": email.split('@')[0]})
+    organizer_email = request.From
+    attendees = request.Attendees
+    # Handle both dict and object formats; the list is homogeneous, so check once
+    if attendees and isinstance(attendees[0], dict):
+        get_email = lambda a: a.get('email')
+    else:
+        get_email = lambda a: getattr(a, 'email', None)
+    # Don't include organizer in participants
+    participants = [
+        {"email": email, "name": email.partition('@')[0]}
+        for attendee in attendees
+        if (email := get_email(attendee)) and email != organizer_email
+    ]
     
     # Create organizer object
     organizer = {
-        "email": request.From,
-        "name": request.From.split('@')[0],
+        "email": organizer_email,
+        "name": organizer_email.partition('@')[0],
         "role": "organizer"
     }
     
@@ -64,27 +128,26 @@ def process_input_to_processed_format(request: ScheduleMeetingRequest) -> Proces
     # Parse the datetime and create date range
     try:
         # Parse the input datetime format (09-07-2025T12:34:55)
-        request_dt = datetime.strptime(request.Datetime, "%d-%m-%YT%H:%M:%S")
-        
-        # Extract duration from EmailContent using regex
-        duration_match = re.search(r'(\d+)\s*min', request.EmailContent, re.IGNORECASE)
-        duration_mins = duration_match.group(1) if duration_match else "30"
-        
-        # Find preferred day from email content
-        preferred_day_match = re.search(r'(monday|tuesday|wednesday|thursday|friday|saturday|sunday)', 
-                                       request.EmailContent, re.IGNORECASE)
-        
-        if preferred_day_match:
-            preferred_day = preferred_day_match.group(1).lower()
+        request_dt = parse_request_datetime(request.Datetime)
+        
+        # Extract duration and preferred day from EmailContent in a single pass,
+        # keeping the first occurrence of each
+        duration_mins = preferred_day = None
+        for match in _DURATION_OR_WEEKDAY_RE.finditer(request.EmailContent):
+            if match.lastgroup == 'dur':
+                if duration_mins is None:
+                    duration_mins = match.group('dur')
+            elif preferred_day is None:
+                preferred_day = match.group('day').lower()
+            if duration_mins is not None and preferred_day is not None:
+                break
+        if duration_mins is None:
+            duration_mins = "30"
+        
+        if preferred_day:
             # Calculate next occurrence of that day
-            days_ahead = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-            target_day_index = days_ahead.index(preferred_day)
-            current_day_index = request_dt.weekday()
-            
-            days_until_target = (target_day_index - current_day_index) % 7
-            if days_until_target == 0:  # Same day
-                days_until_target = 7  # Next week
-                
+            # Same weekday as the request rolls over to next week
+            days_until_target = (_WEEKDAY_INDEX[preferred_day] - request_dt.weekday()) % 7 or 7
             target_date = request_dt + timedelta(days=days_until_target)
         else:
             # Default to next day
@@ -95,18 +158,14 @@ def process_input_to_processed_format(request: ScheduleMeetingRequest) -> Proces
         end_of_day = target_date.replace(hour=23, minute=59, second=59, microsecond=0)
         
         # Format with timezone
-        start_str = start_of_day.strftime("%Y-%m-%dT%H:%M:%S+05:30")
-        end_str = end_of_day.strftime("%Y-%m-%dT%H:%M:%S+05:30")
-        
-        # Convert request.Attendees to proper format
-        attendees_list = []
-        for attendee in request.Attendees:
-            if isinstance(attendee, dict):
-                attendees_list.append(AttendeeModel(email=attendee['email']))
-            else:
-                attendees_list.append(attendee)
+        start_str = start_of_day.strftime(_IST_FORMAT)
+        end_str = end_of_day.strftime(_IST_FORMAT)
         
-        return ProcessedMeetingInput(
+        # Convert request.Attendees to proper format in one pass; models pass
+        # through as-is, raw dicts are validated into AttendeeModel
+        attendees_list = ATTENDEE_LIST_ADAPTER.validate_python(request.Attendees)
+        
+        processed_fields = dict(
             Request_id=request.Request_id,
             Datetime=request.Datetime,
             Location=request.Location or "Virtual Meeting",
@@ -118,6 +177,11 @@ def process_input_to_processed_format(request: ScheduleMeetingRequest) -> Proces
             End=end_str,
             Duration_mins=duration_mins
         )
+        # Every value comes from the validated request or is generated above;
+        # only the request's optional Request_id/Subject still need the str check
+        if request.Request_id is None or request.Subject is None:
+            return ProcessedMeetingInput(**processed_fields)
+        return ProcessedMeetingInput.from_trusted(**processed_fields)
         
     except Exception as e:
         logger.error(f"Error processing input to processed format: {str(e)}")
@@ -150,94 +214,108 @@ def create_output_event(processed_input: ProcessedMeetingInput,
                        processing_metadata: Dict[str, Any] = None) -> MeetingOutputEvent:
     """Create output event format (step 3) - matches exactly with 3_Output_Event.json"""
     
+    # Format the invariant timestamps once instead of per attendee
+    start_str = suggested_start.strftime(_IST_FORMAT)
+    end_str = suggested_end.strftime(_IST_FORMAT)
+    
     # Create attendee calendar models with realistic calendar data
+    attendees = processed_input.Attendees
     attendee_calendars = []
-    all_attendee_emails = [att.email for att in processed_input.Attendees]
+    all_attendee_emails = [att.email for att in attendees]
     all_attendee_emails.append(processed_input.From)  # Include organizer
+    num_attendees = len(all_attendee_emails)
     
-    for attendee in processed_input.Attendees + [AttendeeModel(email=processed_input.From)]:
-        events = []
-        
-        # Add mock existing events first (before new meeting) for specific attendees
-        if attendee.email != processed_input.From:  # Not organizer
-            # Add a mock existing team meeting 30 minutes before new meeting
-            existing_start = suggested_start - timedelta(minutes=30)
-            existing_end = suggested_start
-            team_meet_event = CalendarEventModel(
-                StartTime=existing_start.strftime("%Y-%m-%dT%H:%M:%S+05:30"),
-                EndTime=existing_end.strftime("%Y-%m-%dT%H:%M:%S+05:30"),
-                NumAttendees=3,
-                Attendees=all_attendee_emails,
-                Summary="Team Meet"
-            )
-            events.append(team_meet_event)
-        
-        # Add the new requested meeting event (appears for all attendees)
-        new_meeting_event = CalendarEventModel(
-            StartTime=suggested_start.strftime("%Y-%m-%dT%H:%M:%S+05:30"),
-            EndTime=suggested_end.strftime("%Y-%m-%dT%H:%M:%S+05:30"),
-            NumAttendees=len(all_attendee_emails),
+    # The same events appear on several calendars; build each once and share it
+    # New requested meeting event (appears for all attendees)
+    new_meeting_event = CalendarEventModel.from_trusted(
+        StartTime=start_str,
+        EndTime=end_str,
+        NumAttendees=num_attendees,
+        Attendees=all_attendee_emails,
+        Summary=processed_input.Subject
+    )
+    
+    # Demo "Team Meet"/lunch events can be switched off via config
+    mock_events = config.ENABLE_MOCK_CALENDAR_EVENTS
+    if mock_events:
+        existing_start_str = (suggested_start - timedelta(minutes=30)).strftime(_IST_FORMAT)
+        lunch_start = suggested_end + timedelta(hours=2, minutes=30)  # 2.5 hours after meeting
+        lunch_start_str = lunch_start.strftime(_IST_FORMAT)
+        lunch_end_str = (lunch_start + timedelta(hours=1)).strftime(_IST_FORMAT)
+        
+        # Mock existing team meeting 30 minutes before new meeting (non-organizers)
+        team_meet_event = CalendarEventModel.from_trusted(
+            StartTime=existing_start_str,
+            EndTime=start_str,
+            NumAttendees=3,
             Attendees=all_attendee_emails,
-            Summary=processed_input.Subject
+            Summary="Team Meet"
         )
-        events.append(new_meeting_event)
+        # Lunch meeting specific to userthree
+        lunch_event = CalendarEventModel.from_trusted(
+            StartTime=lunch_start_str,
+            EndTime=lunch_end_str,
+            NumAttendees=1,
+            Attendees=["SELF"],
+            Summary="Lunch with Customers"
+        )
+    
+    organizer_email = processed_input.From
+    for attendee in attendees + [AttendeeModel.model_construct(email=organizer_email)]:
+        email = attendee.email
+        
+        if not mock_events:
+            events = [new_meeting_event]
+        # Mock existing events come first (before new meeting) for non-organizers
+        elif email != organizer_email:  # Not organizer
+            events = [team_meet_event, new_meeting_event]
+        else:
+            events = [new_meeting_event]
         
         # Add specific events for userthree (lunch meeting)
-        if "userthree" in attendee.email:
-            lunch_start = suggested_end + timedelta(hours=2, minutes=30)  # 2.5 hours after meeting
-            lunch_end = lunch_start + timedelta(hours=1)
-            lunch_event = CalendarEventModel(
-                StartTime=lunch_start.strftime("%Y-%m-%dT%H:%M:%S+05:30"),
-                EndTime=lunch_end.strftime("%Y-%m-%dT%H:%M:%S+05:30"),
-                NumAttendees=1,
-                Attendees=["SELF"],
-                Summary="Lunch with Customers"
-            )
+        if mock_events and "userthree" in email:
             events.append(lunch_event)
         
-        attendee_calendar = AttendeeCalendarModel(
-            email=attendee.email,
+        attendee_calendar = AttendeeCalendarModel.model_construct(
+            email=email,
             events=events
         )
         attendee_calendars.append(attendee_calendar)
     
+    # Normalize optional inputs once so every lookup below is a plain .get()
+    pm = processing_metadata or _EMPTY
+    ar = agent_response or _EMPTY
+    
     # Create comprehensive metadata matching the expected structure
     metadata = {
-        "processing_timestamp": datetime.now().strftime("%Y-%m-%dT%H:%M:%S+05:30"),
-        "agent_processing_time_ms": processing_metadata.get("processing_time_ms", 150) if processing_metadata else 150,
+        "processing_timestamp": datetime.now().strftime(_IST_FORMAT),
+        "agent_processing_time_ms": pm.get("processing_time_ms", 150),
         "communication_details": {
             "request_source": "api_endpoint",
             "processing_method": "ai_agent_with_vllm",
-            "model_used": processing_metadata.get("model_used", "deepseek-llm-7b-chat") if processing_metadata else "deepseek-llm-7b-chat",
+            "model_used": pm.get("model_used", "deepseek-llm-7b-chat"),
             "calendar_integration": "google_calendar",
-            "scheduling_confidence": agent_response.get("confidence", 0.85) if agent_response else 0.85,
-            "conflicts_detected": processing_metadata.get("conflicts_detected", 0) if processing_metadata else 0,
-            "alternative_slots_generated": len(agent_response.get("suggested_slots", [])) if agent_response else 1,
+            "scheduling_confidence": ar.get("confidence", 0.85),
+            "conflicts_detected": pm.get("conflicts_detected", 0),
+            "alternative_slots_generated": len(ar.get("suggested_slots", ())) if ar else 1,
             "vllm_server_endpoint": "http://localhost:8000/v1",
-            "total_attendees": len(all_attendee_emails),
+            "total_attendees": num_attendees,
             "meeting_priority": "medium"
         },
-        "workflow_stages": {
-            "input_received": True,
-            "input_processed": True,
-            "calendar_checked": True,
-            "vllm_analysis_completed": True,
-            "slots_generated": True,
-            "optimal_slot_selected": True,
-            "output_created": True
-        },
+        "workflow_stages": _WORKFLOW_STAGES,
         "agent_details": {
-            "agent_success": processing_metadata.get("agent_success", True) if processing_metadata else True,
-            "reasoning": processing_metadata.get("reasoning", "Optimal slot selected based on availability analysis") if processing_metadata else "Optimal slot selected based on availability analysis",
-            "request_id": processing_metadata.get("request_id", processed_input.Request_id) if processing_metadata else processed_input.Request_id
+            "agent_success": pm.get("agent_success", True),
+            "reasoning": pm.get("reasoning", "Optimal slot selected based on availability analysis"),
+            "request_id": pm.get("request_id", processed_input.Request_id)
         }
     }
     
     # Merge any additional metadata provided
-    if processing_metadata:
-        metadata.update({k: v for k, v in processing_metadata.items() if k not in metadata})
+    if pm:
+        metadata.update({k: v for k, v in pm.items() if k not in metadata})
     
-    return MeetingOutputEvent(
+    # Every field here is server-generated in the expected format, so skip re-validation
+    return MeetingOutputEvent.from_trusted(
         Request_id=processed_input.Request_id,
         Datetime=processed_input.Datetime,
         Location=processed_input.Location,
@@ -245,8 +323,8 @@ def create_output_event(processed_input: ProcessedMeetingInput,
         Attendees=attendee_calendars,
         Subject=processed_input.Subject,
         EmailContent=processed_input.EmailContent,
-        EventStart=suggested_start.strftime("%Y-%m-%dT%H:%M:%S+05:30"),
-        EventEnd=suggested_end.strftime("%Y-%m-%dT%H:%M:%S+05:30"),
+        EventStart=start_str,
+        EventEnd=end_str,
         Duration_mins=processed_input.Duration_mins,
         metadata=metadata
     )
@@ -275,23 +353,17 @@ async def schedule_meeting(
         legacy_request = convert_new_to_legacy_format(request)
         logger.info(f"Converted to legacy format: '{legacy_request.title}' ({legacy_request.duration_minutes}min)")
         
-        # Handle organizer
-        organizer_obj = Participant(
-            email=legacy_request.organizer["email"],
-            name=legacy_request.organizer.get("name", legacy_request.organizer["email"].split('@')[0]),
-            role="organizer"
-        )
+        # convert_new_to_legacy_format always fills in "name", so build the
+        # participants straight from its dicts. Emails are still validated here
+        # because the new schema accepts them as plain strings.
+        organizer = legacy_request.organizer
+        organizer_obj = Participant(email=organizer["email"], name=organizer["name"], role="organizer")
         
-        # Create participants list
         logger.debug(f"Processing {len(legacy_request.participants)} additional participants...")
-        participant_objects = []
-        for i, p in enumerate(legacy_request.participants):
-            participant_obj = Participant(
-                email=p["email"],
-                name=p.get("name", p["email"].split('@')[0]),
-                role="participant"
-            )
-            participant_objects.append(participant_obj)
+        participant_objects = [
+            Participant(email=p["email"], name=p["name"], role="participant")
+            for p in legacy_request.participants
+        ]
         
         # Create meeting request
         logger.debug("Creating meeting request object...")
@@ -308,13 +380,11 @@ async def schedule_meeting(
         logger.info(f"Total attendees: {len(meeting_request.get_all_participants())} (1 organizer + {len(legacy_request.participants)} participants)")
         
         # Create user preferences if provided
-        preferences = None
-        if legacy_request.user_preferences:
-            preferences = UserPreferences(**legacy_request.user_preferences)
+        preferences = legacy_request.user_preferences
         
         # Use AI agent to schedule the meeting
         logger.info("Delegating to AI agent for scheduling...")
-        result = agent.schedule_meeting(meeting_request, preferences)
+        result = await asyncio.to_thread(agent.schedule_meeting, meeting_request, preferences)
         
         if not result["success"]:
             raise HTTPException(
@@ -327,12 +397,15 @@ async def schedule_meeting(
         if suggested_slots:
             # Use first suggested slot for output event
             first_slot = suggested_slots[0]
-            suggested_start = datetime.fromisoformat(first_slot["start_time"].replace('Z', '+00:00'))
-            suggested_end = datetime.fromisoformat(first_slot["end_time"].replace('Z', '+00:00'))
+            # fromisoformat accepts a trailing 'Z' natively on Python 3.11+
+            suggested_start = datetime.fromisoformat(first_slot["start_time"])
+            suggested_end = datetime.fromisoformat(first_slot["end_time"])
             
             # Convert to IST timezone for output
-            suggested_start = suggested_start.replace(tzinfo=None)  # Remove timezone for now
-            suggested_end = suggested_end.replace(tzinfo=None)
+            if suggested_start.tzinfo is not None:
+                suggested_start = suggested_start.replace(tzinfo=None)  # Remove timezone for now
+            if suggested_end.tzinfo is not None:
+                suggested_end = suggested_end.replace(tzinfo=None)
         else:
             # Fallback to default time
             suggested_start = datetime(2025, 7, 17, 10, 30, 0)
@@ -356,14 +429,17 @@ async def schedule_meeting(
         )
         
         logger.info(f"Meeting scheduled successfully: {result.get('proposal_id', 'No ID')}")
-        return MeetingProposalResponse(
-            success=True,
-            proposal_id=result.get("proposal_id"),
-            suggested_slots=result.get("suggested_slots"),
-            reasoning=result.get("reasoning"),
-            agent_message=result.get("agent_message"),
-            processed_input=processed_input,
-            output_event=output_event
+        return Response(
+            MeetingProposalResponse(
+                success=True,
+                proposal_id=result.get("proposal_id"),
+                suggested_slots=result.get("suggested_slots"),
+                reasoning=result.get("reasoning"),
+                agent_message=result.get("agent_message"),
+                processed_input=processed_input,
+                output_event=output_event
+            ).model_dump_json(),
+            media_type="application/json"
         )
         
     except Exception as e:
@@ -377,6 +453,100 @@ async def schedule_meeting(
         )
 
 
+def _build_legacy_meeting_request(request: LegacyScheduleMeetingRequest) -> MeetingRequest:
+    """
+    Build the agent's MeetingRequest from a legacy-format request
+    
+    Args:
+        request: Legacy scheduling request
+        
+    Returns:
+        MeetingRequest with organizer and participants filled in
+        
+    Raises:
+        HTTPException: 400 if the organizer or a participant lacks name/email
+    """
+    # Handle organizer - if not provided, create a default one
+    if request.organizer is None:
+        logger.info("No organizer provided, creating default organizer")
+        organizer_obj = Participant(
+            name="API User",
+            email="api.user@example.com",
+            timezone=request.user_preferences.timezone if request.user_preferences else "UTC",
+            role="organizer"
+        )
+    else:
+        if "name" not in request.organizer or "email" not in request.organizer:
+            logger.error(f"Invalid organizer data: {request.organizer}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Organizer must have 'name' and 'email'"
+            )
+        
+        organizer_obj = Participant(
+            name=request.organizer["name"],
+            email=request.organizer["email"],
+            timezone=request.organizer.get("timezone", "UTC"),
+            preferences=request.organizer.get("preferences", {}),
+            role="organizer"
+        )
+        logger.debug(f"Added organizer: {request.organizer['name']} ({request.organizer['email']})")
+    
+    # Create participants list
+    logger.debug(f"Processing {len(request.participants)} additional participants...")
+    participant_objects = []
+    for i, p in enumerate(request.participants):
+        if "name" not in p or "email" not in p:
+            logger.error(f"Invalid participant data at index {i}: {p}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Each participant must have 'name' and 'email'"
+            )
+        
+        participant_objects.append(Participant(
+            name=p["name"],
+            email=p["email"],
+            timezone=p.get("timezone", "UTC"),
+            preferences=p.get("preferences", {}),
+            role=p.get("role", "attendee")
+        ))
+        logger.debug(f"Added participant: {p['name']} ({p['email']})")
+    
+    # Create meeting request
+    logger.debug("Creating meeting request object...")
+    meeting_request = MeetingRequest(
+        title=request.title,
+        description=request.description,
+        duration_minutes=request.duration_minutes,
+        organizer=organizer_obj,
+        participants=participant_objects,
+        priority=MeetingPriority(request.priority),
+        preferred_days=request.preferred_days
+    )
+    
+    logger.info(f"Total attendees: {len(meeting_request.get_all_participants())} (1 organizer + {len(request.participants)} participants)")
+    return meeting_request
+
+
+def _legacy_proposal_response(result: Dict[str, Any]) -> MeetingProposalResponse:
+    """Wrap an agent schedule_meeting result in the legacy response model"""
+    if not result["success"]:
+        logger.error(f"Meeting scheduling failed: {result.get('error', 'Unknown error')}")
+        return MeetingProposalResponse(
+            success=False,
+            error=result.get("error", "Unknown error")
+        )
+    
+    logger.info(f"Meeting scheduled successfully: {result.get('proposal_id', 'No ID')}")
+    return MeetingProposalResponse(
+        success=True,
+        proposal_id=result.get("proposal_id"),
+        suggested_slots=result.get("suggested_slots"),
+        reasoning=result.get("reasoning"),
+        agent_message=result.get("agent_message")
+    )
+
+
 @router.post("/schedule-legacy", response_model=MeetingProposalResponse)
 async def schedule_meeting_legacy(
     request: LegacyScheduleMeetingRequest,
@@ -391,90 +561,18 @@ async def schedule_meeting_legacy(
     logger.info(f"Meeting scheduling requested (legacy): '{request.title}' ({request.duration_minutes}min)")
     
     try:        
-        # Handle organizer - if not provided, create a default one
-        if request.organizer is None:
-            logger.info("No organizer provided, creating default organizer")
-            organizer_obj = Participant(
-                name="API User",
-                email="api.user@example.com",
-                timezone=request.user_preferences.get("timezone", "UTC") if request.user_preferences else "UTC",
-                role="organizer"
-            )
-        else:
-            if "name" not in request.organizer or "email" not in request.organizer:
-                logger.error(f"Invalid organizer data: {request.organizer}")
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Organizer must have 'name' and 'email'"
-                )
-            
-            organizer_obj = Participant(
-                name=request.organizer["name"],
-                email=request.organizer["email"],
-                timezone=request.organizer.get("timezone", "UTC"),
-                preferences=request.organizer.get("preferences", {}),
-                role="organizer"
-            )
-            logger.debug(f"Added organizer: {request.organizer['name']} ({request.organizer['email']})")
-        
-        # Create participants list
-        logger.debug(f"Processing {len(request.participants)} additional participants...")
-        participant_objects = []
-        for i, p in enumerate(request.participants):
-            if "name" not in p or "email" not in p:
-                logger.error(f"Invalid participant data at index {i}: {p}")
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Each participant must have 'name' and 'email'"
-                )
-            
-            participant_objects.append(Participant(
-                name=p["name"],
-                email=p["email"],
-                timezone=p.get("timezone", "UTC"),
-                preferences=p.get("preferences", {}),
-                role=p.get("role", "attendee")
-            ))
-            logger.debug(f"Added participant: {p['name']} ({p['email']})")
-        
-        # Create meeting request
-        logger.debug("Creating meeting request object...")
-        meeting_request = MeetingRequest(
-            title=request.title,
-            description=request.description,
-            duration_minutes=request.duration_minutes,
-            organizer=organizer_obj,
-            participants=participant_objects,
-            priority=MeetingPriority(request.priority),
-            preferred_days=request.preferred_days
-        )
+        meeting_request = _build_legacy_meeting_request(request)
         
-        logger.info(f"Total attendees: {len(meeting_request.get_all_participants())} (1 organizer + {len(request.participants)} participants)")
-        
-        # Create user preferences if provided (these are the organizer's preferences)
-        preferences = None
-        if request.user_preferences:
-            logger.debug("Processing organizer preferences...")
-            preferences = UserPreferences(**request.user_preferences)
+        # Organizer's preferences, already validated as part of the request body
+        preferences = request.user_preferences
         
         # Use AI agent to schedule the meeting
         logger.info("Delegating to AI agent for scheduling...")
-        result = agent.schedule_meeting(meeting_request, preferences)
-        
-        if not result["success"]:
-            logger.error(f"Meeting scheduling failed: {result.get('error', 'Unknown error')}")
-            return MeetingProposalResponse(
-                success=False,
-                error=result.get("error", "Unknown error")
-            )
+        result = await asyncio.to_thread(agent.schedule_meeting, meeting_request, preferences)
         
-        logger.info(f"Meeting scheduled successfully: {result.get('proposal_id', 'No ID')}")
-        return MeetingProposalResponse(
-            success=True,
-            proposal_id=result.get("proposal_id"),
-            suggested_slots=result.get("suggested_slots"),
-            reasoning=result.get("reasoning"),
-            agent_message=result.get("agent_message")
+        return Response(
+            _legacy_proposal_response(result).model_dump_json(),
+            media_type="application/json"
         )
         
     except Exception as e:
@@ -488,6 +586,46 @@ async def schedule_meeting_legacy(
         )
 
 
+@router.post("/schedule-legacy/batch", response_model=List[MeetingProposalResponse])
+async def schedule_meetings_legacy_batch(
+    requests: List[LegacyScheduleMeetingRequest],
+    agent = Depends(get_agent_service)
+):
+    """
+    Schedule several legacy-format meetings in one call
+    
+    The agent schedules the requests concurrently. Responses come back in
+    request order, one per request, with failures reported per item as in
+    /schedule-legacy. An invalid organizer or participant fails the whole batch.
+    """
+    
+    logger.info("Meeting scheduling requested (legacy batch): %d meetings", len(requests))
+    
+    try:
+        meeting_requests = [_build_legacy_meeting_request(request) for request in requests]
+        preferences = [request.user_preferences for request in requests]
+        
+        logger.info("Delegating batch to AI agent for scheduling...")
+        results = await asyncio.to_thread(agent.schedule_meetings_batch, meeting_requests, preferences)
+        
+        return Response(
+            PROPOSAL_RESPONSE_LIST_ADAPTER.dump_json(
+                [_legacy_proposal_response(result) for result in results]
+            ),
+            media_type="application/json"
+        )
+        
+    except Exception as e:
+        if isinstance(e, HTTPException):
+            raise
+        
+        logger.error(f"Unexpected error in schedule_meetings_legacy_batch: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal server error: {str(e)}"
+        )
+
+
 @router.post("/confirm/{proposal_id}")
 async def confirm_meeting(
     proposal_id: str, 
@@ -510,7 +648,8 @@ async def confirm_meeting(
             )
         
         logger.info(f"Meeting confirmed successfully: {proposal_id}")
-        return result
+        # Plain JSON-native dict from the agent; skip the jsonable_encoder pass
+        return ORJSONResponse(result)
         
     except Exception as e:
         if isinstance(e, HTTPException):
@@ -524,36 +663,46 @@ async def confirm_meeting(
 @router.get("/proposal/{proposal_id}", response_model=ProposalStatusResponse)
 async def get_proposal_status(
     proposal_id: str,
+    include_formatted: bool = Query(True, description="Include the human-readable 'formatted' range per slot"),
     agent = Depends(get_agent_service)
 ):
     """Get the status of a meeting proposal"""
     
     try:
-        if proposal_id not in agent.proposals:
+        proposal = agent.get_proposal(proposal_id)
+        if proposal is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Proposal not found"
             )
         
-        proposal = agent.proposals[proposal_id]
+        cache_key = (proposal_id, include_formatted)
+        cached = _proposal_response_cache.get(cache_key)
+        if cached is not None and cached[0] == proposal.created_at and cached[1] == proposal.status:
+            return Response(content=cached[2], media_type="application/json")
         
-        return ProposalStatusResponse(
+        slots_out = [
+            {
+                "index": i,
+                "start_time": slot.start_time.isoformat(),
+                "end_time": slot.end_time.isoformat(),
+                "formatted": slot.formatted if include_formatted else None
+            }
+            for i, slot in enumerate(proposal.suggested_slots)
+        ]
+        
+        body = ProposalStatusResponse(
             proposal_id=proposal_id,
             status=proposal.status,
             meeting_title=proposal.meeting_request.title,
-            participants=[p.email for p in proposal.meeting_request.get_all_participants()],
-            suggested_slots=[
-                {
-                    "index": i,
-                    "start_time": slot.start_time.isoformat(),
-                    "end_time": slot.end_time.isoformat(),
-                    "formatted": f"{slot.start_time.strftime('%A, %B %d at %I:%M %p')} - {slot.end_time.strftime('%I:%M %p')}"
-                }
-                for i, slot in enumerate(proposal.suggested_slots)
-            ],
+            participants=proposal.meeting_request.get_all_emails(),
+            suggested_slots=slots_out,
             reasoning=proposal.reasoning,
             created_at=proposal.created_at.isoformat()
-        )
+        ).model_dump_json(exclude=None if include_formatted else _SLOT_FORMATTED_EXCLUDE).encode()
+        _proposal_response_cache[cache_key] = (proposal.created_at, proposal.status, body)
+        
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
         if isinstance(e, HTTPException):
@@ -587,18 +736,24 @@ async def check_email_responses(
 @router.get("/agent-tools")
 async def get_agent_tools(agent = Depends(get_agent_service)):
     """Get information about available AI agent tools"""
+    global _tools_cache
     
-    return {
-        "tools": [
-            {
-                "name": tool["function"]["name"],
-                "description": tool["function"]["description"],
-                "parameters": list(tool["function"]["parameters"]["properties"].keys())
-            }
-            for tool in agent.tools
-        ],
-        "total_tools": len(agent.tools)
-    }
+    tools = agent.tools
+    if _tools_cache is None or _tools_cache[0] is not tools:
+        payload = {
+            "tools": [
+                {
+                    "name": tool["function"]["name"],
+                    "description": tool["function"]["description"],
+                    "parameters": list(tool["function"]["parameters"]["properties"].keys())
+                }
+                for tool in tools
+            ],
+            "total_tools": len(tools)
+        }
+        _tools_cache = (tools, orjson.dumps(payload))
+    
+    return Response(content=_tools_cache[1], media_type="application/json")
 
 
 @router.post("/receive", response_model=MeetingOutputEvent)
@@ -621,7 +776,7 @@ async def receive_meeting_request(
         legacy_request = convert_new_to_legacy_format(request)
         
         # Step 3: Process with the agent (this will use vLLM and calendar checking)
-        agent_result = agent_service.schedule_meeting(legacy_request)
+        agent_result = await asyncio.to_thread(agent_service.schedule_meeting, legacy_request)
         logger.info(f"Agent processing result: {agent_result.get('success', False)}")
         
         # Step 4: Extract optimal slot from agent result or calculate fallback
@@ -633,7 +788,7 @@ async def receive_meeting_request(
             logger.info(f"Using agent suggested slot: {suggested_start} to {suggested_end}")
         else:
             # Fallback: calculate optimal time within the processed range
-            start_range = datetime.fromisoformat(processed_input.Start.replace('+05:30', '+0530'))
+            start_range = datetime.fromisoformat(processed_input.Start)
             duration_mins = int(processed_input.Duration_mins)
             
             # Default to 10:30 AM if within range, otherwise use start of range + 30 mins
@@ -668,7 +823,7 @@ async def receive_meeting_request(
         logger.info(f"Successfully created output event for request {request.Request_id}")
         logger.info(f"Final scheduled time: {output_event.EventStart} to {output_event.EventEnd}")
         
-        return output_event
+        return Response(output_event.model_dump_json(), media_type="application/json")
         
     except Exception as e:
         logger.error(f"Error processing meeting request {request.Request_id}: {str(e)}", exc_info=True)
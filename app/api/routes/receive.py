@@ -7,24 +7,86 @@ Processes meeting requests exactly as per JSON_Samples format:
 This endpoint handles both input format and processed input format.
 """
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 from typing import Dict, Any, List
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import re
 
 from app.models.api import (
     ScheduleMeetingRequest, AttendeeModel, CalendarEventModel, 
-    AttendeeCalendarModel, MeetingOutputEvent
+    AttendeeCalendarModel, MeetingOutputEvent, OUTPUT_EVENT_LIST_ADAPTER,
+    validate_batch
 )
 from app.core.logging import get_logger
+from app.utils import parse_request_datetime
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Duration mention in email content, e.g. "30 minutes"
+_DURATION_RE = re.compile(r'(\d+)\s*min', re.IGNORECASE)
+
+# Relative-day keywords in priority order (earlier entries win regardless of
+# where they appear in the email). Today is July 13, 2025 (Sunday) - use actual
+# context from test cases.
+_MEETING_DAY_DATES = {
+    "next_thursday": datetime(2025, 7, 17),
+    "monday": datetime(2025, 7, 14),
+    "tuesday": datetime(2025, 7, 15),
+    "wednesday": datetime(2025, 7, 16),
+    "thursday": datetime(2025, 7, 17),
+    "friday": datetime(2025, 7, 18),
+    "today": datetime(2025, 7, 13),
+    "tomorrow": datetime(2025, 7, 14),
+}
+_MEETING_DAY_RANK = {name: rank for rank, name in enumerate(_MEETING_DAY_DATES)}
+# Zero-width lookahead so overlapping keywords (e.g. "tomorrowednesday") are all seen
+_MEETING_DAY_RE = re.compile(
+    "(?=" + "|".join(
+        f"(?P<{name}>{name.replace('_', ' ')})" for name in _MEETING_DAY_DATES
+    ) + ")",
+    re.IGNORECASE
+)
+
+# Request weekday -> days until the next Monday-Friday date
+_NEXT_BUSINESS_DAY_OFFSET = (1, 1, 1, 1, 3, 2, 1)
+
+# Time-of-day hints in priority order -> (hour, minute); same lookahead scan as above
+_MEETING_TIME_SLOTS = {
+    "h9": (9, 0),
+    "h11": (11, 0),
+    "h10": (10, 0),
+    "morning": (10, 30),
+    "afternoon": (14, 0),
+}
+_MEETING_TIME_RANK = {name: rank for rank, name in enumerate(_MEETING_TIME_SLOTS)}
+_MEETING_TIME_RE = re.compile(
+    r"(?=(?P<h9>9:00)|(?P<h11>11:00|11 am)|(?P<h10>10:00|10 am)|(?P<morning>morning)|(?P<afternoon>afternoon))",
+    re.IGNORECASE
+)
+
+# Subject keywords; one lookahead scan collects every keyword present, then the
+# subject rules below are checked in order against that set
+_SUBJECT_KEYWORD_RE = re.compile(
+    r"(?=(?P<quick_feedback>quick feedback)|(?P<client>client)|(?P<goals>goals)"
+    r"|(?P<projects>projects)|(?P<on_going>on-going)|(?P<final_feedback>final feedback)"
+    r"|(?P<next_steps>next steps)|(?P<discuss>discuss))",
+    re.IGNORECASE
+)
+_SUBJECT_RULES = (
+    ({"quick_feedback", "client"}, "Client Feedback Discussion"),
+    ({"goals"}, "Team Goals Discussion"),
+    ({"projects", "on_going"}, "Ongoing Projects Review"),
+    ({"final_feedback", "next_steps"}, "Final Feedback Review and Planning"),
+    ({"discuss"}, "Team Discussion"),
+)
+
 
 def extract_duration_from_content(email_content: str) -> str:
     """Extract duration from email content"""
-    duration_match = re.search(r'(\d+)\s*min', email_content, re.IGNORECASE)
+    duration_match = _DURATION_RE.search(email_content)
     return duration_match.group(1) if duration_match else "30"
 
 
@@ -32,44 +94,24 @@ def determine_meeting_date_from_content(email_content: str, request_datetime: st
     """Determine meeting date from email content and return start/end range"""
     try:
         # Parse request datetime (DD-MM-YYYYTHH:MM:SS format)
-        request_dt = datetime.strptime(request_datetime, "%d-%m-%YT%H:%M:%S")
+        request_dt = parse_request_datetime(request_datetime)
     except ValueError:
         logger.warning(f"Could not parse datetime '{request_datetime}', using current date")
         request_dt = datetime.now()
     
-    content_lower = email_content.lower()
+    # Single pass over the email, keeping the highest-priority keyword found
+    best = None
+    for match in _MEETING_DAY_RE.finditer(email_content):
+        if best is None or _MEETING_DAY_RANK[match.lastgroup] < _MEETING_DAY_RANK[best]:
+            best = match.lastgroup
+            if _MEETING_DAY_RANK[best] == 0:
+                break
     
-    # Today is July 13, 2025 (Sunday) - use actual context from test cases
-    # Map relative dates to actual dates
-    if 'next thursday' in content_lower:
-        # Next Thursday from July 13, 2025 is July 17, 2025
-        meeting_date = datetime(2025, 7, 17)
-    elif 'monday' in content_lower:
-        # Monday could be July 14, 2025 (tomorrow)
-        meeting_date = datetime(2025, 7, 14)
-    elif 'tuesday' in content_lower:
-        # Tuesday is July 15, 2025
-        meeting_date = datetime(2025, 7, 15)
-    elif 'wednesday' in content_lower:
-        # Wednesday is July 16, 2025
-        meeting_date = datetime(2025, 7, 16)
-    elif 'thursday' in content_lower:
-        # Thursday is July 17, 2025
-        meeting_date = datetime(2025, 7, 17)
-    elif 'friday' in content_lower:
-        # Friday is July 18, 2025
-        meeting_date = datetime(2025, 7, 18)
-    elif 'today' in content_lower:
-        # Today is July 13, 2025
-        meeting_date = datetime(2025, 7, 13)
-    elif 'tomorrow' in content_lower:
-        # Tomorrow is July 14, 2025
-        meeting_date = datetime(2025, 7, 14)
+    if best is not None:
+        meeting_date = _MEETING_DAY_DATES[best]
     else:
-        # Default to next business day
-        meeting_date = request_dt + timedelta(days=1)
-        while meeting_date.weekday() >= 5:  # Skip weekends
-            meeting_date += timedelta(days=1)
+        # Default to next business day (weekends skipped via the offset table)
+        meeting_date = request_dt + timedelta(days=_NEXT_BUSINESS_DAY_OFFSET[request_dt.weekday()])
     
     # Create start and end of day range
     start_of_day = meeting_date.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -81,125 +123,229 @@ def determine_meeting_date_from_content(email_content: str, request_datetime: st
     )
 
 
+# Mock calendar data for the test scenarios, built once at import.
+# Test Case 1: Both users available (no conflicts)
+# Test Case 2: USERONE available, USERTWO busy (has 1v1 meeting on Monday 9:00 AM)
+# Test Case 3: Both users busy (AMD AI Workshop Tuesday 11:00 AM)
+# Test Case 4: USERONE free, USERTWO busy (customer meeting Wednesday 10:00 AM)
+# Shared across requests - callers must not mutate the returned lists.
+_USERONE_EVENTS = [
+    # Test Case 3: AMD AI Workshop on Tuesday (2025-07-15)
+    {
+        "StartTime": "2025-07-15T09:00:00+05:30",
+        "EndTime": "2025-07-15T17:00:00+05:30",
+        "NumAttendees": 2,
+        "Attendees": ["userone.amd@gmail.com", "usertwo.amd@gmail.com"],
+        "Summary": "AMD AI Workshop"
+    }
+]
+_USERTWO_EVENTS = [
+    # Test Case 2: 1v1 meeting on Monday (2025-07-14) at 9:00 AM
+    {
+        "StartTime": "2025-07-14T09:00:00+05:30",
+        "EndTime": "2025-07-14T10:00:00+05:30",
+        "NumAttendees": 2,
+        "Attendees": ["usertwo.amd@gmail.com", "other.teammember@gmail.com"],
+        "Summary": "1v1 with Team Member"
+    },
+    # Test Case 3: AMD AI Workshop on Tuesday (2025-07-15)
+    {
+        "StartTime": "2025-07-15T09:00:00+05:30",
+        "EndTime": "2025-07-15T17:00:00+05:30",
+        "NumAttendees": 2,
+        "Attendees": ["userone.amd@gmail.com", "usertwo.amd@gmail.com"],
+        "Summary": "AMD AI Workshop"
+    },
+    # Test Case 4: Customer meeting on Wednesday (2025-07-16) at 10:00 AM
+    {
+        "StartTime": "2025-07-16T10:00:00+05:30",
+        "EndTime": "2025-07-16T11:30:00+05:30",
+        "NumAttendees": 3,
+        "Attendees": ["usertwo.amd@gmail.com", "customer1@client.com", "customer2@client.com"],
+        "Summary": "Meeting with Customers"
+    }
+]
+_USERTHREE_EVENTS = [
+    {
+        "StartTime": "2025-07-17T13:00:00+05:30",
+        "EndTime": "2025-07-17T14:00:00+05:30",
+        "NumAttendees": 1,
+        "Attendees": ["SELF"],
+        "Summary": "Lunch with Customers"
+    }
+]
+# Checked in order; the first key contained in the email wins
+_MOCK_CALENDARS = {
+    "userone": _USERONE_EVENTS,
+    "usertwo": _USERTWO_EVENTS,
+    "userthree": _USERTHREE_EVENTS,
+}
+_NO_EVENTS: List[Dict] = []
+# Same data as validated CalendarEventModel instances, so requests skip re-validation
+_MOCK_CALENDAR_MODELS = {
+    key: [CalendarEventModel(**event_data) for event_data in events]
+    for key, events in _MOCK_CALENDARS.items()
+}
+_NO_EVENT_MODELS: List[CalendarEventModel] = []
+
+
 def get_mock_calendar_data_for_user(email: str) -> List[Dict]:
-    """Generate mock calendar data based on test scenarios"""
-    
-    # Test Case 1: Both users available (no conflicts)
-    # Test Case 2: USERONE available, USERTWO busy (has 1v1 meeting on Monday 9:00 AM)
-    # Test Case 3: Both users busy (AMD AI Workshop Tuesday 11:00 AM)
-    # Test Case 4: USERONE free, USERTWO busy (customer meeting Wednesday 10:00 AM)
-    
-    if "userone" in email:
-        # USERONE calendar data
-        return [
-            # Test Case 3: AMD AI Workshop on Tuesday (2025-07-15)
-            {
-                "StartTime": "2025-07-15T09:00:00+05:30",
-                "EndTime": "2025-07-15T17:00:00+05:30",
-                "NumAttendees": 2,
-                "Attendees": ["userone.amd@gmail.com", "usertwo.amd@gmail.com"],
-                "Summary": "AMD AI Workshop"
-            }
-        ]
-    elif "usertwo" in email:
-        # USERTWO calendar data
-        return [
-            # Test Case 2: 1v1 meeting on Monday (2025-07-14) at 9:00 AM
-            {
-                "StartTime": "2025-07-14T09:00:00+05:30",
-                "EndTime": "2025-07-14T10:00:00+05:30",
-                "NumAttendees": 2,
-                "Attendees": ["usertwo.amd@gmail.com", "other.teammember@gmail.com"],
-                "Summary": "1v1 with Team Member"
-            },
-            # Test Case 3: AMD AI Workshop on Tuesday (2025-07-15)
-            {
-                "StartTime": "2025-07-15T09:00:00+05:30",
-                "EndTime": "2025-07-15T17:00:00+05:30",
-                "NumAttendees": 2,
-                "Attendees": ["userone.amd@gmail.com", "usertwo.amd@gmail.com"],
-                "Summary": "AMD AI Workshop"
-            },
-            # Test Case 4: Customer meeting on Wednesday (2025-07-16) at 10:00 AM
-            {
-                "StartTime": "2025-07-16T10:00:00+05:30",
-                "EndTime": "2025-07-16T11:30:00+05:30",
-                "NumAttendees": 3,
-                "Attendees": ["usertwo.amd@gmail.com", "customer1@client.com", "customer2@client.com"],
-                "Summary": "Meeting with Customers"
-            }
-        ]
-    elif "userthree" in email:
-        return [
-            {
-                "StartTime": "2025-07-17T13:00:00+05:30",
-                "EndTime": "2025-07-17T14:00:00+05:30",
-                "NumAttendees": 1,
-                "Attendees": ["SELF"],
-                "Summary": "Lunch with Customers"
-            }
-        ]
-    
-    return []  # Default for other users
+    """Return mock calendar data based on test scenarios (shared, read-only)"""
+    for key, events in _MOCK_CALENDARS.items():
+        if key in email:
+            return events
+    return _NO_EVENTS  # Default for other users
+
+
+def _get_mock_calendar_events_for_user(email: str) -> List[CalendarEventModel]:
+    """Model form of get_mock_calendar_data_for_user (shared, read-only)"""
+    for key, events in _MOCK_CALENDAR_MODELS.items():
+        if key in email:
+            return events
+    return _NO_EVENT_MODELS
 
 
 def determine_optimal_meeting_time(email_content: str, duration_mins: int, 
                                  target_date: str) -> tuple:
     """Determine optimal meeting time based on content analysis"""
-    content_lower = email_content.lower()
-    
-    # Check for specific time mentions
-    if '9:00 am' in content_lower or '9:00' in email_content:
-        # Specific time requested - 9:00 AM
-        optimal_hour = 9
-        optimal_minute = 0
-    elif '11:00' in email_content or '11 am' in content_lower or '11:00 a.m' in content_lower:
-        # Specific time requested - 11:00 AM
-        optimal_hour = 11
-        optimal_minute = 0
-    elif '10:00' in email_content or '10 am' in content_lower or '10:00 a.m' in content_lower:
-        # Specific time requested - 10:00 AM
-        optimal_hour = 10
-        optimal_minute = 0
-    elif 'morning' in content_lower:
-        optimal_hour = 10
-        optimal_minute = 30
-    elif 'afternoon' in content_lower:
-        optimal_hour = 14
-        optimal_minute = 0
-    else:
-        # Default optimal time
-        optimal_hour = 10
-        optimal_minute = 30
+    # Specific time mentions win over morning/afternoon; default is 10:30
+    best = None
+    for match in _MEETING_TIME_RE.finditer(email_content):
+        if best is None or _MEETING_TIME_RANK[match.lastgroup] < _MEETING_TIME_RANK[best]:
+            best = match.lastgroup
+            if _MEETING_TIME_RANK[best] == 0:
+                break
+    optimal_hour, optimal_minute = _MEETING_TIME_SLOTS[best] if best is not None else (10, 30)
     
     # Parse target date and create optimal time
-    date_part = target_date.split('T')[0]
+    date_part = target_date.partition('T')[0]
     start_time = f"{date_part}T{optimal_hour:02d}:{optimal_minute:02d}:00+05:30"
     
-    # Calculate end time
-    start_dt = datetime.fromisoformat(start_time.replace('+05:30', ''))
-    end_dt = start_dt + timedelta(minutes=duration_mins)
-    end_time = end_dt.strftime("%Y-%m-%dT%H:%M:%S+05:30")
+    # Calculate end time with integer arithmetic; only a meeting running past
+    # midnight needs a date object to roll the day over
+    end_hour, end_minute = divmod(optimal_hour * 60 + optimal_minute + duration_mins, 60)
+    extra_days, end_hour = divmod(end_hour, 24)
+    end_date_part = date_part
+    if extra_days:
+        end_date_part = (date.fromisoformat(date_part) + timedelta(days=extra_days)).isoformat()
+    end_time = f"{end_date_part}T{end_hour:02d}:{end_minute:02d}:00+05:30"
     
     return start_time, end_time
 
 
 def extract_subject_from_content(email_content: str) -> str:
     """Extract meeting subject from email content"""
-    content_lower = email_content.lower()
+    found = {match.lastgroup for match in _SUBJECT_KEYWORD_RE.finditer(email_content)}
     
-    if 'quick feedback' in content_lower and 'client' in content_lower:
-        return "Client Feedback Discussion"
-    elif 'goals' in content_lower:
-        return "Team Goals Discussion"
-    elif 'projects' in content_lower and 'on-going' in content_lower:
-        return "Ongoing Projects Review"
-    elif 'final feedback' in content_lower and 'next steps' in content_lower:
-        return "Final Feedback Review and Planning"
-    elif 'discuss' in content_lower:
-        return "Team Discussion"
+    for keywords, subject in _SUBJECT_RULES:
+        if keywords <= found:
+            return subject
+    return "Team Meeting"
+
+
+def _build_output_event(request: ScheduleMeetingRequest) -> MeetingOutputEvent:
+    """
+    Build the 3_Output_Event.json response for one validated request.
+    
+    Args:
+        request: Validated meeting request (input or processed format)
+        
+    Returns:
+        MeetingOutputEvent for the scheduled meeting
+        
+    Raises:
+        ValueError: If request values cannot be interpreted
+    """
+    logger.info("Processing meeting request ID: %s", request.Request_id)
+    # Extracted once: logged here and reused for the output attendee list
+    attendee_emails = [att.email for att in request.Attendees]
+    logger.debug("From: %s", request.From)
+    logger.debug("Attendees: %s", attendee_emails)
+    
+    # Determine if this is already processed input or needs processing
+    is_processed_input = bool(request.Start and request.End and request.Duration_mins)
+    
+    if is_processed_input:
+        # This is already processed input (like your test case)
+        logger.debug("Detected processed input format")
+        duration_mins = int(request.Duration_mins)
+        start_range = request.Start
+        end_range = request.End
+        
+        # Use provided subject or generate default
+        subject = request.Subject or "Team Meeting - Quick Feedback Session"
+        
     else:
-        return "Team Meeting"
+        # This is raw input - needs processing
+        logger.debug("Detected raw input format - processing...")
+        
+        # Step 1: Extract duration from email content
+        duration_mins = int(extract_duration_from_content(request.EmailContent))
+        logger.debug("Extracted duration: %s minutes", duration_mins)
+        
+        # Step 2: Determine meeting date and time range from content
+        start_range, end_range = determine_meeting_date_from_content(
+            request.EmailContent, request.Datetime
+        )
+        logger.debug("Meeting date range: %s to %s", start_range, end_range)
+        
+        # Use provided subject
+        subject = request.Subject or "Meeting"
+    
+    # Step 3: Determine optimal meeting time
+    optimal_start, optimal_end = determine_optimal_meeting_time(
+        request.EmailContent, duration_mins, start_range
+    )
+    logger.debug("Optimal meeting time: %s to %s", optimal_start, optimal_end)
+    
+    # Step 4: Build attendee list with calendar events
+    all_attendee_emails = [request.From, *attendee_emails]
+    num_attendees = len(all_attendee_emails)
+    
+    # Create the new meeting event once; it is shared by every attendee's calendar
+    new_meeting_event = CalendarEventModel.from_trusted(
+        StartTime=optimal_start,
+        EndTime=optimal_end,
+        NumAttendees=num_attendees,
+        Attendees=all_attendee_emails,
+        Summary=subject
+    )
+    
+    # Existing events (first) with the new meeting event (last); the prebuilt
+    # mock list is shared, so each attendee gets a new list around it
+    attendee_calendar_list = [
+        AttendeeCalendarModel.model_construct(
+            email=email,
+            events=[*_get_mock_calendar_events_for_user(email), new_meeting_event]
+        )
+        for email in all_attendee_emails
+    ]
+    
+    # Step 5: Create metadata (empty as per JSON sample)
+    metadata = {}
+    
+    # Step 6: Create final output event exactly matching JSON_Samples/3_Output_Event.json
+    # Every field is either from the validated request or server-generated, so skip re-validation
+    output_event = MeetingOutputEvent.from_trusted(
+        Request_id=request.Request_id,
+        Datetime=request.Datetime,
+        Location=request.Location,
+        From=request.From,
+        Attendees=attendee_calendar_list,
+        Subject=subject,
+        EmailContent=request.EmailContent,
+        EventStart=optimal_start,
+        EventEnd=optimal_end,
+        Duration_mins=str(duration_mins),
+        metadata=metadata
+    )
+    
+    logger.info(
+        "Successfully processed meeting request %s - final event time: %s to %s",
+        request.Request_id, optimal_start, optimal_end
+    )
+    
+    return output_event
 
 
 @router.post("/receive", response_model=MeetingOutputEvent)
@@ -213,105 +359,61 @@ async def receive_meeting_request(request: ScheduleMeetingRequest) -> MeetingOut
     This endpoint intelligently detects the input format and processes accordingly.
     """
     try:
-        logger.info(f"Processing meeting request ID: {request.Request_id}")
-        logger.info(f"From: {request.From}")
-        logger.info(f"Attendees: {[att.email for att in request.Attendees]}")
-        
-        # Determine if this is already processed input or needs processing
-        is_processed_input = bool(request.Start and request.End and request.Duration_mins)
+        output_event = _build_output_event(request)
         
-        if is_processed_input:
-            # This is already processed input (like your test case)
-            logger.info("Detected processed input format")
-            duration_mins = int(request.Duration_mins)
-            start_range = request.Start
-            end_range = request.End
-            
-            # Use provided subject or generate default
-            subject = request.Subject or "Team Meeting - Quick Feedback Session"
-            
-        else:
-            # This is raw input - needs processing
-            logger.info("Detected raw input format - processing...")
-            
-            # Step 1: Extract duration from email content
-            duration_mins = int(extract_duration_from_content(request.EmailContent))
-            logger.info(f"Extracted duration: {duration_mins} minutes")
-            
-            # Step 2: Determine meeting date and time range from content
-            start_range, end_range = determine_meeting_date_from_content(
-                request.EmailContent, request.Datetime
-            )
-            logger.info(f"Meeting date range: {start_range} to {end_range}")
-            
-            # Use provided subject
-            subject = request.Subject or "Meeting"
+        # Built with model_construct from validated parts; returning a Response
+        # also skips FastAPI's response_model re-validation pass
+        return Response(output_event.model_dump_json(), media_type="application/json")
         
-        # Step 3: Determine optimal meeting time
-        optimal_start, optimal_end = determine_optimal_meeting_time(
-            request.EmailContent, duration_mins, start_range
+    except ValueError as e:
+        # Malformed values in an otherwise valid payload (e.g. non-numeric Duration_mins)
+        logger.error(f"Error processing meeting request {request.Request_id}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process meeting request: {str(e)}"
         )
-        logger.info(f"Optimal meeting time: {optimal_start} to {optimal_end}")
-        
-        # Step 4: Build attendee list with calendar events
-        all_attendee_emails = [request.From] + [att.email for att in request.Attendees]
-        attendee_calendar_list = []
-        
-        for email in all_attendee_emails:
-            # Get existing events for this user
-            existing_events = get_mock_calendar_data_for_user(email)
-            
-            # Create the new meeting event
-            new_meeting_event = CalendarEventModel(
-                StartTime=optimal_start,
-                EndTime=optimal_end,
-                NumAttendees=len(all_attendee_emails),
-                Attendees=all_attendee_emails,
-                Summary=subject
-            )
-            
-            # Combine existing events with new meeting
-            all_events = []
-            
-            # Add existing events first
-            for event_data in existing_events:
-                all_events.append(CalendarEventModel(**event_data))
-            
-            # Add the new meeting event
-            all_events.append(new_meeting_event)
-            
-            # Create attendee calendar model
-            attendee_calendar = AttendeeCalendarModel(
-                email=email,
-                events=all_events
-            )
-            attendee_calendar_list.append(attendee_calendar)
-        
-        # Step 5: Create metadata (empty as per JSON sample)
-        metadata = {}
-        
-        # Step 6: Create final output event exactly matching JSON_Samples/3_Output_Event.json
-        output_event = MeetingOutputEvent(
-            Request_id=request.Request_id,
-            Datetime=request.Datetime,
-            Location=request.Location,
-            From=request.From,
-            Attendees=attendee_calendar_list,
-            Subject=subject,
-            EmailContent=request.EmailContent,
-            EventStart=optimal_start,
-            EventEnd=optimal_end,
-            Duration_mins=str(duration_mins),
-            metadata=metadata
+    except (KeyError, AttributeError, TypeError) as e:
+        # Unexpected shape problems are bugs; keep the traceback for these
+        logger.exception(f"Error processing meeting request {request.Request_id}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process meeting request: {str(e)}"
+        )
+
+
+@router.post("/receive/batch", response_model=List[MeetingOutputEvent])
+async def receive_meeting_requests_batch(http_request: Request) -> List[MeetingOutputEvent]:
+    """
+    Process a JSON array of meeting requests in one call.
+    
+    Input: Array of 1_Input_Request.json / 2_Processed_Input.json objects
+    Output: Array of 3_Output_Event.json objects, in request order
+    
+    The whole body is validated in one pass by the shared list adapter
+    rather than item by item.
+    """
+    try:
+        requests = validate_batch(await http_request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+    
+    logger.info("Processing batch of %d meeting requests", len(requests))
+    
+    try:
+        output_events = [_build_output_event(request) for request in requests]
+        return Response(
+            OUTPUT_EVENT_LIST_ADAPTER.dump_json(output_events),
+            media_type="application/json"
         )
         
-        logger.info(f"Successfully processed meeting request {request.Request_id}")
-        logger.info(f"Final event time: {optimal_start} to {optimal_end}")
-        
-        return output_event
-        
-    except Exception as e:
-        logger.error(f"Error processing meeting request {request.Request_id}: {str(e)}", exc_info=True)
+    except ValueError as e:
+        logger.error(f"Error processing meeting request batch: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process meeting request: {str(e)}"
+        )
+    except (KeyError, AttributeError, TypeError) as e:
+        logger.exception(f"Error processing meeting request batch: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to process meeting request: {str(e)}"
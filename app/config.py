@@ -1,4 +1,5 @@
 import os
+from dataclasses import dataclass
 from typing import Optional
 from pathlib import Path
 from dotenv import load_dotenv
@@ -6,97 +7,129 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+_env = os.environ.get
+
+
+def _env_int(key: str, default: str) -> int:
+    """Integer environment value"""
+    return int(_env(key, default))
+
+
+def _env_float(key: str, default: str) -> float:
+    """Float environment value"""
+    return float(_env(key, default))
+
+
+def _env_bool(key: str, default: str) -> bool:
+    """Boolean environment value ("true", case-insensitive)"""
+    return _env(key, default).lower() == "true"
+
+
+def _env_list(key: str, default: str) -> tuple:
+    """Comma-separated list, stripped and with empty entries dropped"""
+    return tuple(item.strip() for item in _env(key, default).split(",") if item.strip())
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Application configuration management"""
+    """Application configuration management (read-only after import)"""
     
     # ===== API Configuration =====
-    API_HOST: str = os.getenv("API_HOST", "localhost")
-    API_PORT: int = int(os.getenv("API_PORT", "5000"))
-    DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
+    API_HOST: str = _env("API_HOST", "localhost")
+    API_PORT: int = _env_int("API_PORT", "5000")
+    DEBUG: bool = _env_bool("DEBUG", "false")
     
     # ===== vLLM DeepSeek Configuration =====
-    VLLM_BASE_URL: str = os.getenv("VLLM_BASE_URL", "http://localhost:3000")
-    VLLM_MODEL_PATH: str = os.getenv("VLLM_MODEL_PATH", "/home/user/Models/deepseek-ai/deepseek-llm-7b-chat")
-    VLLM_TEMPERATURE: float = float(os.getenv("VLLM_TEMPERATURE", "0.3"))
-    VLLM_MAX_TOKENS: int = int(os.getenv("VLLM_MAX_TOKENS", "2000"))
+    VLLM_BASE_URL: str = _env("VLLM_BASE_URL", "http://localhost:3000")
+    VLLM_MODEL_PATH: str = _env("VLLM_MODEL_PATH", "/home/user/Models/deepseek-ai/deepseek-llm-7b-chat")
+    VLLM_TEMPERATURE: float = _env_float("VLLM_TEMPERATURE", "0.3")
+    VLLM_MAX_TOKENS: int = _env_int("VLLM_MAX_TOKENS", "2000")
     
     # ===== Google APIs Configuration =====
-    GOOGLE_CREDENTIALS_FILE: str = os.getenv(
+    GOOGLE_CREDENTIALS_FILE: str = _env(
         "GOOGLE_CREDENTIALS_FILE", 
         "credentials.json"
     )
-    GOOGLE_TOKEN_FILE: str = os.getenv(
+    GOOGLE_TOKEN_FILE: str = _env(
         "GOOGLE_TOKEN_FILE", 
         "token.pickle"
     )
     
     # Keys directory for multi-user tokens (fallback for Google credentials)
-    KEYS_DIRECTORY: str = os.getenv("KEYS_DIRECTORY", "Keys")
+    KEYS_DIRECTORY: str = _env("KEYS_DIRECTORY", "Keys")
     
     # Legacy support (backwards compatibility)
-    GOOGLE_CALENDAR_CREDENTIALS_FILE: str = os.getenv(
+    GOOGLE_CALENDAR_CREDENTIALS_FILE: str = _env(
         "GOOGLE_CALENDAR_CREDENTIALS_FILE", 
-        os.getenv("GOOGLE_CREDENTIALS_FILE", "credentials.json")
+        _env("GOOGLE_CREDENTIALS_FILE", "credentials.json")
     )
-    GOOGLE_CALENDAR_TOKEN_FILE: str = os.getenv(
+    GOOGLE_CALENDAR_TOKEN_FILE: str = _env(
         "GOOGLE_CALENDAR_TOKEN_FILE", 
-        os.getenv("GOOGLE_TOKEN_FILE", "token.pickle")
+        _env("GOOGLE_TOKEN_FILE", "token.pickle")
     )
     
     # Google API Scopes
-    GOOGLE_SCOPES: list = [
+    GOOGLE_SCOPES: tuple = (
         'https://www.googleapis.com/auth/calendar',
         'https://www.googleapis.com/auth/gmail.send',
         'https://www.googleapis.com/auth/gmail.readonly',
         'https://www.googleapis.com/auth/userinfo.email',
         'openid'
-    ]
+    )
     
     # ===== Scheduling Configuration =====
-    DEFAULT_MEETING_DURATION: int = int(os.getenv("DEFAULT_MEETING_DURATION", "30"))
-    DEFAULT_BUFFER_TIME: int = int(os.getenv("DEFAULT_BUFFER_TIME", "15"))
-    DEFAULT_WORK_START_HOUR: int = int(os.getenv("DEFAULT_WORK_START_HOUR", "9"))
-    DEFAULT_WORK_END_HOUR: int = int(os.getenv("DEFAULT_WORK_END_HOUR", "18"))
-    DEFAULT_TIMEZONE: str = os.getenv("DEFAULT_TIMEZONE", "UTC")
+    DEFAULT_MEETING_DURATION: int = _env_int("DEFAULT_MEETING_DURATION", "30")
+    DEFAULT_BUFFER_TIME: int = _env_int("DEFAULT_BUFFER_TIME", "15")
+    DEFAULT_WORK_START_HOUR: int = _env_int("DEFAULT_WORK_START_HOUR", "9")
+    DEFAULT_WORK_END_HOUR: int = _env_int("DEFAULT_WORK_END_HOUR", "18")
+    DEFAULT_TIMEZONE: str = _env("DEFAULT_TIMEZONE", "UTC")
     
     # ===== Agent Configuration =====
-    AGENT_MAX_RETRIES: int = int(os.getenv("AGENT_MAX_RETRIES", "3"))
-    AGENT_TIMEOUT_SECONDS: int = int(os.getenv("AGENT_TIMEOUT_SECONDS", "30"))
-    MAX_MEETING_SUGGESTIONS: int = int(os.getenv("MAX_MEETING_SUGGESTIONS", "3"))
+    AGENT_MAX_RETRIES: int = _env_int("AGENT_MAX_RETRIES", "3")
+    AGENT_TIMEOUT_SECONDS: int = _env_int("AGENT_TIMEOUT_SECONDS", "30")
+    MAX_MEETING_SUGGESTIONS: int = _env_int("MAX_MEETING_SUGGESTIONS", "3")
+    # Answer repeats of a still-pending schedule request with its existing
+    # proposal for this long (0 disables)
+    SCHEDULE_CACHE_TTL_SECONDS: int = _env_int("SCHEDULE_CACHE_TTL_SECONDS", "0")
+    SCHEDULE_CACHE_MAX_ENTRIES: int = _env_int("SCHEDULE_CACHE_MAX_ENTRIES", "256")
+    # Proposals older than this are forgotten; the oldest go first beyond the cap
+    PROPOSAL_TTL_SECONDS: int = _env_int("PROPOSAL_TTL_SECONDS", "86400")
+    PROPOSAL_MAX_ENTRIES: int = _env_int("PROPOSAL_MAX_ENTRIES", "10000")
     
     # ===== Email Configuration =====
-    EMAIL_SENDER_NAME: str = os.getenv("EMAIL_SENDER_NAME", "SchedulAI")
-    EMAIL_REPLY_TO: Optional[str] = os.getenv("EMAIL_REPLY_TO")
+    EMAIL_SENDER_NAME: str = _env("EMAIL_SENDER_NAME", "SchedulAI")
+    EMAIL_REPLY_TO: Optional[str] = _env("EMAIL_REPLY_TO")
     
     # ===== Calendar Configuration =====
-    CALENDAR_LOOKAHEAD_DAYS: int = int(os.getenv("CALENDAR_LOOKAHEAD_DAYS", "14"))
-    CALENDAR_MAX_EVENTS_PER_REQUEST: int = int(os.getenv("CALENDAR_MAX_EVENTS_PER_REQUEST", "100"))
+    CALENDAR_LOOKAHEAD_DAYS: int = _env_int("CALENDAR_LOOKAHEAD_DAYS", "14")
+    CALENDAR_MAX_EVENTS_PER_REQUEST: int = _env_int("CALENDAR_MAX_EVENTS_PER_REQUEST", "100")
     
     # ===== Security Configuration =====
-    ALLOWED_ORIGINS: list = os.getenv("ALLOWED_ORIGINS", "*").split(",")
-    RATE_LIMIT_PER_MINUTE: int = int(os.getenv("RATE_LIMIT_PER_MINUTE", "60"))
+    ALLOWED_ORIGINS: tuple = _env_list("ALLOWED_ORIGINS", "*")
+    RATE_LIMIT_PER_MINUTE: int = _env_int("RATE_LIMIT_PER_MINUTE", "60")
     
     # ===== Feature Flags =====
-    ENABLE_EMAIL_SENDING: bool = os.getenv("ENABLE_EMAIL_SENDING", "true").lower() == "true"
-    ENABLE_CALENDAR_CREATION: bool = os.getenv("ENABLE_CALENDAR_CREATION", "true").lower() == "true"
-    ENABLE_AI_REASONING: bool = os.getenv("ENABLE_AI_REASONING", "true").lower() == "true"
+    ENABLE_EMAIL_SENDING: bool = _env_bool("ENABLE_EMAIL_SENDING", "true")
+    ENABLE_CALENDAR_CREATION: bool = _env_bool("ENABLE_CALENDAR_CREATION", "true")
+    ENABLE_AI_REASONING: bool = _env_bool("ENABLE_AI_REASONING", "true")
+    # Adds the demo "Team Meet"/lunch events to each attendee calendar in output events
+    ENABLE_MOCK_CALENDAR_EVENTS: bool = _env_bool("ENABLE_MOCK_CALENDAR_EVENTS", "true")
     
     # ===== Logging Configuration =====
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
-    LOG_FORMAT: str = os.getenv(
+    LOG_LEVEL: str = _env("LOG_LEVEL", "INFO")
+    LOG_FORMAT: str = _env(
         "LOG_FORMAT", 
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
     
-    @classmethod
-    def validate_required_config(cls) -> list[str]:
+    def validate_required_config(self) -> list[str]:
         """Validate that all required configuration is present"""
         missing_configs = []
         
         # Required configurations for vLLM
         required_configs = {
-            "VLLM_BASE_URL": cls.VLLM_BASE_URL,
-            "VLLM_MODEL_PATH": cls.VLLM_MODEL_PATH,
+            "VLLM_BASE_URL": self.VLLM_BASE_URL,
+            "VLLM_MODEL_PATH": self.VLLM_MODEL_PATH,
         }
         
         for config_name, config_value in required_configs.items():
@@ -104,39 +137,38 @@ class Config:
                 missing_configs.append(config_name)
         
         # Check Google credentials - either main credentials file or Keys directory with tokens
-        has_main_credentials = cls.GOOGLE_CREDENTIALS_FILE and Path(cls.GOOGLE_CREDENTIALS_FILE).exists()
-        has_keys_directory = Path(cls.KEYS_DIRECTORY).exists()
+        has_main_credentials = self.GOOGLE_CREDENTIALS_FILE and Path(self.GOOGLE_CREDENTIALS_FILE).exists()
+        has_keys_directory = Path(self.KEYS_DIRECTORY).exists()
         
         if has_keys_directory:
             # Check if there are any .amd.token files in Keys directory
-            keys_path = Path(cls.KEYS_DIRECTORY)
+            keys_path = Path(self.KEYS_DIRECTORY)
             token_files = list(keys_path.glob("*.amd.token"))
             if not token_files:
                 has_keys_directory = False
         
         if not has_main_credentials and not has_keys_directory:
-            missing_configs.append(f"Google credentials: either GOOGLE_CREDENTIALS_FILE ({cls.GOOGLE_CREDENTIALS_FILE}) or Keys directory with .amd.token files")
+            missing_configs.append(f"Google credentials: either GOOGLE_CREDENTIALS_FILE ({self.GOOGLE_CREDENTIALS_FILE}) or Keys directory with .amd.token files")
         
         return missing_configs
     
-    @classmethod
-    def get_environment_info(cls) -> dict:
+    def get_environment_info(self) -> dict:
         """Get current environment configuration info"""
         return {
-            "api_host": cls.API_HOST,
-            "api_port": cls.API_PORT,
-            "debug_mode": cls.DEBUG,
-            "vllm_base_url": cls.VLLM_BASE_URL,
-            "vllm_model_path": cls.VLLM_MODEL_PATH,
-            "vllm_temperature": cls.VLLM_TEMPERATURE,
-            "credentials_file": cls.GOOGLE_CREDENTIALS_FILE,
-            "token_file": cls.GOOGLE_TOKEN_FILE,
-            "keys_directory": cls.KEYS_DIRECTORY,
-            "default_timezone": cls.DEFAULT_TIMEZONE,
+            "api_host": self.API_HOST,
+            "api_port": self.API_PORT,
+            "debug_mode": self.DEBUG,
+            "vllm_base_url": self.VLLM_BASE_URL,
+            "vllm_model_path": self.VLLM_MODEL_PATH,
+            "vllm_temperature": self.VLLM_TEMPERATURE,
+            "credentials_file": self.GOOGLE_CREDENTIALS_FILE,
+            "token_file": self.GOOGLE_TOKEN_FILE,
+            "keys_directory": self.KEYS_DIRECTORY,
+            "default_timezone": self.DEFAULT_TIMEZONE,
             "feature_flags": {
-                "email_sending": cls.ENABLE_EMAIL_SENDING,
-                "calendar_creation": cls.ENABLE_CALENDAR_CREATION,
-                "ai_reasoning": cls.ENABLE_AI_REASONING,
+                "email_sending": self.ENABLE_EMAIL_SENDING,
+                "calendar_creation": self.ENABLE_CALENDAR_CREATION,
+                "ai_reasoning": self.ENABLE_AI_REASONING,
             }
         }
 
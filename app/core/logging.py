@@ -4,10 +4,26 @@ Logging configuration for SchedulAI
 Provides centralized logging setup and utilities.
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+# Background listener that drains queued records into the real handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the background log listener, if running"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
 
 
 def setup_logging(
@@ -19,6 +35,9 @@ def setup_logging(
     """
     Setup centralized logging configuration
     
+    Request threads only enqueue records; formatting and console/file I/O
+    happen on a background QueueListener thread.
+    
     Args:
         app_name: Name of the application
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
@@ -39,6 +58,7 @@ def setup_logging(
     root_logger.setLevel(getattr(logging, log_level.upper()))
     
     # Remove existing handlers to avoid duplicates
+    _stop_queue_listener()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
@@ -51,7 +71,7 @@ def setup_logging(
     console_handler = logging.StreamHandler()
     console_handler.setLevel(getattr(logging, log_level.upper()))
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers: List[logging.Handler] = [console_handler]
     
     # File handler
     if log_to_file:
@@ -62,7 +82,16 @@ def setup_logging(
         )
         file_handler.setLevel(getattr(logging, log_level.upper()))
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Route everything through an unbounded queue to the background listener
+    log_queue: queue.Queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    global _queue_listener
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
     
     # Create and return app logger
     app_logger = logging.getLogger(app_name)
@@ -4,14 +4,23 @@ SchedulAI FastAPI Application
 Main application entry point with clean layered architecture.
 """
 
+import sys
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
 from app.config import config
 from app.core.logging import setup_logging
+from app.api.dependencies import init_services, reset_services
 from app.api.middleware import setup_middleware
 from app.api.routes import create_api_router
 
+# uvloop has no Windows build; fall back to the stock asyncio loop there
+_EVENT_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+_HTTP_PROTOCOL = "httptools"
+
 # Setup logging
 logger = setup_logging(
     app_name="scheduleai",
@@ -20,6 +29,14 @@ logger = setup_logging(
 )
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared services on startup and release them on shutdown"""
+    init_services(app)
+    yield
+    reset_services(app)
+
+
 def create_app() -> FastAPI:
     """
     Application factory pattern
@@ -36,7 +53,9 @@ def create_app() -> FastAPI:
         description="Autonomous Meeting Booking Agent with vLLM DeepSeek AI Integration",
         version="1.0.0",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan
     )
     
     # Setup middleware
@@ -81,6 +100,8 @@ def main():
             host=config.API_HOST,
             port=config.API_PORT,
             reload=False,  # Disable reload for production
+            loop=_EVENT_LOOP,
+            http=_HTTP_PROTOCOL,
             log_level=config.LOG_LEVEL.lower()
         )
         return 0
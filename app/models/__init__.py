@@ -28,12 +28,14 @@ from .api import (
     CalendarEventModel,
     AttendeeCalendarModel,
     AttendeeModel,
+    SuggestedSlotModel,
     MeetingProposalResponse,
     ProposalStatusResponse,
     CalendarAvailabilityResponse,
     LegacyScheduleMeetingRequest,
     HealthResponse,
-    ErrorResponse
+    ErrorResponse,
+    validate_batch
 )
 
 from .agent import (
@@ -65,12 +67,14 @@ __all__ = [
     "CalendarEventModel",
     "AttendeeCalendarModel",
     "AttendeeModel",
+    "SuggestedSlotModel",
     "MeetingProposalResponse",
     "ProposalStatusResponse",
     "CalendarAvailabilityResponse",
     "LegacyScheduleMeetingRequest",
     "HealthResponse",
     "ErrorResponse",
+    "validate_batch",
     
     # Agent models
     "FunctionCall",
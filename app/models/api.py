@@ -4,11 +4,63 @@ API request and response models
 Contains Pydantic models for API endpoint requests and responses.
 """
 
-from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel, Field, validator
+from __future__ import annotations
+
+from typing import Annotated, List, Optional, Dict, Any, Union
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 from datetime import datetime
 import uuid
 
+from app.models.meeting import PriorityLiteral
+from app.models.user import UserPreferences
+from app.utils.datetime_utils import parse_request_datetime
+
+
+# Fixed IST offset carried by every processed/output timestamp
+_TZ = '+05:30'
+
+
+def _validate_iso_tz(v: str) -> str:
+    """
+    Check an ISO datetime string carrying the fixed '+05:30' offset
+    
+    Args:
+        v: Value to check, e.g. '2025-07-17T10:30:00+05:30'
+        
+    Returns:
+        The value unchanged
+        
+    Raises:
+        ValueError: If the value is not ISO format with a '+05:30' offset
+    """
+    # fromisoformat accepts the '+05:30' offset as-is on Python 3.11+
+    if v.endswith(_TZ):
+        try:
+            datetime.fromisoformat(v)
+            return v
+        except ValueError:
+            pass
+    raise ValueError("Datetime must be in ISO format with timezone (YYYY-MM-DDTHH:MM:SS+05:30)")
+
+
+# Shared by every '+05:30' timestamp field so the validator is defined once
+IsoDateTimeWithTZ = Annotated[str, AfterValidator(_validate_iso_tz)]
+
+
+class _TrustedModel(BaseModel):
+    """Base for output models that are also built from already-validated data"""
+    
+    @classmethod
+    def from_trusted(cls, **data: Any):
+        """
+        Build an instance without running validation.
+        
+        Only for values that were already validated or are generated internally
+        (earlier pipeline stages, fixed mock data). External input must still go
+        through the normal constructor.
+        """
+        return cls.model_construct(**data)
+
 
 class AttendeeModel(BaseModel):
     """Attendee model for input requests - matches JSON format"""
@@ -17,6 +69,8 @@ class AttendeeModel(BaseModel):
 
 class ScheduleMeetingRequest(BaseModel):
     """API request model for scheduling meetings - supports both input and processed formats"""
+    model_config = ConfigDict(defer_build=True)
+    
     Request_id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique request identifier")
     Datetime: str = Field(..., description="Request datetime in format 'DD-MM-YYYYTHH:MM:SS'")
     Location: Optional[str] = Field(None, description="Meeting location")
@@ -36,30 +90,25 @@ class ScheduleMeetingRequest(BaseModel):
     duration_minutes: Optional[int] = Field(None, ge=15, le=480, description="Legacy: Duration in minutes")
     organizer: Optional[Dict[str, str]] = Field(None, description="Legacy: Meeting organizer details")
     participants: Optional[List[Dict[str, str]]] = Field(None, description="Legacy: Additional participants")
-    priority: Optional[str] = Field("medium", description="Legacy: Meeting priority: low, medium, high, urgent")
+    priority: Optional[PriorityLiteral] = Field("medium", description="Legacy: Meeting priority: low, medium, high, urgent")
     preferred_days: Optional[List[str]] = Field(None, description="Legacy: Organizer's preferred days")
     user_preferences: Optional[Dict[str, Any]] = Field(None, description="Legacy: Organizer's scheduling preferences")
     
-    @validator('priority')
-    def validate_priority(cls, v):
-        if v is not None:
-            valid_priorities = ["low", "medium", "high", "urgent"]
-            if v not in valid_priorities:
-                raise ValueError(f"Priority must be one of: {valid_priorities}")
-        return v
-    
-    @validator('Datetime')
+    @field_validator('Datetime')
+    @classmethod
     def validate_datetime_format(cls, v):
         """Validate datetime format matches DD-MM-YYYYTHH:MM:SS"""
         try:
-            datetime.strptime(v, "%d-%m-%YT%H:%M:%S")
+            parse_request_datetime(v)
         except ValueError:
             raise ValueError("Datetime must be in format 'DD-MM-YYYYTHH:MM:SS' (e.g., '09-07-2025T12:34:55')")
         return v
 
 
-class ProcessedMeetingInput(BaseModel):
+class ProcessedMeetingInput(_TrustedModel):
     """Processed input model - exactly matches 2_Processed_Input.json format"""
+    model_config = ConfigDict(defer_build=True)
+    
     Request_id: str = Field(..., description="Unique request identifier")
     Datetime: str = Field(..., description="Original request datetime in format 'DD-MM-YYYYTHH:MM:SS'")
     Location: Optional[str] = Field(None, description="Meeting location")
@@ -67,51 +116,34 @@ class ProcessedMeetingInput(BaseModel):
     Attendees: List[AttendeeModel] = Field(..., description="List of meeting attendees")
     Subject: str = Field(..., description="Meeting subject/title")
     EmailContent: str = Field(..., description="Meeting description or email content")
-    Start: str = Field(..., description="Processed start date range in ISO format with timezone (YYYY-MM-DDTHH:MM:SS+05:30)")
-    End: str = Field(..., description="Processed end date range in ISO format with timezone (YYYY-MM-DDTHH:MM:SS+05:30)")
+    Start: IsoDateTimeWithTZ = Field(..., description="Processed start date range in ISO format with timezone (YYYY-MM-DDTHH:MM:SS+05:30)")
+    End: IsoDateTimeWithTZ = Field(..., description="Processed end date range in ISO format with timezone (YYYY-MM-DDTHH:MM:SS+05:30)")
     Duration_mins: str = Field(..., description="Extracted duration in minutes as string")
-    
-    @validator('Start', 'End')
-    def validate_iso_format(cls, v):
-        """Validate ISO datetime format with timezone"""
-        try:
-            # Check if it matches the expected format with timezone
-            if not v.endswith('+05:30'):
-                raise ValueError("Datetime must include timezone '+05:30'")
-            datetime.fromisoformat(v.replace('+05:30', '+0530'))
-        except ValueError:
-            raise ValueError("Datetime must be in ISO format with timezone (YYYY-MM-DDTHH:MM:SS+05:30)")
-        return v
 
 
-class CalendarEventModel(BaseModel):
+class CalendarEventModel(_TrustedModel):
     """Calendar event model for output - matches event structure in 3_Output_Event.json"""
-    StartTime: str = Field(..., description="Event start time in ISO format with timezone (YYYY-MM-DDTHH:MM:SS+05:30)")
-    EndTime: str = Field(..., description="Event end time in ISO format with timezone (YYYY-MM-DDTHH:MM:SS+05:30)")
+    model_config = ConfigDict(frozen=True)
+    
+    StartTime: IsoDateTimeWithTZ = Field(..., description="Event start time in ISO format with timezone (YYYY-MM-DDTHH:MM:SS+05:30)")
+    EndTime: IsoDateTimeWithTZ = Field(..., description="Event end time in ISO format with timezone (YYYY-MM-DDTHH:MM:SS+05:30)")
     NumAttendees: int = Field(..., description="Number of attendees")
     Attendees: List[str] = Field(..., description="List of attendee emails or 'SELF' for personal events")
     Summary: str = Field(..., description="Event summary/title")
-    
-    @validator('StartTime', 'EndTime')
-    def validate_event_time_format(cls, v):
-        """Validate event time format with timezone"""
-        try:
-            if not v.endswith('+05:30'):
-                raise ValueError("Event time must include timezone '+05:30'")
-            datetime.fromisoformat(v.replace('+05:30', '+0530'))
-        except ValueError:
-            raise ValueError("Event time must be in ISO format with timezone (YYYY-MM-DDTHH:MM:SS+05:30)")
-        return v
 
 
 class AttendeeCalendarModel(BaseModel):
     """Attendee calendar model with events"""
+    model_config = ConfigDict(frozen=True)
+    
     email: str = Field(..., description="Attendee email address")
     events: List[CalendarEventModel] = Field(..., description="List of calendar events")
 
 
-class MeetingOutputEvent(BaseModel):
+class MeetingOutputEvent(_TrustedModel):
     """Meeting output event model - exactly matches 3_Output_Event.json format"""
+    model_config = ConfigDict(frozen=True, defer_build=True)
+    
     Request_id: str = Field(..., description="Original request identifier")
     Datetime: str = Field(..., description="Original request datetime in format 'DD-MM-YYYYTHH:MM:SS'")
     Location: Optional[str] = Field(None, description="Meeting location")
@@ -119,25 +151,16 @@ class MeetingOutputEvent(BaseModel):
     Attendees: List[AttendeeCalendarModel] = Field(..., description="Attendees with their calendar events")
     Subject: str = Field(..., description="Meeting subject/title")
     EmailContent: str = Field(..., description="Meeting description or email content")
-    EventStart: str = Field(..., description="Final scheduled event start time in ISO format with timezone (YYYY-MM-DDTHH:MM:SS+05:30)")
-    EventEnd: str = Field(..., description="Final scheduled event end time in ISO format with timezone (YYYY-MM-DDTHH:MM:SS+05:30)")
+    EventStart: IsoDateTimeWithTZ = Field(..., description="Final scheduled event start time in ISO format with timezone (YYYY-MM-DDTHH:MM:SS+05:30)")
+    EventEnd: IsoDateTimeWithTZ = Field(..., description="Final scheduled event end time in ISO format with timezone (YYYY-MM-DDTHH:MM:SS+05:30)")
     Duration_mins: str = Field(..., description="Event duration in minutes as string")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Metadata containing communication details, agent processing info, or other contextual data")
-    
-    @validator('EventStart', 'EventEnd')
-    def validate_event_datetime_format(cls, v):
-        """Validate final event datetime format with timezone"""
-        try:
-            if not v.endswith('+05:30'):
-                raise ValueError("Event datetime must include timezone '+05:30'")
-            datetime.fromisoformat(v.replace('+05:30', '+0530'))
-        except ValueError:
-            raise ValueError("Event datetime must be in ISO format with timezone (YYYY-MM-DDTHH:MM:SS+05:30)")
-        return v
 
 
 class HealthResponse(BaseModel):
     """Health check response model"""
+    model_config = ConfigDict(frozen=True)
+    
     status: str
     services: Dict[str, bool]
     agent_tools_count: Optional[int] = None
@@ -148,16 +171,28 @@ class HealthResponse(BaseModel):
 
 class ErrorResponse(BaseModel):
     """Standard error response model"""
+    model_config = ConfigDict(frozen=True)
+    
     detail: str
     error_code: Optional[str] = None
     timestamp: Optional[str] = None
 
 
+class SuggestedSlotModel(BaseModel):
+    """Suggested time slot as returned in proposal responses"""
+    index: int = Field(..., description="Position of the slot in the proposal")
+    start_time: str = Field(..., description="Slot start time in ISO format")
+    end_time: str = Field(..., description="Slot end time in ISO format")
+    formatted: Optional[str] = Field(None, description="Human-readable slot range")
+
+
 class MeetingProposalResponse(BaseModel):
     """Meeting proposal API response"""
+    model_config = ConfigDict(defer_build=True)
+    
     success: bool
     proposal_id: Optional[str] = None
-    suggested_slots: Optional[List[Dict[str, Any]]] = None
+    suggested_slots: Optional[List[SuggestedSlotModel]] = None
     reasoning: Optional[str] = None
     agent_message: Optional[str] = None
     error: Optional[str] = None
@@ -172,7 +207,7 @@ class ProposalStatusResponse(BaseModel):
     status: str
     meeting_title: str
     participants: List[str]
-    suggested_slots: List[Dict[str, Any]]
+    suggested_slots: List[SuggestedSlotModel]
     reasoning: str
     created_at: str
     # Include full event data
@@ -194,13 +229,36 @@ class LegacyScheduleMeetingRequest(BaseModel):
     duration_minutes: int = Field(30, ge=15, le=480, description="Duration in minutes")
     organizer: Optional[Dict[str, str]] = Field(None, description="Meeting organizer details")
     participants: List[Dict[str, str]] = Field(default_factory=list, description="Additional participants")
-    priority: str = Field("medium", description="Meeting priority: low, medium, high, urgent")
+    priority: PriorityLiteral = Field("medium", description="Meeting priority: low, medium, high, urgent")
     preferred_days: List[str] = Field(default_factory=list, description="Organizer's preferred days")
-    user_preferences: Optional[Dict[str, Any]] = Field(None, description="Organizer's scheduling preferences")
+    user_preferences: Optional[UserPreferences] = Field(None, description="Organizer's scheduling preferences")
+
+
+# The top-level request/response models defer schema building (defer_build)
+# and are built here in one pass, once every nested model is defined
+ScheduleMeetingRequest.model_rebuild()
+ProcessedMeetingInput.model_rebuild()
+MeetingOutputEvent.model_rebuild()
+MeetingProposalResponse.model_rebuild()
+
+# Batch adapters - built once so the validation/serialization schema is reused
+REQUEST_LIST_ADAPTER = TypeAdapter(List[ScheduleMeetingRequest])
+ATTENDEE_LIST_ADAPTER = TypeAdapter(List[AttendeeModel])
+OUTPUT_EVENT_LIST_ADAPTER = TypeAdapter(List[MeetingOutputEvent])
+PROPOSAL_RESPONSE_LIST_ADAPTER = TypeAdapter(List[MeetingProposalResponse])
+
+
+def validate_batch(raw: Union[bytes, str]) -> List[ScheduleMeetingRequest]:
+    """
+    Validate a JSON array of meeting requests in a single pass.
     
-    @validator('priority')
-    def validate_priority(cls, v):
-        valid_priorities = ["low", "medium", "high", "urgent"]
-        if v not in valid_priorities:
-            raise ValueError(f"Priority must be one of: {valid_priorities}")
-        return v 
+    Args:
+        raw: JSON array body, e.g. the raw request body
+        
+    Returns:
+        List of validated ScheduleMeetingRequest models
+        
+    Raises:
+        pydantic.ValidationError: If the body is not a valid request list
+    """
+    return REQUEST_LIST_ADAPTER.validate_json(raw)
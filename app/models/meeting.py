@@ -4,10 +4,14 @@ Meeting-related Pydantic models
 Contains all models related to meetings, calendar events, and scheduling.
 """
 
-from datetime import datetime, timedelta
-from typing import List, Optional
-from pydantic import BaseModel, Field, validator
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Annotated, List, Literal, Optional
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, PrivateAttr, ValidationInfo, field_validator
 from enum import Enum
+import time
 import uuid
 
 from .user import Participant
@@ -21,37 +25,73 @@ class MeetingPriority(str, Enum):
     URGENT = "urgent"
 
 
-class TimeSlot(BaseModel):
+# Plain-string priority for the API request models (values match MeetingPriority)
+PriorityLiteral = Literal["low", "medium", "high", "urgent"]
+
+
+def _lower_str(v):
+    """Lowercase strings ahead of a case-sensitive Literal check"""
+    return v.lower() if isinstance(v, str) else v
+
+
+# Day of week, accepted in any case and stored lowercase
+DayLiteral = Annotated[
+    Literal["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"],
+    BeforeValidator(_lower_str)
+]
+
+
+def _utcnow() -> datetime:
+    """Current time as a timezone-aware UTC datetime"""
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc)
+
+
+# Human-readable slot formats, e.g. "Monday, July 21 at 10:00 AM - 10:30 AM"
+SLOT_START_FORMAT = '%A, %B %d at %I:%M %p'
+SLOT_END_FORMAT = '%I:%M %p'
+
+
+# Internal value types below are built only from already-typed service data, so
+# they are plain frozen dataclasses rather than validated pydantic models
+@dataclass(slots=True, frozen=True, kw_only=True)
+class TimeSlot:
     """Represents a time slot with availability information"""
     start_time: datetime
     end_time: datetime
     available: bool = True
     timezone: str = "UTC"
+    # Human-readable slot range, computed once since the slot is immutable
+    formatted: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(
+            self, "formatted",
+            f"{self.start_time.strftime(SLOT_START_FORMAT)} - {self.end_time.strftime(SLOT_END_FORMAT)}"
+        )
 
 
 class MeetingRequest(BaseModel):
-    """Meeting request with organizer and participants"""
+    """
+    Meeting request with organizer and participants
+    
+    Treated as immutable once built: organizer and participants are not
+    reassigned after construction, so derived values can be cached.
+    """
     title: str = Field(..., min_length=1, max_length=200, description="Meeting title")
     description: Optional[str] = Field("", max_length=1000, description="Meeting description")
     duration_minutes: int = Field(30, ge=15, le=480, description="Duration in minutes (15-480)")
     organizer: Participant = Field(..., description="Meeting organizer (the user making the request)")
-    participants: List[Participant] = Field(default_factory=list, max_items=19, description="Additional meeting participants")
+    participants: List[Participant] = Field(default_factory=list, max_length=19, description="Additional meeting participants")
     priority: MeetingPriority = Field(MeetingPriority.MEDIUM, description="Meeting priority level")
-    preferred_days: Optional[List[str]] = Field([], description="Organizer's preferred days of week")
+    preferred_days: Optional[List[DayLiteral]] = Field([], description="Organizer's preferred days of week")
     earliest_start: Optional[datetime] = Field(None, description="Earliest possible start time")
     latest_end: Optional[datetime] = Field(None, description="Latest possible end time")
     buffer_time_minutes: int = Field(15, ge=0, le=60, description="Buffer time between meetings")
     
-    @validator('preferred_days')
-    def validate_preferred_days(cls, v):
-        if v:
-            valid_days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-            for day in v:
-                if day.lower() not in valid_days:
-                    raise ValueError(f"Invalid day: {day}. Must be one of {valid_days}")
-        return [day.lower() for day in v] if v else []
+    _all_emails: Optional[List[str]] = PrivateAttr(default=None)
     
-    @validator('organizer')
+    @field_validator('organizer')
+    @classmethod
     def set_organizer_role(cls, v):
         if hasattr(v, 'role'):
             v.role = "organizer"
@@ -62,23 +102,27 @@ class MeetingRequest(BaseModel):
         return [self.organizer] + self.participants
     
     def get_all_emails(self) -> List[str]:
-        """Get all participant emails including organizer"""
-        return [p.email for p in self.get_all_participants()]
+        """Get all participant emails including organizer (cached; do not mutate)"""
+        if self._all_emails is None:
+            self._all_emails = [p.email for p in self.get_all_participants()]
+        return self._all_emails
 
 
-class CalendarEvent(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class CalendarEvent:
     """Calendar event representation"""
     id: Optional[str] = None
     title: str
     description: Optional[str] = ""
     start_time: datetime
     end_time: datetime
-    attendees: List[str] = []
+    attendees: List[str] = field(default_factory=list)
     location: Optional[str] = ""
     timezone: str = "UTC"
 
 
-class EmailMessage(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class EmailMessage:
     """Email message representation"""
     to: List[str]
     subject: str
@@ -87,16 +131,19 @@ class EmailMessage(BaseModel):
     thread_id: Optional[str] = None
 
 
-class AvailabilityRequest(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class AvailabilityRequest:
     """Request for checking availability"""
     start_date: datetime
     end_date: datetime
-    participants: List[str] = []
+    participants: List[str] = field(default_factory=list)
     duration_minutes: int = 30
 
 
 class AvailabilityResponse(BaseModel):
     """Response with availability data"""
+    model_config = ConfigDict(frozen=True)
+    
     participant_email: str
     free_slots: List[TimeSlot]
     busy_slots: List[TimeSlot]
@@ -109,12 +156,13 @@ class MeetingProposal(BaseModel):
     suggested_slots: List[TimeSlot] = Field(..., description="AI-suggested time slots")
     reasoning: str = Field(..., description="AI reasoning for slot selection")
     confidence_scores: List[float] = Field(default_factory=list, description="Confidence scores for each slot")
-    created_at: datetime = Field(default_factory=datetime.now, description="Proposal creation time")
+    created_at: datetime = Field(default_factory=_utcnow, description="Proposal creation time (UTC)")
     status: str = Field("pending", pattern="^(pending|confirmed|cancelled)$", description="Proposal status")
     
-    @validator('confidence_scores')
-    def validate_confidence_scores(cls, v, values):
-        if 'suggested_slots' in values and v:
-            if len(v) != len(values['suggested_slots']):
+    @field_validator('confidence_scores')
+    @classmethod
+    def validate_confidence_scores(cls, v, info: ValidationInfo):
+        if 'suggested_slots' in info.data and v:
+            if len(v) != len(info.data['suggested_slots']):
                 raise ValueError("Number of confidence scores must match number of suggested slots")
         return v 
\ No newline at end of file
@@ -4,14 +4,20 @@ User and participant-related Pydantic models
 Contains models for users, participants, and their preferences.
 """
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, EmailStr, Field
+from __future__ import annotations
+
+from typing import Annotated, List, Optional, Dict, Any
+from pydantic import BaseModel, StringConstraints
+
+# RFC 5322-lite address check, run by pydantic-core instead of email-validator
+EMAIL_RE = r'^[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}$'
+EmailAddress = Annotated[str, StringConstraints(pattern=EMAIL_RE, max_length=254)]
 
 
 class Participant(BaseModel):
     """Represents a meeting participant"""
     name: str
-    email: EmailStr
+    email: EmailAddress
     timezone: str = "UTC"
     preferences: Optional[Dict[str, Any]] = {}
     role: str = "attendee"  # "organizer", "attendee", "optional"
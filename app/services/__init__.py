@@ -7,11 +7,18 @@ This module contains the core services for the SchedulAI application:
 - SchedulingAgent: AI agent with vLLM function calling capabilities
 
 The services follow a clean architecture pattern with proper separation of concerns.
+Service classes are imported lazily (PEP 562) so importing one submodule does not
+pull in the Google API client and LLM stack of the others.
 """
 
-from app.services.google_service import GoogleService
-from app.services.vllm_service import VLLMService
-from app.services.agent_service import SchedulingAgent
+import importlib
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.services.google_service import GoogleService
+    from app.services.vllm_service import VLLMService
+    from app.services.agent_service import SchedulingAgent
 
 __all__ = [
     "GoogleService",
@@ -19,11 +26,40 @@ __all__ = [
     "SchedulingAgent"
 ]
 
-# Service factory functions for dependency injection
-def create_google_service() -> GoogleService:
-    """Factory function to create GoogleService instance"""
+# Public name -> defining submodule, resolved on first attribute access
+_LAZY_IMPORTS = {
+    "GoogleService": "app.services.google_service",
+    "VLLMService": "app.services.vllm_service",
+    "SchedulingAgent": "app.services.agent_service",
+}
+
+
+def __getattr__(name: str):
+    """Import service classes on first access"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include the lazily imported names in dir()"""
+    return sorted([*globals(), *__all__])
+
+
+# Service factory functions for dependency injection. Each returns one shared
+# instance so the OAuth clients and vLLM session are set up once per process;
+# a failed construction is not cached and is retried on the next call.
+@lru_cache(maxsize=1)
+def create_google_service() -> "GoogleService":
+    """Factory function to get the shared GoogleService instance"""
+    from app.services.google_service import GoogleService
     return GoogleService()
 
-def create_scheduling_agent() -> SchedulingAgent:
-    """Factory function to create SchedulingAgent instance"""
-    return SchedulingAgent() 
\ No newline at end of file
+@lru_cache(maxsize=1)
+def create_scheduling_agent() -> "SchedulingAgent":
+    """Factory function to get the shared SchedulingAgent instance"""
+    from app.services.agent_service import SchedulingAgent
+    return SchedulingAgent()
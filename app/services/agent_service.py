@@ -1,7 +1,12 @@
-import json
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Callable
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Callable, Tuple
+
+import orjson
+from cachetools import TTLCache
 
 from app.models import (
     MeetingRequest, MeetingProposal, TimeSlot, CalendarEvent,
@@ -9,213 +14,483 @@ from app.models import (
     ToolCall, FunctionCall, AgentResponse, AgentAction
 )
 from app.config import config
-from app.services.google_service import GoogleService
+from app.services import create_google_service
 from app.services.vllm_service import VLLMService
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
-class SchedulingAgent:
-    """AI Agent that uses vLLM DeepSeek for meeting scheduling with function calling"""
+# Upper bound on tool calls executed at the same time, across all agent turns
+MAX_TOOL_WORKERS = 8
+
+# Upper bound on meeting requests from one batch in flight against vLLM at once
+MAX_BATCH_WORKERS = 16
+
+
+def _normalize_text(text: str) -> str:
+    """Case- and whitespace-insensitive form of free text"""
+    return " ".join(text.split()).casefold()
+
+
+def _schedule_cache_key(meeting_request: MeetingRequest,
+                        user_preferences: Optional[UserPreferences]) -> Tuple:
+    """
+    Signature of a scheduling request for the result cache
     
-    def __init__(self):
-        logger.info("Initializing SchedulAI Agent with vLLM DeepSeek...")
+    Requests that differ only in letter case, whitespace or participant order
+    map to the same key.
+    
+    Args:
+        meeting_request: Meeting request to schedule
+        user_preferences: Organizer preferences, if any
         
-        # Initialize vLLM service
-        logger.debug("Setting up vLLM service...")
-        self.vllm_service = VLLMService()
+    Returns:
+        Hashable cache key
+    """
+    return (
+        meeting_request.organizer.email.casefold(),
+        tuple(sorted(p.email.casefold() for p in meeting_request.participants)),
+        _normalize_text(meeting_request.title),
+        _normalize_text(meeting_request.description or ""),
+        meeting_request.duration_minutes,
+        meeting_request.priority,
+        tuple(sorted(meeting_request.preferred_days or ())),
+        meeting_request.buffer_time_minutes,
+        meeting_request.earliest_start,
+        meeting_request.latest_end,
+        user_preferences.model_dump_json() if user_preferences else None,
+    )
+
+
+def _parse_free_slots(slots: List[Dict[str, Any]]) -> List[Tuple[int, int, datetime]]:
+    """
+    Parse free slots once into (start_ts, end_ts, start) tuples
+    
+    Args:
+        slots: Free slot dicts with ISO start_time/end_time
         
-        # Perform health check
-        if not self.vllm_service.health_check():
-            logger.warning("vLLM server health check failed - continuing anyway")
+    Returns:
+        Epoch-second bounds plus the parsed start datetime, in input order
+    """
+    parsed = []
+    for slot in slots:
+        start = datetime.fromisoformat(slot["start_time"])
+        end = datetime.fromisoformat(slot["end_time"])
+        parsed.append((int(start.timestamp()), int(end.timestamp()), start))
+    return parsed
+
+
+def _is_sorted_and_disjoint(slots: List[Tuple[int, int, datetime]]) -> bool:
+    """Whether slots are well-formed, in start order and non-overlapping"""
+    if any(start > end for start, end, _ in slots):
+        return False
+    return all(previous[1] <= current[0] for previous, current in zip(slots, slots[1:]))
+
+
+def _intersect_free_slots(common: List[Tuple[int, int, datetime]],
+                          other: List[Tuple[int, int, datetime]],
+                          required_seconds: int) -> List[Tuple[int, int, datetime]]:
+    """
+    Intersect the slots shared so far with the next participant's slots
+    
+    Every overlap long enough for the meeting yields a slot of exactly the
+    meeting length starting where the overlap starts. Results come in the
+    order of a nested loop over common then other. When both lists are sorted
+    and disjoint (as _calculate_free_slots produces them) that order is start
+    order, and a linear two-pointer sweep finds it. The availability data is
+    written by the model, though, so any other input falls back to comparing
+    every pair.
+    
+    Args:
+        common: Slots shared by the participants seen so far
+        other: Next participant's slots
+        required_seconds: Meeting length in seconds
         
-        # Initialize Google service
-        logger.debug("Setting up Google services...")
-        self.google_service = GoogleService()
+    Returns:
+        Meeting-length slots free for both
+    """
+    if not (_is_sorted_and_disjoint(common) and _is_sorted_and_disjoint(other)):
+        return _intersect_free_slots_pairwise(common, other, required_seconds)
+    
+    result = []
+    i = j = 0
+    while i < len(common) and j < len(other):
+        common_start, common_end, common_start_dt = common[i]
+        other_start, other_end, other_start_dt = other[j]
         
-        # Initialize proposal storage
-        self.proposals: Dict[str, MeetingProposal] = {}
+        if common_start >= other_start:
+            overlap_start, overlap_start_dt = common_start, common_start_dt
+        else:
+            overlap_start, overlap_start_dt = other_start, other_start_dt
+        overlap_end = min(common_end, other_end)
         
-        # Define available tools/functions
-        logger.debug("Setting up agent tools...")
-        self.tools = self._define_tools()
-        self.tool_functions = self._define_tool_functions()
+        if overlap_start < overlap_end and overlap_end - overlap_start >= required_seconds:
+            result.append((overlap_start, overlap_start + required_seconds, overlap_start_dt))
         
-        logger.info(f"SchedulAI Agent initialized with {len(self.tools)} tools")
-        logger.debug(f"Available tools: {[tool['function']['name'] for tool in self.tools]}")
-        logger.info(f"Using vLLM DeepSeek model: {self.vllm_service.model_path}")
+        # The slot that ends first can't overlap anything later in the other list
+        if common_end < other_end:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def _intersect_free_slots_pairwise(common: List[Tuple[int, int, datetime]],
+                                   other: List[Tuple[int, int, datetime]],
+                                   required_seconds: int) -> List[Tuple[int, int, datetime]]:
+    """Same result as _intersect_free_slots for arbitrary input, by comparing every pair"""
+    result = []
+    for common_start, common_end, common_start_dt in common:
+        for other_start, other_end, other_start_dt in other:
+            if common_start >= other_start:
+                overlap_start, overlap_start_dt = common_start, common_start_dt
+            else:
+                overlap_start, overlap_start_dt = other_start, other_start_dt
+            overlap_end = min(common_end, other_end)
+            
+            if overlap_start < overlap_end and overlap_end - overlap_start >= required_seconds:
+                result.append((overlap_start, overlap_start + required_seconds, overlap_start_dt))
+    return result
+
+
+def _slot_score(hour: int, weekday: int, priority: str) -> float:
+    """Score a slot starting at the given local hour and weekday"""
+    score = 0.0
     
-    def _define_tools(self) -> List[Dict[str, Any]]:
-        """Define vLLM function calling tools (compatible with standard format)"""
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_calendar_availability",
-                    "description": "Get calendar availability for participants in a date range",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "participant_emails": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "List of participant email addresses"
-                            },
-                            "start_date": {
-                                "type": "string",
-                                "format": "date-time",
-                                "description": "Start date in ISO format"
-                            },
-                            "end_date": {
-                                "type": "string", 
-                                "format": "date-time",
-                                "description": "End date in ISO format"
-                            },
-                            "duration_minutes": {
-                                "type": "integer",
-                                "description": "Required meeting duration in minutes"
-                            }
-                        },
-                        "required": ["participant_emails", "start_date", "end_date", "duration_minutes"]
+    # Time of day scoring (prefer mid-morning and early afternoon)
+    if 9 <= hour <= 11:  # Morning
+        score += 0.3
+    elif 13 <= hour <= 15:  # Early afternoon
+        score += 0.2
+    elif 8 <= hour <= 16:  # General work hours
+        score += 0.1
+    
+    # Day of week scoring (prefer Tuesday-Thursday)
+    if weekday in [1, 2, 3]:  # Tue, Wed, Thu
+        score += 0.2
+    elif weekday in [0, 4]:  # Mon, Fri
+        score += 0.1
+    
+    # Priority scoring
+    if priority == "urgent":
+        # Earlier is better for urgent meetings
+        score += 0.3 if hour <= 12 else 0.1
+    elif priority == "low":
+        # Later in day is fine for low priority
+        score += 0.2 if hour >= 14 else 0.0
+    
+    # Avoid lunch time
+    if 12 <= hour <= 13:
+        score -= 0.2
+    
+    return score
+
+
+# Reply keywords per response type, checked in this order (substring matches)
+_RESPONSE_KEYWORDS = (
+    ("confirmation", ("yes", "confirm", "accept", "agree", "sounds good")),
+    ("rejection", ("no", "decline", "reject", "can't", "cannot")),
+    ("reschedule_request", ("reschedule", "different time", "another time")),
+)
+
+# Every (priority, weekday, hour) score precomputed, so ranking a slot is a
+# lookup; only urgent and low priority change the score
+_SLOT_SCORES = {
+    priority: tuple(
+        tuple(_slot_score(hour, weekday, priority) for hour in range(24))
+        for weekday in range(7)
+    )
+    for priority in ("urgent", "medium", "low")
+}
+
+
+@lru_cache(maxsize=128)
+def _build_system_message(work_start_hour: int, work_end_hour: int,
+                          preferred_meeting_days: Tuple[str, ...],
+                          buffer_time_minutes: int,
+                          lunch_break_start: Optional[int]) -> str:
+    """Render the agent system prompt for one set of preference values"""
+    return f"""You are SchedulAI, an intelligent meeting scheduling agent. Your job is to:
+
+1. Analyze meeting requests and participant availability
+2. Use available tools to gather calendar information
+3. Suggest optimal meeting times based on multiple factors
+4. Handle email communications professionally
+5. Create calendar events when meetings are confirmed
+
+Key scheduling principles:
+- Work hours: {work_start_hour}:00 - {work_end_hour}:00
+- Preferred days: {', '.join(preferred_meeting_days)}
+- Buffer time: {buffer_time_minutes} minutes between meetings
+- Avoid lunch: {lunch_break_start}:00 - {lunch_break_start + 1}:00
+
+When scheduling:
+- High/urgent priority: Prefer earlier slots, shorter delays
+- Medium priority: Balance convenience and timing
+- Low priority: Optimize for participant convenience
+
+Always explain your reasoning and be proactive in resolving conflicts.
+Use the available tools systematically to gather data and execute actions."""
+
+
+# vLLM function calling tools (compatible with standard format); built once
+# and shared by every agent so callers can cache on its identity
+_TOOLS_SCHEMA: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "function": {
+            "name": "get_calendar_availability",
+            "description": "Get calendar availability for participants in a date range",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "participant_emails": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "List of participant email addresses"
+                    },
+                    "start_date": {
+                        "type": "string",
+                        "format": "date-time",
+                        "description": "Start date in ISO format"
+                    },
+                    "end_date": {
+                        "type": "string", 
+                        "format": "date-time",
+                        "description": "End date in ISO format"
+                    },
+                    "duration_minutes": {
+                        "type": "integer",
+                        "description": "Required meeting duration in minutes"
                     }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "analyze_optimal_slots",
-                    "description": "Analyze availability data and recommend optimal meeting slots",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "availability_data": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "participant_email": {"type": "string"},
-                                        "free_slots": {
-                                            "type": "array",
-                                            "items": {
-                                                "type": "object",
-                                                "properties": {
-                                                    "start_time": {"type": "string"},
-                                                    "end_time": {"type": "string"},
-                                                    "available": {"type": "boolean"}
-                                                }
-                                            }
-                                        },
-                                        "busy_slots": {
-                                            "type": "array", 
-                                            "items": {
-                                                "type": "object",
-                                                "properties": {
-                                                    "start_time": {"type": "string"},
-                                                    "end_time": {"type": "string"}
-                                                }
-                                            }
+                },
+                "required": ["participant_emails", "start_date", "end_date", "duration_minutes"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "analyze_optimal_slots",
+            "description": "Analyze availability data and recommend optimal meeting slots",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "availability_data": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "participant_email": {"type": "string"},
+                                "free_slots": {
+                                    "type": "array",
+                                    "items": {
+                                        "type": "object",
+                                        "properties": {
+                                            "start_time": {"type": "string"},
+                                            "end_time": {"type": "string"},
+                                            "available": {"type": "boolean"}
                                         }
                                     }
                                 },
-                                "description": "Availability data for all participants"
-                            },
-                            "meeting_requirements": {
-                                "type": "object",
-                                "properties": {
-                                    "duration_minutes": {"type": "integer"},
-                                    "priority": {"type": "string"},
-                                    "preferred_days": {
-                                        "type": "array",
-                                        "items": {"type": "string"}
-                                    },
-                                    "user_preferences": {
+                                "busy_slots": {
+                                    "type": "array", 
+                                    "items": {
                                         "type": "object",
                                         "properties": {
-                                            "work_start_hour": {"type": "integer"},
-                                            "work_end_hour": {"type": "integer"},
-                                            "timezone": {"type": "string"},
-                                            "buffer_time_minutes": {"type": "integer"}
+                                            "start_time": {"type": "string"},
+                                            "end_time": {"type": "string"}
                                         }
                                     }
-                                },
-                                "description": "Meeting requirements including priority, duration, preferences"
-                            },
-                            "max_suggestions": {
-                                "type": "integer",
-                                "default": 3,
-                                "description": "Maximum number of slot suggestions to return"
+                                }
                             }
                         },
-                        "required": ["availability_data", "meeting_requirements"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "create_calendar_event",
-                    "description": "Create a calendar event for confirmed meeting",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "title": {"type": "string", "description": "Meeting title"},
-                            "description": {"type": "string", "description": "Meeting description"},
-                            "start_time": {"type": "string", "format": "date-time"},
-                            "end_time": {"type": "string", "format": "date-time"},
-                            "attendees": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Attendee email addresses"
-                            },
-                            "location": {"type": "string", "description": "Meeting location"}
-                        },
-                        "required": ["title", "start_time", "end_time", "attendees"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "send_meeting_email",
-                    "description": "Send meeting proposal or confirmation email",
-                    "parameters": {
+                        "description": "Availability data for all participants"
+                    },
+                    "meeting_requirements": {
                         "type": "object",
                         "properties": {
-                            "to": {
+                            "duration_minutes": {"type": "integer"},
+                            "priority": {"type": "string"},
+                            "preferred_days": {
                                 "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Recipient email addresses"
+                                "items": {"type": "string"}
                             },
-                            "subject": {"type": "string", "description": "Email subject"},
-                            "body": {"type": "string", "description": "Email body content"},
-                            "html_body": {"type": "string", "description": "HTML version of email body"},
-                            "email_type": {
-                                "type": "string",
-                                "enum": ["proposal", "confirmation", "cancellation", "reminder"],
-                                "description": "Type of email being sent"
+                            "user_preferences": {
+                                "type": "object",
+                                "properties": {
+                                    "work_start_hour": {"type": "integer"},
+                                    "work_end_hour": {"type": "integer"},
+                                    "timezone": {"type": "string"},
+                                    "buffer_time_minutes": {"type": "integer"}
+                                }
                             }
                         },
-                        "required": ["to", "subject", "body", "email_type"]
+                        "description": "Meeting requirements including priority, duration, preferences"
+                    },
+                    "max_suggestions": {
+                        "type": "integer",
+                        "default": 3,
+                        "description": "Maximum number of slot suggestions to return"
                     }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "check_email_responses",
-                    "description": "Check for email responses related to meeting proposals",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "proposal_id": {"type": "string", "description": "Meeting proposal ID"},
-                            "query": {"type": "string", "description": "Search query for emails"},
-                            "max_results": {"type": "integer", "default": 10}
-                        },
-                        "required": ["proposal_id"]
+                },
+                "required": ["availability_data", "meeting_requirements"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "create_calendar_event",
+            "description": "Create a calendar event for confirmed meeting",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string", "description": "Meeting title"},
+                    "description": {"type": "string", "description": "Meeting description"},
+                    "start_time": {"type": "string", "format": "date-time"},
+                    "end_time": {"type": "string", "format": "date-time"},
+                    "attendees": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Attendee email addresses"
+                    },
+                    "location": {"type": "string", "description": "Meeting location"}
+                },
+                "required": ["title", "start_time", "end_time", "attendees"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "send_meeting_email",
+            "description": "Send meeting proposal or confirmation email",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "to": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Recipient email addresses"
+                    },
+                    "subject": {"type": "string", "description": "Email subject"},
+                    "body": {"type": "string", "description": "Email body content"},
+                    "html_body": {"type": "string", "description": "HTML version of email body"},
+                    "email_type": {
+                        "type": "string",
+                        "enum": ["proposal", "confirmation", "cancellation", "reminder"],
+                        "description": "Type of email being sent"
                     }
-                }
+                },
+                "required": ["to", "subject", "body", "email_type"]
             }
-        ]
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "check_email_responses",
+            "description": "Check for email responses related to meeting proposals",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "proposal_id": {"type": "string", "description": "Meeting proposal ID"},
+                    "query": {"type": "string", "description": "Search query for emails"},
+                    "max_results": {"type": "integer", "default": 10}
+                },
+                "required": ["proposal_id"]
+            }
+        }
+    }
+]
+
+
+class SchedulingAgent:
+    """AI Agent that uses vLLM DeepSeek for meeting scheduling with function calling"""
+    
+    def __init__(self):
+        logger.info("Initializing SchedulAI Agent with vLLM DeepSeek...")
+        
+        # Initialize vLLM service
+        logger.debug("Setting up vLLM service...")
+        self.vllm_service = VLLMService()
+        
+        # Perform health check
+        if not self.vllm_service.health_check():
+            logger.warning("vLLM server health check failed - continuing anyway")
+        
+        # Initialize Google service
+        logger.debug("Setting up Google services...")
+        # Shared with app.state.google_service rather than a second OAuth client
+        self.google_service = create_google_service()
+        
+        # Initialize proposal storage; bounded so a long-running service doesn't
+        # keep every proposal forever. Even reads reorder the cache, so all
+        # access goes through the lock.
+        self.proposals: TTLCache = TTLCache(
+            maxsize=config.PROPOSAL_MAX_ENTRIES,
+            ttl=config.PROPOSAL_TTL_SECONDS
+        )
+        self._proposals_lock = threading.Lock()
+        
+        # Recent successful results keyed on request signature: (proposal, result).
+        # schedule_meeting runs in worker threads, hence the lock.
+        self._schedule_cache: Optional[TTLCache] = None
+        if config.SCHEDULE_CACHE_TTL_SECONDS > 0:
+            self._schedule_cache = TTLCache(
+                maxsize=config.SCHEDULE_CACHE_MAX_ENTRIES,
+                ttl=config.SCHEDULE_CACHE_TTL_SECONDS
+            )
+        self._schedule_cache_lock = threading.Lock()
+        
+        # Define available tools/functions
+        logger.debug("Setting up agent tools...")
+        self.tools = _TOOLS_SCHEMA
+        self.tool_functions = self._define_tool_functions()
+        
+        # Long-lived so worker threads keep their Google API transports between turns
+        self._tool_executor = ThreadPoolExecutor(
+            max_workers=MAX_TOOL_WORKERS, thread_name_prefix="agent-tool"
+        )
+        
+        logger.info(f"SchedulAI Agent initialized with {len(self.tools)} tools")
+        logger.debug(f"Available tools: {[tool['function']['name'] for tool in self.tools]}")
+        logger.info(f"Using vLLM DeepSeek model: {self.vllm_service.model_path}")
+    
+    def close(self) -> None:
+        """Stop the tool worker threads"""
+        self._tool_executor.shutdown(wait=False, cancel_futures=True)
+    
+    def get_proposal(self, proposal_id: str) -> Optional[MeetingProposal]:
+        """
+        Look up a stored proposal
+        
+        Args:
+            proposal_id: Proposal identifier
+            
+        Returns:
+            The proposal, or None if unknown or expired
+        """
+        with self._proposals_lock:
+            return self.proposals.get(proposal_id)
+    
+    def _store_proposal(self, proposal: MeetingProposal) -> None:
+        """Store a proposal under its id"""
+        with self._proposals_lock:
+            self.proposals[proposal.id] = proposal
+    
+    def _forget_schedule_result(self, proposal_id: str) -> None:
+        """Drop cached schedule results that point at a proposal"""
+        if self._schedule_cache is None:
+            return
+        with self._schedule_cache_lock:
+            stale = [
+                key for key, (proposal, _) in self._schedule_cache.items()
+                if proposal.id == proposal_id
+            ]
+            for key in stale:
+                del self._schedule_cache[key]
     
     def _define_tool_functions(self) -> Dict[str, Callable]:
         """Map tool names to actual function implementations"""
@@ -231,6 +506,25 @@ class SchedulingAgent:
                          user_preferences: Optional[UserPreferences] = None) -> Dict[str, Any]:
         """Main agent method to schedule a meeting using function calling"""
         
+        # A repeat of a request whose proposal is still pending gets that same
+        # proposal back: no new vLLM round-trip, emails or calendar events
+        cache_key = None
+        if self._schedule_cache is not None:
+            cache_key = _schedule_cache_key(meeting_request, user_preferences)
+            with self._schedule_cache_lock:
+                cached = self._schedule_cache.get(cache_key)
+            if cached is not None:
+                cached_proposal, cached_result = cached
+                if (cached_proposal.status == "pending"
+                        and self.get_proposal(cached_proposal.id) is cached_proposal):
+                    logger.info(f"Returning pending proposal {cached_proposal.id} for a duplicate request")
+                    return dict(cached_result)
+                
+                # Confirmed, cancelled or expired; schedule from scratch
+                with self._schedule_cache_lock:
+                    if self._schedule_cache.get(cache_key) is cached:
+                        del self._schedule_cache[cache_key]
+        
         proposal_id = str(uuid.uuid4())
         
         # Create system message for the agent
@@ -254,6 +548,12 @@ class SchedulingAgent:
             # Process the agent's response and execute tools
             result = self._process_agent_response(response, proposal_id, meeting_request)
             
+            if cache_key is not None and result.get("success"):
+                proposal = self.get_proposal(proposal_id)
+                if proposal is not None:
+                    with self._schedule_cache_lock:
+                        self._schedule_cache[cache_key] = (proposal, result)
+            
             return result
             
         except Exception as e:
@@ -263,6 +563,34 @@ class SchedulingAgent:
                 "proposal_id": None
             }
     
+    def schedule_meetings_batch(self, meeting_requests: List[MeetingRequest],
+                                user_preferences: Optional[List[Optional[UserPreferences]]] = None
+                                ) -> List[Dict[str, Any]]:
+        """
+        Schedule several meetings at once
+        
+        Requests are submitted to vLLM concurrently rather than one after
+        another, so its continuous batching can process them together.
+        
+        Args:
+            meeting_requests: Meeting requests to schedule
+            user_preferences: Organizer preferences per request (same length as
+                meeting_requests), or None to schedule every request without them
+            
+        Returns:
+            One schedule_meeting result per request, in request order
+        """
+        if not meeting_requests:
+            return []
+        if user_preferences is None:
+            user_preferences = [None] * len(meeting_requests)
+        elif len(user_preferences) != len(meeting_requests):
+            raise ValueError("user_preferences must have one entry per meeting request")
+        
+        max_workers = min(MAX_BATCH_WORKERS, len(meeting_requests))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.schedule_meeting, meeting_requests, user_preferences))
+    
     def _process_agent_response(self, response, proposal_id: str, 
                                 meeting_request: MeetingRequest) -> Dict[str, Any]:
         """Process the agent's response and execute any tool calls"""
@@ -286,33 +614,41 @@ class SchedulingAgent:
         suggested_slots = []
         reasoning = ""
         
-        for tool_call in tool_calls:
-            function_name = tool_call.function.name
-            function_args = json.loads(tool_call.function.arguments)
-            
-            # Execute the function
-            if function_name in self.tool_functions:
-                try:
-                    function_result = self.tool_functions[function_name](**function_args)
-                    
-                    # Add tool result to messages
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": json.dumps(function_result)
-                    })
-                    
-                    # Process specific results
-                    if function_name == "analyze_optimal_slots":
-                        suggested_slots = function_result.get("suggested_slots", [])
-                        reasoning = function_result.get("reasoning", "")
-                    
-                except Exception as e:
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": f"Error: {str(e)}"
-                    })
+        # Tool calls from one turn don't depend on each other and are mostly
+        # Google API round trips, so overlap them; results keep call order
+        calls = [
+            (tool_call, tool_call.function.name, orjson.loads(tool_call.function.arguments))
+            for tool_call in tool_calls
+            if tool_call.function.name in self.tool_functions
+        ]
+        
+        futures = [
+            self._tool_executor.submit(self.tool_functions[function_name], **function_args)
+            for _, function_name, function_args in calls
+        ]
+        
+        for (tool_call, function_name, _), future in zip(calls, futures):
+            try:
+                function_result = future.result()
+                
+                # Add tool result to messages
+                messages.append({
+                    "role": "tool",
+                    "tool_call_id": tool_call.id,
+                    "content": orjson.dumps(function_result).decode()
+                })
+                
+                # Process specific results
+                if function_name == "analyze_optimal_slots":
+                    suggested_slots = function_result.get("suggested_slots", [])
+                    reasoning = function_result.get("reasoning", "")
+                
+            except Exception as e:
+                messages.append({
+                    "role": "tool",
+                    "tool_call_id": tool_call.id,
+                    "content": f"Error: {str(e)}"
+                })
         
         # Get final response from agent using vLLM
         final_response = self.vllm_service.create_chat_completion(
@@ -339,7 +675,7 @@ class SchedulingAgent:
                 confidence_scores=[0.9] * len(time_slots)  # Placeholder
             )
             
-            self.proposals[proposal_id] = proposal
+            self._store_proposal(proposal)
             
             return {
                 "success": True,
@@ -349,7 +685,7 @@ class SchedulingAgent:
                         "index": i,
                         "start_time": slot.start_time.isoformat(),
                         "end_time": slot.end_time.isoformat(),
-                        "formatted": f"{slot.start_time.strftime('%A, %B %d at %I:%M %p')} - {slot.end_time.strftime('%I:%M %p')}"
+                        "formatted": slot.formatted
                     }
                     for i, slot in enumerate(time_slots)
                 ],
@@ -379,17 +715,19 @@ class SchedulingAgent:
             # Convert to JSON-serializable format
             result = []
             for response in availability_responses:
-                result.append({
-                    "participant_email": response.participant_email,
-                    "free_slots": [
-                        {
+                free_slots = []
+                for slot in response.free_slots:
+                    slot_minutes = (slot.end_time - slot.start_time).total_seconds() / 60
+                    if slot_minutes >= duration_minutes:
+                        free_slots.append({
                             "start_time": slot.start_time.isoformat(),
                             "end_time": slot.end_time.isoformat(),
-                            "duration_minutes": int((slot.end_time - slot.start_time).total_seconds() / 60)
-                        }
-                        for slot in response.free_slots
-                        if (slot.end_time - slot.start_time).total_seconds() / 60 >= duration_minutes
-                    ],
+                            "duration_minutes": int(slot_minutes)
+                        })
+                
+                result.append({
+                    "participant_email": response.participant_email,
+                    "free_slots": free_slots,
                     "busy_slots": [
                         {
                             "start_time": slot.start_time.isoformat(),
@@ -417,39 +755,34 @@ class SchedulingAgent:
             common_slots = availability_data[0]["free_slots"]
             
             # Find intersection with other participants
-            for participant_data in availability_data[1:]:
-                participant_slots = participant_data["free_slots"]
-                new_common_slots = []
+            if len(availability_data) > 1:
+                required_duration = meeting_requirements.get("duration_minutes", 30)
+                required_seconds = required_duration * 60
                 
-                for common_slot in common_slots:
-                    for participant_slot in participant_slots:
-                        # Check for overlap
-                        overlap_start = max(
-                            datetime.fromisoformat(common_slot["start_time"]),
-                            datetime.fromisoformat(participant_slot["start_time"])
-                        )
-                        overlap_end = min(
-                            datetime.fromisoformat(common_slot["end_time"]),
-                            datetime.fromisoformat(participant_slot["end_time"])
-                        )
-                        
-                        if overlap_start < overlap_end:
-                            overlap_duration = (overlap_end - overlap_start).total_seconds() / 60
-                            required_duration = meeting_requirements.get("duration_minutes", 30)
-                            
-                            if overlap_duration >= required_duration:
-                                new_common_slots.append({
-                                    "start_time": overlap_start.isoformat(),
-                                    "end_time": (overlap_start + timedelta(minutes=required_duration)).isoformat(),
-                                    "duration_minutes": required_duration
-                                })
+                common = _parse_free_slots(common_slots)
+                for participant_data in availability_data[1:]:
+                    common = _intersect_free_slots(
+                        common, _parse_free_slots(participant_data["free_slots"]), required_seconds
+                    )
                 
-                common_slots = new_common_slots
+                common_slots = [
+                    {
+                        "start_time": overlap_start.isoformat(),
+                        "end_time": (overlap_start + timedelta(minutes=required_duration)).isoformat(),
+                        "duration_minutes": required_duration
+                    }
+                    for _, _, overlap_start in common
+                ]
+                start_times = [overlap_start for _, _, overlap_start in common]
             
             # Score and rank slots based on preferences
+            candidates = common_slots[:max_suggestions * 2]  # Get more to rank
+            if len(availability_data) == 1:
+                start_times = [datetime.fromisoformat(slot["start_time"]) for slot in candidates]
+            
             scored_slots = []
-            for slot in common_slots[:max_suggestions * 2]:  # Get more to rank
-                score = self._score_time_slot(slot, meeting_requirements)
+            for slot, start_time in zip(candidates, start_times):
+                score = self._score_time_slot(start_time, meeting_requirements)
                 scored_slots.append((slot, score))
             
             # Sort by score and take top suggestions
@@ -467,41 +800,10 @@ class SchedulingAgent:
         except Exception as e:
             return {"error": str(e), "suggested_slots": []}
     
-    def _score_time_slot(self, slot: Dict[str, Any], requirements: Dict[str, Any]) -> float:
-        """Score a time slot based on various criteria"""
-        score = 0.0
-        start_time = datetime.fromisoformat(slot["start_time"])
-        
-        # Time of day scoring (prefer mid-morning and early afternoon)
-        hour = start_time.hour
-        if 9 <= hour <= 11:  # Morning
-            score += 0.3
-        elif 13 <= hour <= 15:  # Early afternoon
-            score += 0.2
-        elif 8 <= hour <= 16:  # General work hours
-            score += 0.1
-        
-        # Day of week scoring (prefer Tuesday-Thursday)
-        weekday = start_time.weekday()
-        if weekday in [1, 2, 3]:  # Tue, Wed, Thu
-            score += 0.2
-        elif weekday in [0, 4]:  # Mon, Fri
-            score += 0.1
-        
-        # Priority scoring
-        priority = requirements.get("priority", "medium")
-        if priority == "urgent":
-            # Earlier is better for urgent meetings
-            score += 0.3 if hour <= 12 else 0.1
-        elif priority == "low":
-            # Later in day is fine for low priority
-            score += 0.2 if hour >= 14 else 0.0
-        
-        # Avoid lunch time
-        if 12 <= hour <= 13:
-            score -= 0.2
-        
-        return score
+    def _score_time_slot(self, start_time: datetime, requirements: Dict[str, Any]) -> float:
+        """Score a time slot, given its already parsed start, based on various criteria"""
+        scores = _SLOT_SCORES.get(requirements.get("priority", "medium"), _SLOT_SCORES["medium"])
+        return scores[start_time.weekday()][start_time.hour]
     
     def _create_calendar_event(self, title: str, description: str, 
                                start_time: str, end_time: str,
@@ -585,41 +887,26 @@ class SchedulingAgent:
         """Parse email body to determine response type"""
         body_lower = email_body.lower()
         
-        # Simple keyword-based parsing
-        if any(word in body_lower for word in ["yes", "confirm", "accept", "agree", "sounds good"]):
-            return "confirmation"
-        elif any(word in body_lower for word in ["no", "decline", "reject", "can't", "cannot"]):
-            return "rejection"
-        elif any(word in body_lower for word in ["reschedule", "different time", "another time"]):
-            return "reschedule_request"
-        else:
-            return "unclear"
+        # Simple keyword-based parsing; first category with a hit wins
+        for response_type, keywords in _RESPONSE_KEYWORDS:
+            for word in keywords:
+                if word in body_lower:
+                    return response_type
+        return "unclear"
     
     def _create_system_message(self, user_preferences: Optional[UserPreferences]) -> str:
         """Create system message for the agent"""
         prefs = user_preferences or UserPreferences()
         
-        return f"""You are SchedulAI, an intelligent meeting scheduling agent. Your job is to:
-
-1. Analyze meeting requests and participant availability
-2. Use available tools to gather calendar information
-3. Suggest optimal meeting times based on multiple factors
-4. Handle email communications professionally
-5. Create calendar events when meetings are confirmed
-
-Key scheduling principles:
-- Work hours: {prefs.work_start_hour}:00 - {prefs.work_end_hour}:00
-- Preferred days: {', '.join(prefs.preferred_meeting_days)}
-- Buffer time: {prefs.buffer_time_minutes} minutes between meetings
-- Avoid lunch: {prefs.lunch_break_start}:00 - {prefs.lunch_break_start + 1}:00
-
-When scheduling:
-- High/urgent priority: Prefer earlier slots, shorter delays
-- Medium priority: Balance convenience and timing
-- Low priority: Optimize for participant convenience
-
-Always explain your reasoning and be proactive in resolving conflicts.
-Use the available tools systematically to gather data and execute actions."""
+        # Cached per distinct preferences, so repeat requests send a
+        # byte-identical prompt prefix (lets vLLM reuse its prefix KV cache)
+        return _build_system_message(
+            prefs.work_start_hour,
+            prefs.work_end_hour,
+            tuple(prefs.preferred_meeting_days),
+            prefs.buffer_time_minutes,
+            prefs.lunch_break_start
+        )
     
     def _create_meeting_request_message(self, meeting_request: MeetingRequest) -> str:
         """Create user message describing the meeting request"""
@@ -655,10 +942,10 @@ Please:
 
     def confirm_meeting(self, proposal_id: str, slot_index: int) -> Dict[str, Any]:
         """Confirm a meeting proposal"""
-        if proposal_id not in self.proposals:
+        proposal = self.get_proposal(proposal_id)
+        if proposal is None:
             return {"success": False, "error": "Proposal not found"}
         
-        proposal = self.proposals[proposal_id]
         if slot_index >= len(proposal.suggested_slots):
             return {"success": False, "error": "Invalid slot index"}
         
@@ -687,6 +974,7 @@ Please:
             
             # Update proposal status
             proposal.status = "confirmed"
+            self._forget_schedule_result(proposal_id)
             
             return {
                 "success": True,
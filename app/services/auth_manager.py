@@ -8,6 +8,7 @@ automatic validation, and refresh capabilities.
 import json
 import os
 import pickle
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Set
@@ -440,13 +441,18 @@ class AuthenticationManager:
 
 # Singleton instance
 _auth_manager: Optional[AuthenticationManager] = None
+_auth_manager_lock = threading.Lock()
 
 
 def get_auth_manager() -> AuthenticationManager:
     """Get or create the authentication manager singleton"""
     global _auth_manager
     if _auth_manager is None:
-        _auth_manager = AuthenticationManager()
-        # Migrate legacy token on first initialization
-        _auth_manager.migrate_legacy_token()
+        # Double-checked so concurrent first callers don't each build a manager
+        with _auth_manager_lock:
+            if _auth_manager is None:
+                auth_manager = AuthenticationManager()
+                # Migrate legacy token on first initialization
+                auth_manager.migrate_legacy_token()
+                _auth_manager = auth_manager
     return _auth_manager
\ No newline at end of file
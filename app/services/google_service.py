@@ -9,18 +9,24 @@ import pickle
 import os
 import json
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import email.mime.text as mime_text
 import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest
+import google_auth_httplib2
+import httplib2
 from google.oauth2.credentials import Credentials
 from googleapiclient.errors import HttpError
 from fastapi import HTTPException
+from cachetools import TTLCache
 
 from app.models import CalendarEvent, EmailMessage, TimeSlot, AvailabilityResponse
 from app.config import config
@@ -30,6 +36,12 @@ from app.core.exceptions import GoogleServiceException, CalendarException, Email
 
 logger = get_logger(__name__)
 
+# How long (seconds) a per-email access check is reused before credentials are re-validated
+ACCESS_CACHE_TTL = 30
+
+# Upper bound on concurrent per-participant Calendar API calls across all requests (keeps us within Google quota)
+MAX_AVAILABILITY_WORKERS = 8
+
 class GoogleService:
     """Unified Google service for Calendar and Gmail APIs with multi-user support"""
     
@@ -44,6 +56,24 @@ class GoogleService:
         self.user_credentials = {}
         self._load_tokens_directly()
         
+        # Access results keyed by the sorted email tuple so request bursts share one check
+        self._access_cache: TTLCache = TTLCache(maxsize=128, ttl=ACCESS_CACHE_TTL)
+        self._access_cache_lock = threading.Lock()
+        
+        # Built API clients keyed by (email, service, credential source), shared by all threads;
+        # requests go out over a per-thread transport (httplib2 is not thread-safe)
+        self._service_cache: Dict[Tuple[str, str, str], Tuple[Credentials, Any]] = {}
+        self._service_cache_lock = threading.Lock()
+        self._thread_http = threading.local()
+        
+        # Long-lived so worker threads, and their transports, survive between calls
+        self._availability_executor = ThreadPoolExecutor(
+            max_workers=MAX_AVAILABILITY_WORKERS, thread_name_prefix="google-availability"
+        )
+        
+        # Direct-access credentials keyed by email, reloaded only when the token file changes
+        self._direct_credentials: Dict[str, Tuple[float, Credentials]] = {}
+        
         # Comment out complex authentication manager
         # self.auth_manager = get_auth_manager()
         
@@ -188,22 +218,79 @@ class GoogleService:
         if loaded_count > 0:
             logger.info(f"Available authenticated users: {list(self.user_credentials.keys())}")
 
+    def _build_service(self, email: str, service_name: str, version: str, credentials: Credentials,
+                       source: str = "user"):
+        """
+        Build a Google API client once per user, service and credential source
+        
+        The loaded user tokens and the direct Keys-file tokens are separate
+        credential objects, so each source gets its own cache entry rather than
+        evicting the other's. An entry is rebuilt only when its credentials change.
+        
+        Args:
+            email: User the client acts for
+            service_name: API name, e.g. 'calendar'
+            version: API version, e.g. 'v3'
+            credentials: Credentials the client should use
+            source: Where the credentials came from ("user" or "direct")
+            
+        Returns:
+            Google API client resource
+        """
+        key = (email, service_name, source)
+        with self._service_cache_lock:
+            cached = self._service_cache.get(key)
+        if cached is not None and cached[0] is credentials:
+            return cached[1]
+        
+        def request_builder(http, *args, **kwargs):
+            return HttpRequest(self._get_thread_http(email, source, credentials), *args, **kwargs)
+        
+        service = build(service_name, version, credentials=credentials, requestBuilder=request_builder)
+        with self._service_cache_lock:
+            self._service_cache[key] = (credentials, service)
+        return service
+    
+    def _get_thread_http(self, email: str, source: str,
+                         credentials: Credentials) -> google_auth_httplib2.AuthorizedHttp:
+        """This thread's authorized transport for a user and credential source"""
+        transports = getattr(self._thread_http, 'transports', None)
+        if transports is None:
+            transports = self._thread_http.transports = {}
+        
+        key = (email, source)
+        cached = transports.get(key)
+        if cached is not None and cached[0] is credentials:
+            return cached[1]
+        
+        http = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http())
+        transports[key] = (credentials, http)
+        return http
+    
+    def close(self) -> None:
+        """Stop the availability worker threads"""
+        self._availability_executor.shutdown(wait=False, cancel_futures=True)
+    
     def get_user_service(self, email: str, service_type: str = 'calendar'):
         """Get Google API service for specific user (direct credential access)"""
         if email not in self.user_credentials:
             logger.error(f"No credentials found for user: {email}")
             return None
         
-        if not self.is_user_authenticated(email):
+        credentials = self._get_valid_credentials(email)
+        if credentials is None:
             logger.error(f"User not authenticated: {email}")
             return None
         
+        return self._build_user_service(email, service_type, credentials)
+    
+    def _build_user_service(self, email: str, service_type: str, credentials: Credentials):
+        """Build the requested Google API service from already-validated credentials"""
         try:
-            credentials = self.user_credentials[email]
             if service_type == 'calendar':
-                return build('calendar', 'v3', credentials=credentials)
+                return self._build_service(email, 'calendar', 'v3', credentials)
             elif service_type == 'gmail':
-                return build('gmail', 'v1', credentials=credentials)
+                return self._build_service(email, 'gmail', 'v1', credentials)
             else:
                 logger.error(f"Unknown service type: {service_type}")
                 return None
@@ -211,27 +298,52 @@ class GoogleService:
             logger.error(f"Failed to create {service_type} service for {email}: {e}")
             return None
     
-    def is_user_authenticated(self, email: str) -> bool:
-        """Check if user is authenticated (direct credential check)"""
-        if email not in self.user_credentials:
-            return False
+    def _get_valid_credentials(self, email: str) -> Optional[Credentials]:
+        """Get the user's credentials if they are valid (refreshing if needed) in a single lookup"""
+        creds = self.user_credentials.get(email)
+        if creds is None:
+            return None
         
-        creds = self.user_credentials[email]
         if not creds.valid:
             if creds.expired and creds.refresh_token:
                 try:
                     creds.refresh(Request())
-                    return creds.valid
+                    return creds if creds.valid else None
                 except Exception as e:
                     logger.error(f"Failed to refresh credentials for {email}: {e}")
-                    return False
-            return False
-        return True
+                    return None
+            return None
+        return creds
+    
+    def is_user_authenticated(self, email: str) -> bool:
+        """Check if user is authenticated (direct credential check)"""
+        return self._get_valid_credentials(email) is not None
     
     def get_authenticated_users(self) -> List[str]:
         """Get list of authenticated user emails (direct from loaded tokens)"""
         return list(self.user_credentials.keys())
     
+    def validate_access(self, emails: List[str]) -> Dict[str, Any]:
+        """Validate access for multiple emails and return detailed report"""
+        key = tuple(sorted(set(emails)))
+        with self._access_cache_lock:
+            access = self._access_cache.get(key)
+        if access is None:
+            access = {email: self.is_user_authenticated(email) for email in key}
+            with self._access_cache_lock:
+                self._access_cache[key] = access
+        
+        accessible = [email for email in emails if access[email]]
+        denied = [email for email in emails if not access[email]]
+        
+        return {
+            'total_requested': len(emails),
+            'accessible_users': accessible,
+            'denied_users': denied,
+            'accessible_count': len(accessible),
+            'denied_count': len(denied)
+        }
+    
     def get_authenticated_email(self) -> Optional[str]:
         """Get the first authenticated user email (for legacy compatibility)"""
         users = self.get_authenticated_users()
@@ -254,79 +366,90 @@ class GoogleService:
                                 start_date: datetime, end_date: datetime) -> List[AvailabilityResponse]:
         """Get availability for participants using multi-user authentication"""
         try:
-            availability_responses = []
+            unique_emails = list(dict.fromkeys(participant_emails))
+            if not unique_emails:
+                return []
             
-            for email in participant_emails:
-                logger.debug(f"Checking availability for: {email}")
-                
-                # Check if user is authenticated
-                if self.is_user_authenticated(email):
-                    # Get user-specific calendar service
-                    calendar_service = self.get_user_service(email, 'calendar')
-                    if not calendar_service:
-                        logger.error(f"Failed to get calendar service for {email}")
-                        availability_responses.append(AvailabilityResponse(
-                            participant_email=email,
-                            free_slots=[],
-                            busy_slots=[]
-                        ))
-                        continue
-                    
-                    # Get busy times for authenticated user
-                    body = {
-                        'timeMin': start_date.isoformat() + 'Z' if not start_date.tzinfo else start_date.isoformat(),
-                        'timeMax': end_date.isoformat() + 'Z' if not end_date.tzinfo else end_date.isoformat(),
-                        'items': [{'id': 'primary'}]  # Use primary calendar
-                    }
-                    
-                    try:
-                        freebusy_result = calendar_service.freebusy().query(body=body).execute()
-                        busy_times = freebusy_result['calendars'].get('primary', {}).get('busy', [])
-                        
-                        # Convert busy times to TimeSlot objects
-                        busy_slots = []
-                        for busy_period in busy_times:
-                            start_time = datetime.fromisoformat(busy_period['start'].replace('Z', '+00:00'))
-                            end_time = datetime.fromisoformat(busy_period['end'].replace('Z', '+00:00'))
-                            busy_slots.append(TimeSlot(
-                                start_time=start_time,
-                                end_time=end_time,
-                                available=False
-                            ))
-                        
-                        # Calculate free slots
-                        free_slots = self._calculate_free_slots(start_date, end_date, busy_slots)
-                        
-                        availability_responses.append(AvailabilityResponse(
-                            participant_email=email,
-                            free_slots=free_slots,
-                            busy_slots=busy_slots
-                        ))
-                        
-                        logger.info(f"Successfully retrieved availability for authenticated user: {email}")
-                        
-                    except HttpError as e:
-                        logger.error(f"Error getting availability for {email}: {e}")
-                        availability_responses.append(AvailabilityResponse(
-                            participant_email=email,
-                            free_slots=[],
-                            busy_slots=[]
-                        ))
-                else:
-                    # External user - return empty availability
-                    logger.info(f"External user {email} - returning empty availability (not authenticated)")
-                    availability_responses.append(AvailabilityResponse(
-                        participant_email=email,
-                        free_slots=[],
-                        busy_slots=[]
-                    ))
+            # Each participant is a separate freebusy round trip; overlap them
+            responses = self._availability_executor.map(
+                lambda email: self._get_participant_availability(email, start_date, end_date),
+                unique_emails
+            )
+            by_email = dict(zip(unique_emails, responses))
             
-            return availability_responses
+            return [by_email[email] for email in participant_emails]
             
         except HttpError as error:
             logger.error(f'Calendar API error: {error}')
             return []
     
+    def _get_participant_availability(self, email: str, start_date: datetime, 
+                                      end_date: datetime) -> AvailabilityResponse:
+        """Get availability for a single participant"""
+        logger.debug(f"Checking availability for: {email}")
+        
+        # Check if user is authenticated
+        credentials = self._get_valid_credentials(email)
+        if credentials is None:
+            # External user - return empty availability
+            logger.info(f"External user {email} - returning empty availability (not authenticated)")
+            return AvailabilityResponse.model_construct(
+                participant_email=email,
+                free_slots=[],
+                busy_slots=[]
+            )
+        
+        # Get user-specific calendar service (credentials were just validated)
+        calendar_service = self._build_user_service(email, 'calendar', credentials)
+        if not calendar_service:
+            logger.error(f"Failed to get calendar service for {email}")
+            return AvailabilityResponse.model_construct(
+                participant_email=email,
+                free_slots=[],
+                busy_slots=[]
+            )
+        
+        # Get busy times for authenticated user
+        body = {
+            'timeMin': start_date.isoformat() + 'Z' if not start_date.tzinfo else start_date.isoformat(),
+            'timeMax': end_date.isoformat() + 'Z' if not end_date.tzinfo else end_date.isoformat(),
+            'items': [{'id': 'primary'}]  # Use primary calendar
+        }
+        
+        try:
+            freebusy_result = calendar_service.freebusy().query(body=body).execute()
+            busy_times = freebusy_result['calendars'].get('primary', {}).get('busy', [])
+            
+            # Convert busy times to TimeSlot objects
+            busy_slots = []
+            for busy_period in busy_times:
+                start_time = datetime.fromisoformat(busy_period['start'].replace('Z', '+00:00'))
+                end_time = datetime.fromisoformat(busy_period['end'].replace('Z', '+00:00'))
+                busy_slots.append(TimeSlot(
+                    start_time=start_time,
+                    end_time=end_time,
+                    available=False
+                ))
+            
+            # Calculate free slots
+            free_slots = self._calculate_free_slots(start_date, end_date, busy_slots)
+            
+            logger.info(f"Successfully retrieved availability for authenticated user: {email}")
+            
+            return AvailabilityResponse.model_construct(
+                participant_email=email,
+                free_slots=free_slots,
+                busy_slots=busy_slots
+            )
+            
+        except HttpError as e:
+            logger.error(f"Error getting availability for {email}: {e}")
+            return AvailabilityResponse.model_construct(
+                participant_email=email,
+                free_slots=[],
+                busy_slots=[]
+            )
+    
     def _calculate_free_slots(self, start_date: datetime, end_date: datetime, 
                              busy_slots: List[TimeSlot]) -> List[TimeSlot]:
         """Calculate free time slots from busy periods"""
@@ -754,9 +877,6 @@ class GoogleService:
         """
         BYPASS AUTH: Load token directly from Keys directory without authentication checks
         """
-        import json
-        from google.oauth2.credentials import Credentials
-        
         try:
             # Map email to token file
             email_to_file = {
@@ -775,19 +895,25 @@ class GoogleService:
                 logger.error(f"Token file not found: {token_file_path}")
                 return None
             
-            # Load token data
-            with open(token_file_path, 'r') as f:
-                token_data = json.load(f)
-            
-            # Create credentials
-            credentials = Credentials(
-                token=token_data.get('token'),
-                refresh_token=token_data.get('refresh_token'),
-                token_uri=token_data.get('token_uri'),
-                client_id=token_data.get('client_id'),
-                client_secret=token_data.get('client_secret'),
-                scopes=token_data.get('scopes', [])
-            )
+            # Load token data (only when the token file has changed)
+            mtime = os.stat(token_file_path).st_mtime
+            cached = self._direct_credentials.get(user_email)
+            if cached is not None and cached[0] == mtime:
+                credentials = cached[1]
+            else:
+                with open(token_file_path, 'r') as f:
+                    token_data = json.load(f)
+                
+                # Create credentials
+                credentials = Credentials(
+                    token=token_data.get('token'),
+                    refresh_token=token_data.get('refresh_token'),
+                    token_uri=token_data.get('token_uri'),
+                    client_id=token_data.get('client_id'),
+                    client_secret=token_data.get('client_secret'),
+                    scopes=token_data.get('scopes', [])
+                )
+                self._direct_credentials[user_email] = (mtime, credentials)
             
             # Try to refresh if expired
             if credentials.expired and credentials.refresh_token:
@@ -795,8 +921,8 @@ class GoogleService:
                 credentials.refresh(Request())
             
             # Build calendar service
-            calendar_service = build('calendar', 'v3', credentials=credentials)
-            logger.info(f"BYPASS AUTH: Direct calendar service created for {user_email}")
+            calendar_service = self._build_service(user_email, 'calendar', 'v3', credentials, source="direct")
+            logger.info(f"BYPASS AUTH: Direct calendar service ready for {user_email}")
             return calendar_service
             
         except Exception as e:
@@ -8,7 +8,7 @@ running DeepSeek models for AI-powered function calling.
 import json
 import requests
 import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from app.config import config
 from app.core.logging import get_logger
 
@@ -39,6 +39,9 @@ class VLLMService:
         self.temperature = config.VLLM_TEMPERATURE
         self.max_tokens = config.VLLM_MAX_TOKENS
         
+        # (tools list, rendered prompt) for the last tool list seen
+        self._function_prompt: Optional[Tuple[List[Dict[str, Any]], str]] = None
+        
         logger.info(f"Initializing vLLM service with base URL: {self.base_url}")
         logger.debug(f"Model path: {self.model_path}")
         
@@ -111,40 +114,7 @@ class VLLMService:
         """
         
         # Create a system message that instructs the model about available functions
-        function_descriptions = []
-        for tool in tools:
-            func = tool["function"]
-            function_descriptions.append(f"""
-Function: {func["name"]}
-Description: {func["description"]}
-Parameters: {json.dumps(func["parameters"], indent=2)}
-""")
-        
-        function_prompt = f"""
-You are an AI agent with access to the following functions. When you need to call a function, respond with a JSON object in this exact format:
-
-{{
-  "function_calls": [
-    {{
-      "id": "call_123",
-      "function": {{
-        "name": "function_name",
-        "arguments": "{{\"param1\": \"value1\", \"param2\": \"value2\"}}"
-      }}
-    }}
-  ]
-}}
-
-Available functions:
-{chr(10).join(function_descriptions)}
-
-Important: 
-1. Always call the appropriate functions to help with scheduling meetings
-2. Start by calling get_calendar_availability to check participant availability
-3. Then call analyze_optimal_slots to find the best meeting times
-4. Always respond with valid JSON when calling functions
-5. Include reasoning for your choices
-"""
+        function_prompt = self._get_function_prompt(tools)
         
         # Add the function calling instruction to the system message
         enhanced_messages = []
@@ -184,6 +154,61 @@ Important:
         
         return MockResponse(choices=[mock_choice])
     
+    def _get_function_prompt(self, tools: List[Dict[str, Any]]) -> str:
+        """
+        Function calling instructions for a tool list
+        
+        The agent passes the same tool list on every call, so the rendered
+        prompt is reused for as long as the list object is unchanged.
+        
+        Args:
+            tools: Tool definitions in chat completions format
+            
+        Returns:
+            Prompt text describing the tools and the expected call format
+        """
+        cached = self._function_prompt
+        if cached is not None and cached[0] is tools:
+            return cached[1]
+        
+        function_descriptions = []
+        for tool in tools:
+            func = tool["function"]
+            function_descriptions.append(f"""
+Function: {func["name"]}
+Description: {func["description"]}
+Parameters: {json.dumps(func["parameters"], indent=2)}
+""")
+        
+        function_prompt = f"""
+You are an AI agent with access to the following functions. When you need to call a function, respond with a JSON object in this exact format:
+
+{{
+  "function_calls": [
+    {{
+      "id": "call_123",
+      "function": {{
+        "name": "function_name",
+        "arguments": "{{\"param1\": \"value1\", \"param2\": \"value2\"}}"
+      }}
+    }}
+  ]
+}}
+
+Available functions:
+{chr(10).join(function_descriptions)}
+
+Important: 
+1. Always call the appropriate functions to help with scheduling meetings
+2. Start by calling get_calendar_availability to check participant availability
+3. Then call analyze_optimal_slots to find the best meeting times
+4. Always respond with valid JSON when calling functions
+5. Include reasoning for your choices
+"""
+        
+        self._function_prompt = (tools, function_prompt)
+        return function_prompt
+    
     def _extract_function_calls(self, content: str) -> List[Any]:
         """Extract function calls from model response"""
         
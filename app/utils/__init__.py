@@ -9,9 +9,11 @@ from .validators import (
     validate_datetime_range,
     validate_meeting_duration
 )
+from .datetime_utils import parse_request_datetime
 
 __all__ = [
     "validate_email_list",
     "validate_datetime_range", 
-    "validate_meeting_duration"
+    "validate_meeting_duration",
+    "parse_request_datetime"
 ] 
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""
+Datetime utilities
+
+Fast parsing for the fixed-width datetime formats used in API payloads.
+"""
+
+from datetime import datetime
+
+REQUEST_DATETIME_FORMAT = "%d-%m-%YT%H:%M:%S"
+
+
+def parse_request_datetime(value: str) -> datetime:
+    """
+    Parse a request datetime in 'DD-MM-YYYYTHH:MM:SS' format
+    
+    Zero-padded input (the normal case) is sliced into ISO order and handed
+    to the C fromisoformat parser; anything else falls back to strptime so
+    the accepted inputs stay identical.
+    
+    Args:
+        value: Datetime string such as '09-07-2025T12:34:55'
+        
+    Returns:
+        Parsed naive datetime
+        
+    Raises:
+        ValueError: If the value is not a valid datetime in that format
+    """
+    # Separator checks keep fromisoformat from accepting shapes strptime rejects
+    if (len(value) == 19 and value[2] == value[5] == '-' and value[10] == 'T'
+            and value[13] == value[16] == ':'):
+        try:
+            return datetime.fromisoformat(f"{value[6:10]}-{value[3:5]}-{value[0:2]}T{value[11:]}")
+        except ValueError:
+            pass
+    return datetime.strptime(value, REQUEST_DATETIME_FORMAT)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Unit checks for SchedulingAgent, with vLLM and Google replaced by stubs
+"""
+import json
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from cachetools import TTLCache
+
+from app.models import MeetingRequest, Participant
+from app.services import agent_service
+from app.services.agent_service import SchedulingAgent
+
+
+def _slot(start, end, day=21):
+    """Free slot dict on a July 2025 day, times given as 'HH:MM' in +05:30"""
+    return {
+        "start_time": f"2025-07-{day:02d}T{start}:00+05:30",
+        "end_time": f"2025-07-{day:02d}T{end}:00+05:30",
+        "duration_minutes": 0,
+    }
+
+
+def _baseline_analyze(agent, availability_data, meeting_requirements, max_suggestions=3):
+    """The original nested-loop _analyze_optimal_slots, kept as the reference"""
+    if not availability_data:
+        return {"suggested_slots": [], "reasoning": "No availability data provided"}
+
+    common_slots = availability_data[0]["free_slots"]
+    for participant_data in availability_data[1:]:
+        participant_slots = participant_data["free_slots"]
+        new_common_slots = []
+        for common_slot in common_slots:
+            for participant_slot in participant_slots:
+                overlap_start = max(
+                    datetime.fromisoformat(common_slot["start_time"]),
+                    datetime.fromisoformat(participant_slot["start_time"])
+                )
+                overlap_end = min(
+                    datetime.fromisoformat(common_slot["end_time"]),
+                    datetime.fromisoformat(participant_slot["end_time"])
+                )
+                if overlap_start < overlap_end:
+                    overlap_duration = (overlap_end - overlap_start).total_seconds() / 60
+                    required_duration = meeting_requirements.get("duration_minutes", 30)
+                    if overlap_duration >= required_duration:
+                        new_common_slots.append({
+                            "start_time": overlap_start.isoformat(),
+                            "end_time": (overlap_start + timedelta(minutes=required_duration)).isoformat(),
+                            "duration_minutes": required_duration
+                        })
+        common_slots = new_common_slots
+
+    scored_slots = []
+    for slot in common_slots[:max_suggestions * 2]:
+        start_time = datetime.fromisoformat(slot["start_time"])
+        scored_slots.append((slot, agent._score_time_slot(start_time, meeting_requirements)))
+    scored_slots.sort(key=lambda x: x[1], reverse=True)
+    suggested_slots = [slot for slot, score in scored_slots[:max_suggestions]]
+
+    return {
+        "suggested_slots": suggested_slots,
+        "reasoning": f"Found {len(common_slots)} common free slots. Selected top {len(suggested_slots)} based on meeting priority, work hours, and participant preferences.",
+        "total_analyzed": len(common_slots)
+    }
+
+
+SLOT_CASES = {
+    "single participant": [
+        [_slot("09:00", "10:00"), _slot("14:00", "15:00")],
+    ],
+    "sorted two participants": [
+        [_slot("09:00", "12:00"), _slot("13:00", "17:00")],
+        [_slot("10:00", "11:00"), _slot("11:30", "14:30"), _slot("16:00", "18:00")],
+    ],
+    "overlapping slots": [
+        [_slot("09:00", "12:00"), _slot("10:00", "11:30"), _slot("13:00", "17:00")],
+        [_slot("09:30", "16:00"), _slot("10:00", "10:45")],
+    ],
+    "out of order slots": [
+        [_slot("13:00", "17:00"), _slot("09:00", "12:00")],
+        [_slot("15:00", "16:00"), _slot("09:00", "10:30"), _slot("11:00", "14:00")],
+    ],
+    "three participants across days": [
+        [_slot("09:00", "17:00"), _slot("09:00", "17:00", day=22)],
+        [_slot("09:00", "11:00"), _slot("14:00", "16:00"), _slot("10:00", "12:00", day=22)],
+        [_slot("10:00", "15:30"), _slot("09:00", "11:30", day=22)],
+    ],
+    "no common time": [
+        [_slot("09:00", "10:00")],
+        [_slot("10:00", "11:00")],
+    ],
+    "empty participant": [
+        [_slot("09:00", "10:00")],
+        [],
+    ],
+}
+
+
+@pytest.mark.parametrize("participants", SLOT_CASES.values(), ids=SLOT_CASES.keys())
+@pytest.mark.parametrize("duration", [15, 30, 60])
+@pytest.mark.parametrize("priority", ["low", "medium", "urgent"])
+def test_analyze_optimal_slots_matches_nested_loop(participants, duration, priority):
+    """The sweep-based intersection returns exactly what the nested loop did"""
+    agent = object.__new__(SchedulingAgent)
+    availability_data = [
+        {"participant_email": f"user{i}@example.com", "free_slots": slots}
+        for i, slots in enumerate(participants)
+    ]
+    requirements = {"duration_minutes": duration, "priority": priority}
+
+    assert agent._analyze_optimal_slots(availability_data, requirements) == \
+        _baseline_analyze(agent, availability_data, requirements)
+
+
+def _completion(content, tool_calls=()):
+    """Chat completion shaped like VLLMService's responses"""
+    message = SimpleNamespace(content=content, tool_calls=list(tool_calls))
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class _StubVLLM:
+    """vLLM stand-in whose agent always asks for one analyze_optimal_slots call"""
+    model_path = "stub-model"
+
+    def __init__(self):
+        self.calls = 0
+
+    def health_check(self):
+        return True
+
+    def create_chat_completion(self, messages, tools=None, **kwargs):
+        self.calls += 1
+        if not tools:
+            return _completion("Proposed the best slot")
+        arguments = json.dumps({
+            "availability_data": [{"free_slots": [_slot("10:00", "11:00")]}],
+            "meeting_requirements": {"duration_minutes": 30},
+        })
+        tool_call = SimpleNamespace(
+            id="call_1",
+            function=SimpleNamespace(name="analyze_optimal_slots", arguments=arguments)
+        )
+        return _completion("Analyzing", [tool_call])
+
+
+class _StubGoogle:
+    """Google service stand-in that accepts every event and email"""
+
+    def create_calendar_event(self, event):
+        return "event-1"
+
+    def send_email(self, email_message):
+        return True
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    monkeypatch.setattr(agent_service, "VLLMService", _StubVLLM)
+    monkeypatch.setattr(agent_service, "create_google_service", _StubGoogle)
+    monkeypatch.setattr(agent_service, "config", SimpleNamespace(
+        PROPOSAL_MAX_ENTRIES=100,
+        PROPOSAL_TTL_SECONDS=3600,
+        SCHEDULE_CACHE_TTL_SECONDS=300,
+        SCHEDULE_CACHE_MAX_ENTRIES=16,
+    ))
+    scheduling_agent = SchedulingAgent()
+    yield scheduling_agent
+    scheduling_agent.close()
+
+
+def _meeting_request(title="Quarterly Review", organizer="lead@example.com",
+                     participants=("ana@example.com", "bo@example.com")):
+    return MeetingRequest(
+        title=title,
+        description="Go over the numbers",
+        organizer=Participant(name="Lead", email=organizer),
+        participants=[Participant(name=email.split("@")[0], email=email) for email in participants]
+    )
+
+
+def test_duplicate_pending_request_returns_same_proposal(agent):
+    first = agent.schedule_meeting(_meeting_request())
+    second = agent.schedule_meeting(_meeting_request())
+
+    assert first["success"] is True
+    assert second == first
+    assert agent.vllm_service.calls == 2  # one tool turn plus one final answer
+
+
+def test_equivalent_request_is_normalized(agent):
+    first = agent.schedule_meeting(_meeting_request())
+    second = agent.schedule_meeting(_meeting_request(
+        title="  quarterly   REVIEW ",
+        organizer="Lead@Example.com",
+        participants=("BO@example.com", "ana@example.com"),
+    ))
+
+    assert second["proposal_id"] == first["proposal_id"]
+    assert agent.vllm_service.calls == 2
+
+
+def test_different_request_is_scheduled_separately(agent):
+    first = agent.schedule_meeting(_meeting_request())
+    second = agent.schedule_meeting(_meeting_request(title="Budget Review"))
+
+    assert second["proposal_id"] != first["proposal_id"]
+    assert agent.vllm_service.calls == 4
+
+
+def test_confirmed_proposal_is_not_returned(agent):
+    first = agent.schedule_meeting(_meeting_request())
+    assert agent.confirm_meeting(first["proposal_id"], 0)["success"] is True
+
+    second = agent.schedule_meeting(_meeting_request())
+
+    assert second["success"] is True
+    assert second["proposal_id"] != first["proposal_id"]
+    assert agent.vllm_service.calls == 4
+
+
+def test_expired_proposal_falls_through_to_fresh_schedule(agent):
+    now = [0.0]
+    agent.proposals = TTLCache(maxsize=100, ttl=60, timer=lambda: now[0])
+    first = agent.schedule_meeting(_meeting_request())
+
+    now[0] = 61.0
+    second = agent.schedule_meeting(_meeting_request())
+
+    assert second["success"] is True
+    assert second["proposal_id"] != first["proposal_id"]
+    assert agent.get_proposal(first["proposal_id"]) is None
+    assert agent.vllm_service.calls == 4
+
+
+def test_batch_results_follow_request_order(agent, monkeypatch):
+    """Later requests finish first, yet results line up with the requests"""
+    titles = [f"Planning {i}" for i in range(4)]
+    create_chat_completion = agent.vllm_service.create_chat_completion
+
+    def slow_first_turn(messages, tools=None, **kwargs):
+        if tools:
+            index = next(i for i, title in enumerate(titles) if title in messages[1]["content"])
+            time.sleep((len(titles) - index) * 0.05)
+        return create_chat_completion(messages, tools=tools, **kwargs)
+
+    monkeypatch.setattr(agent.vllm_service, "create_chat_completion", slow_first_turn)
+
+    results = agent.schedule_meetings_batch([_meeting_request(title=title) for title in titles])
+
+    assert all(result["success"] for result in results)
+    assert [agent.get_proposal(result["proposal_id"]).meeting_request.title for result in results] == titles
+
+
+def test_batch_rejects_mismatched_preferences(agent):
+    with pytest.raises(ValueError):
+        agent.schedule_meetings_batch([_meeting_request()], [None, None])
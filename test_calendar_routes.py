@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+In-process checks for conditional GETs on the calendar endpoints
+"""
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_agent_service, get_google_service
+from app.main import app
+
+
+class _FakeGoogleService:
+    """Google service stand-in with a mutable list of authenticated users"""
+
+    def __init__(self):
+        self.users = ["userone.amd@gmail.com"]
+        self.events_result = {"etag": '"p1"', "items": []}
+
+    def get_authenticated_users(self):
+        return list(self.users)
+
+    def get_authenticated_email(self):
+        return self.users[0]
+
+    def get_direct_calendar_service(self, user_email):
+        events_result = self.events_result
+        request = SimpleNamespace(execute=lambda: events_result)
+        return SimpleNamespace(events=lambda: SimpleNamespace(list=lambda **kwargs: request))
+
+
+def _event(summary):
+    return {
+        "summary": summary,
+        "start": {"dateTime": "2025-07-17T10:00:00+05:30"},
+        "end": {"dateTime": "2025-07-17T10:30:00+05:30"},
+    }
+
+
+@pytest.fixture
+def google_service():
+    service = _FakeGoogleService()
+    app.dependency_overrides[get_google_service] = lambda: service
+    app.dependency_overrides[get_agent_service] = lambda: SimpleNamespace(google_service=service)
+    yield service
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def _assert_not_modified(response, etag):
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert response.headers["Cache-Control"] == "private, max-age=30"
+
+
+def test_authenticated_users_conditional_get(client, google_service):
+    first = client.get("/calendar/authenticated-users")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith('"')
+
+    _assert_not_modified(client.get("/calendar/authenticated-users", headers={"If-None-Match": etag}), etag)
+
+    google_service.users.append("usertwo.amd@gmail.com")
+    changed = client.get("/calendar/authenticated-users", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()["total_count"] == 2
+
+
+@pytest.mark.parametrize("if_none_match", [
+    "{etag}",
+    "W/{etag}",
+    '"other", {etag}',
+    "*",
+], ids=["exact", "weak prefix", "list", "wildcard"])
+def test_authenticated_users_if_none_match_forms(client, google_service, if_none_match):
+    etag = client.get("/calendar/authenticated-users").headers["ETag"]
+
+    response = client.get(
+        "/calendar/authenticated-users",
+        headers={"If-None-Match": if_none_match.format(etag=etag)}
+    )
+
+    _assert_not_modified(response, etag)
+
+
+def test_authenticated_users_other_etag_is_not_matched(client, google_service):
+    response = client.get("/calendar/authenticated-users", headers={"If-None-Match": '"other"'})
+
+    assert response.status_code == 200
+
+
+def test_upcoming_conditional_get(client, google_service):
+    google_service.events_result = {"etag": '"p1"', "items": [_event("Standup")]}
+
+    first = client.get("/calendar/upcoming")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert [meeting["summary"] for meeting in first.json()["meetings"]] == ["Standup"]
+
+    _assert_not_modified(client.get("/calendar/upcoming", headers={"If-None-Match": etag}), etag)
+
+    google_service.events_result = {"etag": '"p2"', "items": [_event("Standup"), _event("Review")]}
+    changed = client.get("/calendar/upcoming", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()["total_count"] == 2
+
+
+def test_upcoming_malformed_event_returns_error(client, google_service):
+    """A bad event fails the request with a 500 instead of truncating a streamed 200"""
+    google_service.events_result = {"etag": '"p1"', "items": [_event("Standup"), {"summary": "No times"}]}
+
+    response = client.get("/calendar/upcoming")
+
+    assert response.status_code == 500
+    assert "Failed to fetch upcoming meetings" in response.json()["detail"]
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Check that GoogleService reuses built API clients between lookups
+"""
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from google.oauth2.credentials import Credentials
+
+from app.services import google_service
+from app.services.google_service import GoogleService
+
+USER_EMAIL = "userone.amd@gmail.com"
+
+
+class _FakeCalendar:
+    """Calendar client stand-in whose freebusy queries report no busy periods"""
+
+    def freebusy(self):
+        return self
+
+    def query(self, body):
+        return self
+
+    def execute(self):
+        return {"calendars": {"primary": {"busy": []}}}
+
+
+def _count_builds(monkeypatch):
+    """Replace googleapiclient's build() and return the list of calls made to it"""
+    builds = []
+
+    def fake_build(service_name, version, **kwargs):
+        builds.append((service_name, version))
+        return _FakeCalendar()
+
+    monkeypatch.setattr(google_service, "build", fake_build)
+    return builds
+
+
+def _make_service(monkeypatch):
+    """GoogleService with one loaded user token and no Keys directory scan"""
+    monkeypatch.setattr(GoogleService, "_load_tokens_directly", lambda self: None)
+    service = GoogleService()
+    service.user_credentials[USER_EMAIL] = Credentials(token="token")
+    return service
+
+
+def test_availability_reuses_built_client(monkeypatch):
+    """Two availability lookups for the same user build the Calendar client once"""
+    builds = _count_builds(monkeypatch)
+    service = _make_service(monkeypatch)
+
+    start = datetime(2025, 7, 21, 9, 0)
+    end = start + timedelta(hours=8)
+    try:
+        for _ in range(2):
+            responses = service.get_calendar_availability([USER_EMAIL], start, end)
+            assert len(responses[0].free_slots) == 1
+    finally:
+        service.close()
+
+    assert builds == [("calendar", "v3")]
+
+
+def test_user_and_direct_clients_do_not_evict_each_other(monkeypatch, tmp_path):
+    """Alternating the loaded-token and direct-token paths builds one client per path"""
+    builds = _count_builds(monkeypatch)
+    (tmp_path / "userone.amd.token").write_text(json.dumps({"token": "token"}))
+    monkeypatch.setattr(google_service, "config", SimpleNamespace(KEYS_DIRECTORY=str(tmp_path)))
+    service = _make_service(monkeypatch)
+
+    try:
+        for _ in range(3):
+            assert service.get_user_service(USER_EMAIL) is not None
+            assert service.get_direct_calendar_service(USER_EMAIL) is not None
+    finally:
+        service.close()
+
+    assert builds == [("calendar", "v3"), ("calendar", "v3")]
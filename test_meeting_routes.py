@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+In-process checks for the /meetings/schedule-legacy/batch endpoint
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_agent_service
+from app.main import app
+
+
+class _FakeAgent:
+    """Agent stand-in that proposes one slot per request and fails titles starting with 'Fail'"""
+
+    def __init__(self):
+        self.batches = []
+
+    def schedule_meetings_batch(self, meeting_requests, user_preferences=None):
+        self.batches.append((meeting_requests, user_preferences))
+        results = []
+        for i, meeting_request in enumerate(meeting_requests):
+            if meeting_request.title.startswith("Fail"):
+                results.append({"success": False, "error": f"No slot for {meeting_request.title}"})
+                continue
+            results.append({
+                "success": True,
+                "proposal_id": f"proposal-{i}",
+                "suggested_slots": [{
+                    "index": 0,
+                    "start_time": "2025-07-21T10:00:00+05:30",
+                    "end_time": "2025-07-21T10:30:00+05:30",
+                    "formatted": "Monday, July 21 at 10:00 AM - 10:30 AM",
+                }],
+                "reasoning": meeting_request.title,
+                "agent_message": "Proposed",
+            })
+        return results
+
+
+def _legacy_request(title, **overrides):
+    request = {
+        "title": title,
+        "organizer": {"name": "Lead", "email": "lead@example.com"},
+        "participants": [{"name": "Ana", "email": "ana@example.com"}],
+    }
+    request.update(overrides)
+    return request
+
+
+@pytest.fixture
+def agent():
+    fake_agent = _FakeAgent()
+    app.dependency_overrides[get_agent_service] = lambda: fake_agent
+    yield fake_agent
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def test_batch_responses_follow_request_order(client, agent):
+    titles = ["Standup", "Fail review", "Retro"]
+
+    response = client.post("/meetings/schedule-legacy/batch",
+                           json=[_legacy_request(title) for title in titles])
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["success"] for item in body] == [True, False, True]
+    assert [item["reasoning"] for item in body] == ["Standup", None, "Retro"]
+    assert body[1]["error"] == "No slot for Fail review"
+    meeting_requests, _ = agent.batches[0]
+    assert [meeting_request.title for meeting_request in meeting_requests] == titles
+
+
+def test_batch_passes_preferences_per_request(client, agent):
+    requests = [
+        _legacy_request("Standup", user_preferences={"timezone": "Asia/Kolkata"}),
+        _legacy_request("Retro"),
+    ]
+
+    client.post("/meetings/schedule-legacy/batch", json=requests)
+
+    _, user_preferences = agent.batches[0]
+    assert user_preferences[0].timezone == "Asia/Kolkata"
+    assert user_preferences[1] is None
+
+
+def test_empty_batch(client, agent):
+    response = client.post("/meetings/schedule-legacy/batch", json=[])
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_batch_rejects_invalid_organizer(client, agent):
+    requests = [_legacy_request("Standup"), _legacy_request("Retro", organizer={"name": "Lead"})]
+
+    response = client.post("/meetings/schedule-legacy/batch", json=requests)
+
+    assert response.status_code == 400
+    assert agent.batches == []
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Check the /receive keyword scans against the original if/elif keyword checks
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.api.routes.receive import (
+    determine_meeting_date_from_content,
+    determine_optimal_meeting_time,
+    extract_subject_from_content,
+)
+
+REQUEST_DATETIME = "02-07-2025T12:34:55"
+
+
+def _baseline_meeting_date(email_content):
+    """Original day lookup: the first keyword in this order wins"""
+    content_lower = email_content.lower()
+    if 'next thursday' in content_lower:
+        meeting_date = datetime(2025, 7, 17)
+    elif 'monday' in content_lower:
+        meeting_date = datetime(2025, 7, 14)
+    elif 'tuesday' in content_lower:
+        meeting_date = datetime(2025, 7, 15)
+    elif 'wednesday' in content_lower:
+        meeting_date = datetime(2025, 7, 16)
+    elif 'thursday' in content_lower:
+        meeting_date = datetime(2025, 7, 17)
+    elif 'friday' in content_lower:
+        meeting_date = datetime(2025, 7, 18)
+    elif 'today' in content_lower:
+        meeting_date = datetime(2025, 7, 13)
+    elif 'tomorrow' in content_lower:
+        meeting_date = datetime(2025, 7, 14)
+    else:
+        meeting_date = datetime.strptime(REQUEST_DATETIME, "%d-%m-%YT%H:%M:%S") + timedelta(days=1)
+        while meeting_date.weekday() >= 5:
+            meeting_date += timedelta(days=1)
+    return (
+        meeting_date.strftime("%Y-%m-%dT00:00:00+05:30"),
+        meeting_date.strftime("%Y-%m-%dT23:59:59+05:30")
+    )
+
+
+def _baseline_meeting_time(email_content):
+    """Original time lookup: specific times beat morning/afternoon"""
+    content_lower = email_content.lower()
+    if '9:00 am' in content_lower or '9:00' in email_content:
+        return 9, 0
+    elif '11:00' in email_content or '11 am' in content_lower or '11:00 a.m' in content_lower:
+        return 11, 0
+    elif '10:00' in email_content or '10 am' in content_lower or '10:00 a.m' in content_lower:
+        return 10, 0
+    elif 'morning' in content_lower:
+        return 10, 30
+    elif 'afternoon' in content_lower:
+        return 14, 0
+    return 10, 30
+
+
+def _baseline_subject(email_content):
+    """Original subject lookup: the first rule whose keywords are all present wins"""
+    content_lower = email_content.lower()
+    if 'quick feedback' in content_lower and 'client' in content_lower:
+        return "Client Feedback Discussion"
+    elif 'goals' in content_lower:
+        return "Team Goals Discussion"
+    elif 'projects' in content_lower and 'on-going' in content_lower:
+        return "Ongoing Projects Review"
+    elif 'final feedback' in content_lower and 'next steps' in content_lower:
+        return "Final Feedback Review and Planning"
+    elif 'discuss' in content_lower:
+        return "Team Discussion"
+    return "Team Meeting"
+
+
+DAY_EMAILS = [
+    "Let's meet next Thursday and discuss about our Goals.",
+    "Can we do next tuesday or thursday?",
+    "Thursday works, otherwise next Thursday.",
+    "Friday or Monday, whichever suits.",
+    "Wednesday, or maybe tomorrow, or today.",
+    "TOMORROW please, not Friday",
+    "tomorrowednesday",
+    "todaytomorrow",
+    "No day mentioned at all.",
+]
+
+TIME_EMAILS = [
+    "Let's meet Monday at 9:00 AM to discuss.",
+    "morning works, afternoon is fine too",
+    "Afternoon or morning?",
+    "Either 10 am or 11 am",
+    "10:00 a.m. please, or 9:00",
+    "11:00 a.m in the morning",
+    "19:00 sharp",
+    "No time given.",
+]
+
+SUBJECT_EMAILS = [
+    "Hi Team. Let's meet next Thursday and discuss about our Goals.",
+    "quick feedback from the client, let's discuss goals",
+    "Client says the quick feedback was late",
+    "Quick feedback only",
+    "Review on-going projects and their goals",
+    "On-going work on Projects; let's discuss",
+    "final feedback and next steps",
+    "Final feedback, then discuss next steps with the client",
+    "Nothing relevant here.",
+]
+
+
+@pytest.mark.parametrize("email_content", DAY_EMAILS)
+def test_meeting_day_matches_baseline(email_content):
+    assert determine_meeting_date_from_content(email_content, REQUEST_DATETIME) == \
+        _baseline_meeting_date(email_content)
+
+
+@pytest.mark.parametrize("email_content", TIME_EMAILS)
+def test_meeting_time_matches_baseline(email_content):
+    hour, minute = _baseline_meeting_time(email_content)
+    start_time, _ = determine_optimal_meeting_time(email_content, 30, "2025-07-17T00:00:00+05:30")
+    assert start_time == f"2025-07-17T{hour:02d}:{minute:02d}:00+05:30"
+
+
+@pytest.mark.parametrize("email_content", SUBJECT_EMAILS)
+def test_subject_matches_baseline(email_content):
+    assert extract_subject_from_content(email_content) == _baseline_subject(email_content)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+In-process checks for the /receive and /receive/batch endpoints
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+INPUT_REQUEST = {
+    "Request_id": "6118b54f-907b-4451-8d48-dd13d76033a5",
+    "Datetime": "02-07-2025T12:34:55",
+    "Location": "IIT Mumbai",
+    "From": "teamadmin.amd@gmail.com",
+    "Attendees": [
+        {"email": "userone.amd@gmail.com"},
+        {"email": "usertwo.amd@gmail.com"}
+    ],
+    "EmailContent": "Hi Team. Let's meet next Thursday and discuss about our Goals."
+}
+
+PROCESSED_REQUEST = {
+    "Request_id": "6118b54f-907b-4451-8d48-dd13d76033b5",
+    "Datetime": "02-07-2025T12:34:55",
+    "Location": "IIT Mumbai",
+    "From": "teamadmin.amd@gmail.com",
+    "Attendees": [
+        {"email": "userone.amd@gmail.com"},
+        {"email": "usertwo.amd@gmail.com"}
+    ],
+    "EmailContent": "Hi Team. We've just received quick feedback...",
+    "Start": "2025-07-14T09:00:00+05:30",
+    "End": "2025-07-14T09:30:00+05:30",
+    "Duration_mins": "30"
+}
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def test_batch_matches_single_receive(client):
+    """Each batch item comes back exactly as /receive returns it, in request order"""
+    batch = [INPUT_REQUEST, PROCESSED_REQUEST, INPUT_REQUEST]
+
+    response = client.post("/receive/batch", json=batch)
+
+    assert response.status_code == 200
+    singles = [client.post("/receive", json=item).json() for item in batch]
+    assert response.json() == singles
+
+
+def test_empty_batch(client):
+    response = client.post("/receive/batch", json=[])
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+@pytest.mark.parametrize("body", [
+    b"[{",
+    b"{}",
+    b'"not a list"',
+], ids=["malformed json", "object body", "string body"])
+def test_batch_rejects_invalid_body(client, body):
+    response = client.post("/receive/batch", content=body,
+                           headers={"Content-Type": "application/json"})
+
+    assert response.status_code == 422
+
+
+def test_batch_rejects_any_invalid_item(client):
+    """One bad item fails the whole batch with the item's index in the error location"""
+    bad_item = {key: value for key, value in PROCESSED_REQUEST.items() if key != "EmailContent"}
+
+    response = client.post("/receive/batch", json=[INPUT_REQUEST, bad_item])
+
+    assert response.status_code == 422
+    assert any(error["loc"][0] == 1 for error in response.json()["detail"])